@@ -10,7 +10,7 @@ import numpy as np
 import pandas as pd
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -21,6 +21,9 @@ sys.path.insert(0, str(cli_path))
 
 from nao_core.config import NaoConfig, NaoConfigError
 from nao_core.context import get_context_provider
+from nao_core.context.refresh import RefreshCoordinator
+from nao_core.context.webhook import Debouncer, parse_push_event, verify_signature
+from nao_core.context.search import ContextSearchIndex, update_search_index
 
 port = int(os.environ.get("PORT", 8005))
 
@@ -43,6 +46,8 @@ async def lifespan(app: FastAPI):
 
         try:
             trigger = CronTrigger.from_crontab(refresh_schedule)
+            # Spread the fetches of replicas sharing the same schedule
+            trigger.jitter = int(os.environ.get("NAO_REFRESH_JITTER_SECONDS", 30))
             scheduler.add_job(
                 _refresh_context_task,
                 trigger,
@@ -61,11 +66,22 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown(wait=False)
 
 
+def _refresh_context() -> bool:
+    """Refresh the context and its search index. Blocking, run in a worker thread."""
+    provider = get_context_provider()
+    updated = provider.refresh()
+    if updated:
+        update_search_index(provider.target_path, provider.last_changed_paths)
+    return updated
+
+
+refresher = RefreshCoordinator(_refresh_context)
+
+
 async def _refresh_context_task():
     """Background task for scheduled context refresh."""
     try:
-        provider = get_context_provider()
-        updated = provider.refresh()
+        updated = await refresher.run()
         if updated:
             print(f"[Scheduler] Context refreshed at {datetime.now().isoformat()}")
         else:
@@ -76,6 +92,13 @@ async def _refresh_context_task():
         print(f"[Scheduler] Failed to refresh context: {e}")
 
 
+# Pushes arriving in a burst are collapsed into one refresh
+webhook_debouncer = Debouncer(
+    _refresh_context_task,
+    delay=float(os.environ.get("NAO_WEBHOOK_DEBOUNCE_SECONDS", 10)),
+)
+
+
 app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
@@ -109,6 +132,39 @@ class RefreshResponse(BaseModel):
     message: str
 
 
+class WebhookResponse(BaseModel):
+    status: str
+    message: str
+
+
+class RefreshStatusResponse(BaseModel):
+    running: bool
+    last_started_at: datetime | None
+    last_finished_at: datetime | None
+    last_duration_seconds: float | None
+    last_outcome: str | None
+    last_error: str | None
+    runs: int
+    coalesced: int
+
+
+class SearchRequest(BaseModel):
+    query: str
+    nao_project_folder: str
+    limit: int = 20
+    path_prefix: str | None = None
+
+
+class SearchResult(BaseModel):
+    path: str
+    snippet: str
+    score: float
+
+
+class SearchResponse(BaseModel):
+    results: list[SearchResult]
+
+
 class HealthResponse(BaseModel):
     status: str
     context_source: str
@@ -192,10 +248,12 @@ async def refresh_context():
     - CI/CD pipelines after pushing new context
     - Webhooks when data schemas change
     - Manual triggers for immediate updates
+
+    The refresh runs in a worker thread. Calls made while a refresh is running
+    are coalesced into a single follow-up refresh.
     """
     try:
-        provider = get_context_provider()
-        updated = provider.refresh()
+        updated = await refresher.run()
 
         if updated:
             return RefreshResponse(
@@ -216,6 +274,95 @@ async def refresh_context():
         )
 
 
+@app.post("/api/webhook", response_model=WebhookResponse)
+async def context_webhook(request: Request):
+    """Schedule a context refresh from a GitHub/GitLab push webhook.
+
+    Requests must be signed with NAO_WEBHOOK_SECRET (GitHub's
+    X-Hub-Signature-256, or GitLab's X-Gitlab-Token). Only pushes to the
+    context branch trigger a refresh, and bursts of pushes are debounced into
+    a single one. The refresh itself only re-indexes the paths that changed.
+    """
+    secret = os.environ.get("NAO_WEBHOOK_SECRET")
+    if not secret:
+        raise HTTPException(status_code=404, detail="Webhook is not configured")
+
+    body = await request.body()
+    if not verify_signature(secret, body, request.headers):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    try:
+        event = parse_push_event(await request.json())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid webhook payload")
+
+    branch = os.environ.get("NAO_CONTEXT_GIT_BRANCH", "main")
+    if event is None or event.branch != branch:
+        return WebhookResponse(
+            status="ignored",
+            message=f"Not a push to branch '{branch}'",
+        )
+
+    webhook_debouncer.trigger()
+    return WebhookResponse(
+        status="scheduled",
+        message=f"Refresh scheduled ({len(event.paths)} paths pushed)",
+    )
+
+
+@app.get("/api/refresh/status", response_model=RefreshStatusResponse)
+async def refresh_status():
+    """Report whether a refresh is running and how the last one went."""
+    status = refresher.status
+
+    def to_datetime(timestamp: float | None) -> datetime | None:
+        return datetime.fromtimestamp(timestamp) if timestamp is not None else None
+
+    return RefreshStatusResponse(
+        running=status.running,
+        last_started_at=to_datetime(status.last_started_at),
+        last_finished_at=to_datetime(status.last_finished_at),
+        last_duration_seconds=status.last_duration_seconds,
+        last_outcome=status.last_outcome,
+        last_error=status.last_error,
+        runs=status.runs,
+        coalesced=status.coalesced,
+    )
+
+
+@app.post("/search", response_model=SearchResponse)
+def search(request: SearchRequest):
+    """Full-text search over the synced context of a project.
+
+    Queries the index built by `nao sync` under `.nao/index/`. The index is
+    created on first use when the context was synced elsewhere. Declared as a
+    plain function so FastAPI runs the blocking SQLite work in its threadpool.
+    """
+    project_path = Path(request.nao_project_folder)
+    if not project_path.is_dir():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Project folder not found: {request.nao_project_folder}",
+        )
+
+    try:
+        with ContextSearchIndex(project_path) as index:
+            if not index.is_built():
+                index.update()
+            hits = index.search(
+                request.query, limit=request.limit, path_prefix=request.path_prefix
+            )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return SearchResponse(
+        results=[
+            SearchResult(path=hit.path, snippet=hit.snippet, score=hit.score)
+            for hit in hits
+        ]
+    )
+
+
 @app.post("/execute_sql", response_model=ExecuteSQLResponse)
 async def execute_sql(request: ExecuteSQLRequest):
     try:
@@ -1,3 +1,6 @@
+import hashlib
+import hmac
+import json
 import tempfile
 from pathlib import Path
 
@@ -5,6 +8,7 @@ import pytest
 import yaml
 from fastapi.testclient import TestClient
 
+import main
 from main import app
 
 
@@ -57,6 +61,63 @@ def test_execute_sql_simple_duckdb(duckdb_project_folder):
     )
 
 
+def test_search_returns_matching_context_files(duckdb_project_folder):
+    """Test search endpoint builds the index on first use and queries it."""
+    table_dir = Path(duckdb_project_folder) / "databases" / "table=orders"
+    table_dir.mkdir(parents=True)
+    (table_dir / "columns.md").write_text("# orders\n\n- customer_id (int64)\n")
+    (Path(duckdb_project_folder) / "RULES.md").write_text("Revenue is net of refunds.\n")
+    client = TestClient(app)
+
+    response = client.post(
+        "/search",
+        json={"query": "customer_id", "nao_project_folder": duckdb_project_folder},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["path"] for r in results] == ["databases/table=orders/columns.md"]
+
+
+def test_refresh_reports_status(duckdb_project_folder, monkeypatch):
+    """Test refresh endpoint runs the refresh and records its outcome."""
+    monkeypatch.setenv("NAO_CONTEXT_SOURCE", "local")
+    monkeypatch.setenv("NAO_DEFAULT_PROJECT_PATH", duckdb_project_folder)
+    client = TestClient(app)
+
+    response = client.post("/api/refresh")
+
+    assert response.status_code == 200
+    assert response.json()["updated"] is False
+
+    status = client.get("/api/refresh/status").json()
+    assert status["running"] is False
+    assert status["last_outcome"] == "unchanged"
+    assert status["last_duration_seconds"] is not None
+
+
+def test_webhook_requires_valid_signature(monkeypatch):
+    """Test webhook endpoint rejects unsigned pushes and debounces signed ones."""
+    monkeypatch.setenv("NAO_WEBHOOK_SECRET", "s3cret")
+    triggered = []
+    monkeypatch.setattr(main.webhook_debouncer, "trigger", lambda: triggered.append(1))
+    client = TestClient(app)
+    body = json.dumps({"ref": "refs/heads/main", "commits": []}).encode()
+    digest = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+
+    unsigned = client.post("/api/webhook", content=body)
+    signed = client.post(
+        "/api/webhook",
+        content=body,
+        headers={"X-Hub-Signature-256": f"sha256={digest}"},
+    )
+
+    assert unsigned.status_code == 401
+    assert signed.status_code == 200
+    assert signed.json()["status"] == "scheduled"
+    assert triggered == [1]
+
+
 def test_execute_sql_with_cte_duckdb(duckdb_project_folder):
     """Test execute_sql endpoint with a DuckDB in-memory database."""
     client = TestClient(app)
@@ -0,0 +1,75 @@
+"""Best-effort background work (update check, telemetry) that never delays the CLI.
+
+Network calls run in daemon threads, which the interpreter does not wait for
+at exit, and anything waited on at exit is bounded by a deadline. When a
+network probe fails the machine is considered offline for a while, so
+air-gapped environments don't pay a timeout on every invocation.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+OFFLINE_FILE = Path.home() / ".nao" / "offline.json"
+OFFLINE_TTL = 6 * 60 * 60
+
+
+def run_in_background(fn: Callable[[], object], name: str) -> threading.Thread:
+    """Run a function in a daemon thread, swallowing its errors."""
+
+    def target() -> None:
+        try:
+            fn()
+        except Exception:
+            pass  # background work should never break the CLI
+
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+def run_with_deadline(fn: Callable[[], object], deadline: float, name: str) -> bool:
+    """Run a function in a daemon thread and wait for it at most `deadline` seconds.
+
+    Returns:
+        True if the function finished in time.
+    """
+    thread = run_in_background(fn, name)
+    thread.join(deadline)
+    return not thread.is_alive()
+
+
+def is_offline() -> bool:
+    """Check whether network calls should be skipped.
+
+    True when NAO_OFFLINE is set, or when a network probe failed less than
+    OFFLINE_TTL seconds ago.
+    """
+    if os.environ.get("NAO_OFFLINE", "").lower() in ("1", "true", "yes"):
+        return True
+    try:
+        data = json.loads(OFFLINE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    return time.time() - data.get("failed_at", 0) < OFFLINE_TTL
+
+
+def mark_offline() -> None:
+    """Record that a network probe failed."""
+    write_json_atomic(OFFLINE_FILE, {"failed_at": time.time()})
+
+
+def mark_online() -> None:
+    """Forget a previous failed probe."""
+    OFFLINE_FILE.unlink(missing_ok=True)
+
+
+def write_json_atomic(path: Path, data: dict) -> None:
+    """Write `data` as JSON through a temporary file, as background threads may be killed at interpreter exit."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data))
+    os.replace(tmp_path, path)
@@ -1,8 +1,20 @@
-from nao_core.commands.chat import chat
-from nao_core.commands.debug import debug
-from nao_core.commands.init import init
-from nao_core.commands.sync import sync
-from nao_core.commands.test import test
-from nao_core.commands.upgrade import upgrade
-
-__all__ = ["chat", "debug", "init", "sync", "test", "upgrade"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nao_core.commands.bench import bench
+    from nao_core.commands.chat import chat
+    from nao_core.commands.debug import debug
+    from nao_core.commands.init import init
+    from nao_core.commands.sync import sync
+    from nao_core.commands.test import test
+    from nao_core.commands.upgrade import upgrade
+
+__all__ = ["bench", "chat", "debug", "init", "sync", "test", "upgrade"]
+
+
+def __getattr__(name: str):
+    # Commands are imported on first access, importing one doesn't load the others' dependencies
+    if name in __all__:
+        return getattr(importlib.import_module(f"nao_core.commands.{name}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
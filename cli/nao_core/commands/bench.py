@@ -0,0 +1,351 @@
+"""Benchmark command measuring warehouse latency and throughput for nao's access patterns."""
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated, Any
+
+from cyclopts import Parameter
+from rich.console import Console
+from rich.table import Table
+
+from nao_core.config import NaoConfig
+from nao_core.config.databases import DatabaseConfig
+from nao_core.tracking import track_command
+
+console = Console()
+
+BENCHMARKS_DIR = Path(".nao") / "benchmarks"
+DEFAULT_CONCURRENCY = [1, 4, 8]
+
+# DatabaseContext calls made by each default accessor template during sync
+ACCESSOR_CALLS: dict[str, list[tuple[str, dict[str, Any]]]] = {
+    "columns": [
+        ("columns", {}),
+        ("column_count", {}),
+        ("row_count", {}),
+        ("description", {}),
+        ("partition_columns", {}),
+        ("preview", {"limit": 10}),
+    ],
+    "description": [("description", {}), ("row_count", {}), ("column_count", {})],
+    "preview": [("preview", {})],
+}
+
+
+def percentile(samples: list[float], q: float) -> float | None:
+    """Percentile of the samples, interpolated between the closest ranks."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class Measurement:
+    """Latency samples of one benchmarked operation, in seconds.
+
+    `wall_seconds` is the elapsed time of the whole run, from which the
+    throughput of concurrent runs is computed.
+    """
+
+    operation: str
+    concurrency: int = 1
+    samples: list[float] = field(default_factory=list)
+    errors: int = 0
+    last_error: str | None = None
+    wall_seconds: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        """Call `fn`, recording its duration, or the error it raised. Safe to call from several threads."""
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self.last_error = str(e)
+            return None
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.samples.append(elapsed)
+        return result
+
+    @property
+    def p50(self) -> float | None:
+        return percentile(self.samples, 50)
+
+    @property
+    def p95(self) -> float | None:
+        return percentile(self.samples, 95)
+
+    @property
+    def throughput(self) -> float | None:
+        """Successful operations per second over the whole run."""
+        if not self.wall_seconds:
+            return None
+        return len(self.samples) / self.wall_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "concurrency": self.concurrency,
+            "count": len(self.samples),
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "p50": self.p50,
+            "p95": self.p95,
+            "min": min(self.samples, default=None),
+            "max": max(self.samples, default=None),
+            "throughput": self.throughput,
+            "samples": [round(s, 6) for s in self.samples],
+        }
+
+
+@dataclass
+class DatabaseBenchmark:
+    """Measurements of one configured database."""
+
+    database: str
+    type: str
+    measurements: list[Measurement] = field(default_factory=list)
+    tables: list[str] = field(default_factory=list)
+    """Tables the accessors and the preview query were benchmarked on"""
+    error: str | None = None
+
+    def measure(self, operation: str, concurrency: int = 1) -> Measurement:
+        measurement = Measurement(operation, concurrency)
+        self.measurements.append(measurement)
+        return measurement
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "database": self.database,
+            "type": self.type,
+            "tables": self.tables,
+            "error": self.error,
+            "measurements": [m.to_dict() for m in self.measurements],
+        }
+
+
+def list_tables(db_config: DatabaseConfig, conn) -> dict[str, list[str]]:
+    """List the tables to sync the way `nao sync` does, grouped by schema."""
+    schemas = [s for s in db_config.get_schemas(conn) if db_config.schema_matches(s)]
+    tables = db_config.list_all_tables(conn, schemas)
+    if tables is None:
+        tables = {schema: conn.list_tables(database=schema) for schema in schemas}
+    return {schema: [t for t in names if db_config.matches_pattern(schema, t)] for schema, names in tables.items()}
+
+
+def probe_queries(db_config: DatabaseConfig, conn, sample: tuple[str, str] | None, extra: list[str]) -> dict[str, str]:
+    """Queries whose round-trip is measured: a ping, a table preview and user queries."""
+    queries = {"ping": db_config.PING_QUERY}
+    if sample is not None:
+        schema, table = sample
+        try:
+            # Compiled by ibis, so quoting follows the warehouse's dialect
+            queries["preview"] = str(conn.compile(conn.table(table, database=schema).limit(10)))
+        except Exception:
+            pass
+    for i, sql in enumerate(extra, start=1):
+        queries[f"custom-{i}"] = sql
+    return queries
+
+
+def benchmark_database(
+    db_config: DatabaseConfig,
+    iterations: int = 5,
+    concurrency: list[int] | None = None,
+    queries: list[str] | None = None,
+    sample_tables: int = 3,
+) -> DatabaseBenchmark:
+    """Benchmark connect, table listing, accessor metadata and query round-trips of a database."""
+    result = DatabaseBenchmark(db_config.name, db_config.type)
+
+    connect = result.measure("connect")
+    for _ in range(iterations):
+        _disconnect(connect.run(db_config.connect))
+    if not connect.samples:
+        result.error = connect.last_error
+        return result
+
+    try:
+        conn = db_config.connect()
+    except Exception as e:
+        result.error = str(e)
+        return result
+    try:
+        listing = result.measure("list_tables")
+        tables: dict[str, list[str]] | None = None
+        for _ in range(iterations):
+            tables = listing.run(lambda: list_tables(db_config, conn)) or tables
+
+        samples = [(schema, table) for schema, names in (tables or {}).items() for table in names][:sample_tables]
+        result.tables = [f"{schema}.{table}" for schema, table in samples]
+        for accessor in db_config.accessors:
+            measurement = result.measure(f"accessor:{accessor.value}")
+            for _ in range(iterations):
+                for schema, table in samples:
+                    measurement.run(lambda: _run_accessor(db_config, conn, schema, table, accessor.value))
+
+        probes = probe_queries(db_config, conn, samples[0] if samples else None, queries or [])
+    finally:
+        _disconnect(conn)
+
+    for level in concurrency or DEFAULT_CONCURRENCY:
+        for name, sql in probes.items():
+            _run_concurrently(db_config, sql, result.measure(f"query:{name}", level), iterations)
+    return result
+
+
+def _run_accessor(db_config: DatabaseConfig, conn, schema: str, table: str, accessor: str) -> None:
+    # A fresh context per run, so nothing fetched by a previous run is reused
+    ctx = db_config.create_context(conn, schema, table)
+    for method, kwargs in ACCESSOR_CALLS.get(accessor, []):
+        getattr(ctx, method)(**kwargs)
+
+
+def _run_concurrently(db_config: DatabaseConfig, sql: str, measurement: Measurement, iterations: int) -> None:
+    """Run `sql` from `measurement.concurrency` workers, each with its own connection."""
+    connections = []
+    try:
+        for _ in range(measurement.concurrency):
+            connections.append(db_config.connect())
+
+        def worker(conn) -> None:
+            for _ in range(iterations):
+                measurement.run(lambda: db_config.execute_sql(sql, conn))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(connections)) as executor:
+            list(executor.map(worker, connections))
+        measurement.wall_seconds = time.perf_counter() - start
+    except Exception as e:
+        measurement.errors += 1
+        measurement.last_error = str(e)
+    finally:
+        for conn in connections:
+            _disconnect(conn)
+
+
+def _disconnect(conn) -> None:
+    if conn is None:
+        return
+    try:
+        conn.disconnect()
+    except Exception:
+        pass
+
+
+def write_report(results: list[DatabaseBenchmark], data: dict[str, Any], path: Path) -> Path:
+    """Write the benchmark results as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({**data, "databases": [r.to_dict() for r in results]}, indent=2))
+    return path
+
+
+def _ms(seconds: float | None) -> str:
+    return f"{seconds * 1000:.1f}" if seconds is not None else "-"
+
+
+def _print_result(result: DatabaseBenchmark) -> None:
+    if result.error:
+        console.print(f"  [bold red]✗[/bold red] [cyan]{result.database}[/cyan]: {result.error}\n")
+        return
+
+    table = Table(show_header=True, header_style="bold", title=f"{result.database} ({result.type})")
+    table.add_column("Operation")
+    table.add_column("Concurrency", justify="right")
+    table.add_column("Samples", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("Throughput (/s)", justify="right")
+    for m in result.measurements:
+        throughput = m.throughput
+        table.add_row(
+            m.operation,
+            str(m.concurrency),
+            str(len(m.samples)),
+            f"[red]{m.errors}[/red]" if m.errors else "0",
+            _ms(m.p50),
+            _ms(m.p95),
+            f"{throughput:.1f}" if throughput is not None else "-",
+        )
+    console.print(table)
+    if result.tables:
+        console.print(f"[dim]Accessors and preview benchmarked on: {', '.join(result.tables)}[/dim]")
+    console.print()
+
+
+@track_command("bench")
+def bench(
+    *,
+    database: Annotated[
+        list[str] | None,
+        Parameter(name=["-d", "--database"], help="Name(s) of the databases to benchmark. Defaults to all."),
+    ] = None,
+    iterations: Annotated[
+        int,
+        Parameter(name=["-n", "--iterations"], help="Number of runs of each operation (per worker for queries)."),
+    ] = 5,
+    concurrency: Annotated[
+        list[int] | None,
+        Parameter(name=["-c", "--concurrency"], help="Concurrency levels of the probe queries (default: 1, 4, 8)."),
+    ] = None,
+    query: Annotated[
+        list[str] | None,
+        Parameter(name=["-q", "--query"], help="Additional SQL probe queries to measure."),
+    ] = None,
+    tables: Annotated[
+        int,
+        Parameter(help="Number of tables the accessors and preview query are benchmarked on."),
+    ] = 3,
+    output: Annotated[
+        Path | None,
+        Parameter(name=["-o", "--output"], help="Path of the JSON report. Defaults to .nao/benchmarks/."),
+    ] = None,
+):
+    """Benchmark the latency and throughput of configured databases.
+
+    For each database, measures connect time, table listing time, the
+    metadata calls of each configured accessor and the round-trip of probe
+    queries at several concurrency levels. Results include p50/p95 latencies
+    and are written as JSON under `.nao/benchmarks/`.
+    """
+    console.print("\n[bold cyan]⏱  nao bench[/bold cyan]\n")
+
+    config = NaoConfig.try_load(exit_on_error=True)
+    assert config is not None  # Help type checker after exit_on_error=True
+
+    databases = [db for db in config.databases if not database or db.name in database]
+    if not databases:
+        console.print("[dim]No databases to benchmark[/dim]")
+        return
+
+    started_at = datetime.now()
+    levels = sorted(set(concurrency or DEFAULT_CONCURRENCY))
+    results = []
+    for db in databases:
+        console.print(f"[bold]Benchmarking[/bold] [cyan]{db.name}[/cyan]...")
+        result = benchmark_database(db, iterations, levels, query, tables)
+        _print_result(result)
+        results.append(result)
+
+    path = output or Path.cwd() / BENCHMARKS_DIR / f"bench-{started_at:%Y%m%d-%H%M%S}.json"
+    data = {
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "iterations": iterations,
+        "concurrency": levels,
+    }
+    write_report(results, data, path)
+    console.print(f"[bold green]✓[/bold green] Benchmark report written to {path}\n")
@@ -1,11 +1,20 @@
-from typing import Tuple
-
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import Annotated, Tuple
+
+from cyclopts import Parameter
 from rich.console import Console
 from rich.table import Table
 
 from nao_core.config import NaoConfig
+from nao_core.config.databases import ConnectionDiagnostics
 from nao_core.tracking import track_command
 
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
 console = Console()
 
 
@@ -45,6 +54,55 @@ def _check_available_models(provider: str, api_key: str) -> Tuple[bool, str]:
     return True, f"Connected successfully ({model_count} models available)"
 
 
+def run_checks(
+    checks: dict[str, Callable[[], ConnectionDiagnostics]], timeout: float
+) -> Iterator[tuple[str, ConnectionDiagnostics]]:
+    """Run checks concurrently, yielding their results as they complete.
+
+    Each check runs in a daemon thread, so a check still hanging after
+    `timeout` seconds is reported as timed out and doesn't delay the exit.
+    """
+    results: queue.Queue[tuple[str, ConnectionDiagnostics]] = queue.Queue()
+
+    def run(key: str, check: Callable[[], ConnectionDiagnostics]) -> None:
+        try:
+            results.put((key, check()))
+        except Exception as e:
+            results.put((key, ConnectionDiagnostics(success=False, message=str(e))))
+
+    for key, check in checks.items():
+        threading.Thread(target=run, args=(key, check), name=f"nao-debug-{key}", daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    pending = set(checks)
+    while pending:
+        try:
+            key, result = results.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            break
+        pending.discard(key)
+        yield key, result
+    for key in checks:
+        if key in pending:
+            yield key, ConnectionDiagnostics(success=False, message=f"Timed out after {timeout:g}s")
+
+
+def diagnose_llm(llm_config) -> ConnectionDiagnostics:
+    """Run `check_llm_connection`, timing the request."""
+    start = time.perf_counter()
+    success, message = check_llm_connection(llm_config)
+    return ConnectionDiagnostics(success=success, message=message, query_seconds=time.perf_counter() - start)
+
+
+def _format_latency(seconds: float | None) -> str:
+    return f"{seconds * 1000:.0f} ms" if seconds is not None else "-"
+
+
+def _short(message: str) -> str:
+    # Truncate long error messages
+    return message[:80] + "..." if len(message) > 80 else message
+
+
 def check_llm_connection(llm_config) -> tuple[bool, str]:
     """Test connectivity to an LLM provider.
 
@@ -58,11 +116,18 @@ def check_llm_connection(llm_config) -> tuple[bool, str]:
 
 
 @track_command("debug")
-def debug():
+def debug(
+    timeout: Annotated[
+        float,
+        Parameter(name=["--timeout", "-t"], help="Seconds after which a connection check is reported as timed out."),
+    ] = DEFAULT_TIMEOUT_SECONDS,
+):
     """Test connectivity to configured databases and LLMs.
 
     Loads the nao configuration from the current directory and tests
-    connections to all configured databases and LLM providers.
+    connections to all configured databases and LLM providers, concurrently.
+    Each database reports its connect latency, the round-trip of a trivial
+    query and its server version.
     """
     console.print("\n[bold cyan]🔍 nao debug - Testing connections...[/bold cyan]\n")
 
@@ -72,73 +137,70 @@ def debug():
 
     console.print(f"[bold green]✓[/bold green] Loaded config: [cyan]{config.project_name}[/cyan]\n")
 
-    # Test databases
+    # Run every check at once, printing each result as it completes
+    checks = {f"db:{db.name}": db.diagnose for db in config.databases}
+    if config.llm:
+        checks["llm"] = partial(diagnose_llm, config.llm)
+
+    results: dict[str, ConnectionDiagnostics] = {}
+    if checks:
+        console.print("[bold]Testing connections...[/bold]")
+    for key, diagnostics in run_checks(checks, timeout):
+        results[key] = diagnostics
+        status = "[bold green]✓[/bold green]" if diagnostics.success else "[bold red]✗[/bold red]"
+        name = config.llm.provider.value if key == "llm" and config.llm else key.removeprefix("db:")
+        latency = diagnostics.connect_seconds if diagnostics.connect_seconds is not None else diagnostics.query_seconds
+        console.print(f"  {status} [cyan]{name}[/cyan] ({_format_latency(latency)})")
+    if checks:
+        console.print()
+
+    # Databases, in configuration order whatever the completion order
     if config.databases:
         console.print("[bold]Databases:[/bold]")
         db_table = Table(show_header=True, header_style="bold")
         db_table.add_column("Name")
         db_table.add_column("Type")
         db_table.add_column("Status")
+        db_table.add_column("Connect", justify="right")
+        db_table.add_column("Query", justify="right")
+        db_table.add_column("Version")
         db_table.add_column("Details")
 
         for db in config.databases:
-            console.print(f"  Testing [cyan]{db.name}[/cyan]...", end=" ")
-            success, message = db.check_connection()
-
-            if success:
-                console.print("[bold green]✓[/bold green]")
-                db_table.add_row(
-                    db.name,
-                    db.type,
-                    "[green]Connected[/green]",
-                    message,
-                )
-            else:
-                console.print("[bold red]✗[/bold red]")
-                # Truncate long error messages
-                short_msg = message[:80] + "..." if len(message) > 80 else message
-                db_table.add_row(
-                    db.name,
-                    db.type,
-                    "[red]Failed[/red]",
-                    short_msg,
-                )
+            diagnostics = results[f"db:{db.name}"]
+            db_table.add_row(
+                db.name,
+                db.type,
+                "[green]Connected[/green]" if diagnostics.success else "[red]Failed[/red]",
+                _format_latency(diagnostics.connect_seconds),
+                _format_latency(diagnostics.query_seconds),
+                diagnostics.server_version or "-",
+                diagnostics.message if diagnostics.success else _short(diagnostics.message),
+            )
 
-        console.print()
         console.print(db_table)
     else:
         console.print("[dim]No databases configured[/dim]")
 
     console.print()
 
-    # Test LLM
+    # LLM
     if config.llm:
         console.print("[bold]LLM Provider:[/bold]")
         llm_table = Table(show_header=True, header_style="bold")
         llm_table.add_column("Provider")
         llm_table.add_column("Status")
+        llm_table.add_column("Latency", justify="right")
         llm_table.add_column("Details")
 
-        console.print(f"  Testing [cyan]{config.llm.provider.value}[/cyan]...", end=" ")
-        success, message = check_llm_connection(config.llm)
-
-        if success:
-            console.print("[bold green]✓[/bold green]")
-            llm_table.add_row(
-                config.llm.provider.value,
-                "[green]Connected[/green]",
-                message,
-            )
-        else:
-            console.print("[bold red]✗[/bold red]")
-            short_msg = message[:80] + "..." if len(message) > 80 else message
-            llm_table.add_row(
-                config.llm.provider.value,
-                "[red]Failed[/red]",
-                short_msg,
-            )
+        diagnostics = results["llm"]
+        llm_table.add_row(
+            config.llm.provider.value,
+            "[green]Connected[/green]" if diagnostics.success else "[red]Failed[/red]",
+            _format_latency(diagnostics.query_seconds),
+            diagnostics.message if diagnostics.success else _short(diagnostics.message),
+        )
 
-        console.print()
         console.print(llm_table)
     else:
         console.print("[dim]No LLM configured[/dim]")
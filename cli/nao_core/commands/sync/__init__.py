@@ -8,12 +8,15 @@ from cyclopts import Parameter
 from rich.console import Console
 
 from nao_core.config import NaoConfig
+from nao_core.context.search import IndexStats, update_search_index
 from nao_core.templates.render import render_all_templates
 from nao_core.tracking import track_command
 
+from .profile import SyncProfiler
 from .providers import (
     PROVIDER_CHOICES,
     ProviderSelection,
+    SyncOptions,
     SyncResult,
     get_all_providers,
     get_providers_by_names,
@@ -35,6 +38,26 @@ def sync(
     output_dirs: Annotated[dict[str, str] | None, Parameter(show=False)] = None,
     _providers: Annotated[list[ProviderSelection] | None, Parameter(show=False)] = None,
     render_templates: bool = True,
+    search_index: Annotated[
+        bool,
+        Parameter(help="Update the full-text search index under .nao/index after syncing."),
+    ] = True,
+    cleanup_dry_run: Annotated[
+        bool,
+        Parameter(help="Report stale files that would be removed by the sync without deleting them."),
+    ] = False,
+    resume: Annotated[
+        bool,
+        Parameter(help="Resume an interrupted database sync, skipping tables it already completed."),
+    ] = False,
+    jobs: Annotated[
+        int,
+        Parameter(name=["-j", "--jobs"], help="Maximum number of repositories or Notion pages to sync concurrently."),
+    ] = 4,
+    profile: Annotated[
+        bool,
+        Parameter(help="Record per-phase and per-table timings and write a report under .nao/profiles."),
+    ] = False,
 ):
     """Sync resources using configured providers.
 
@@ -44,7 +67,8 @@ def sync(
 
     After syncing providers, renders any Jinja templates (*.j2 files) found in
     the project directory, making the `nao` context object available for
-    accessing provider data.
+    accessing provider data. Finally, the full-text search index under
+    `.nao/index/` is updated with the files that changed.
     """
     console.print("\n[bold cyan]🔄 nao sync[/bold cyan]\n")
 
@@ -69,6 +93,12 @@ def sync(
         active_providers = get_all_providers()
 
     output_dirs = output_dirs or {}
+    options = SyncOptions(
+        dry_run=cleanup_dry_run,
+        resume=resume,
+        jobs=max(jobs, 1),
+        profiler=SyncProfiler() if profile else None,
+    )
 
     # Run each provider
     results: list[SyncResult] = []
@@ -81,7 +111,7 @@ def sync(
         output_path = Path(output_dir)
 
         try:
-            sync_provider.pre_sync(config, output_path)
+            sync_provider.pre_sync(config, output_path, options)
 
             if not sync_provider.should_sync(config):
                 continue
@@ -96,7 +126,7 @@ def sync(
                     )
                     continue
 
-            result = sync_provider.sync(items, output_path, project_path=project_path)
+            result = sync_provider.sync(items, output_path, project_path=project_path, options=options)
             results.append(result)
         except Exception as e:
             # Capture error but continue with other providers
@@ -109,6 +139,14 @@ def sync(
         console.print("\n[bold cyan]📝 Rendering templates[/bold cyan]\n")
         template_result = render_all_templates(project_path, config, console)
 
+    # Update the full-text search index over the synced context
+    index_stats: IndexStats | None = None
+    if search_index:
+        try:
+            index_stats = update_search_index(project_path)
+        except Exception as e:
+            console.print(f"  [yellow]⚠[/yellow] Failed to update search index: [red]{e}[/red]")
+
     # Separate successful and failed results
     successful_results = [r for r in results if r.success]
     failed_results = [r for r in results if not r.success]
@@ -135,6 +173,13 @@ def sync(
         has_results = True
         console.print(f"  [dim]Templates:[/dim] {template_result.get_summary()}")
 
+    if index_stats and index_stats.changed:
+        console.print(f"  [dim]Search index:[/dim] {index_stats.get_summary()}")
+
+    if options.profiler:
+        json_report, html_report = options.profiler.write_report(project_path)
+        console.print(f"  [dim]Profile:[/dim] {html_report} [dim]({json_report.name})[/dim]")
+
     # Show errors section if any
     if failed_results:
         has_results = True
@@ -1,5 +1,6 @@
 """Cleanup utilities for removing stale sync files."""
 
+import json
 import shutil
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -10,6 +11,9 @@ from rich.console import Console
 
 console = Console()
 
+MANIFEST_FILENAME = ".nao_manifest.json"
+CHECKPOINT_FILENAME = ".nao_checkpoint.jsonl"
+
 
 @dataclass
 class DatabaseSyncState:
@@ -56,37 +60,231 @@ class DatabaseSyncState:
         self.schemas_synced += 1
 
 
-def cleanup_stale_paths(state: DatabaseSyncState, verbose: bool = False) -> int:
-    """Remove directories that exist on disk but weren't synced.
+@dataclass
+class SyncCheckpoint:
+    """Append-only log of the tables completed by an in-progress database sync.
 
-    This function cleans up:
-    - Table directories that no longer exist in the source
-    - Schema directories that no longer exist or have no tables
+    Each completed table is appended as one JSON line to a file in the database
+    folder, so an interrupted sync can be resumed without re-rendering those
+    tables. The file is removed once the database sync completes.
+    """
+
+    db_path: Path
+    """The root path for this database (e.g., databases/type=duckdb/database=mydb)"""
+
+    @property
+    def path(self) -> Path:
+        return self.db_path / CHECKPOINT_FILENAME
+
+    def load(self) -> dict[str, set[str]]:
+        """Read the completed tables, ignoring a truncated last line."""
+        completed: dict[str, set[str]] = defaultdict(set)
+        try:
+            lines = self.path.read_text().splitlines()
+        except OSError:
+            return {}
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                completed[entry["schema"]].add(entry["table"])
+            except (ValueError, KeyError, TypeError):
+                continue
+        return dict(completed)
+
+    def reset(self) -> None:
+        """Start a fresh checkpoint, discarding any previous progress."""
+        self.db_path.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("")
+
+    def record(self, schema: str, table: str) -> None:
+        """Append a completed table to the checkpoint."""
+        with self.path.open("a") as f:
+            f.write(json.dumps({"schema": schema, "table": table}) + "\n")
+
+    def clear(self) -> None:
+        """Remove the checkpoint after a completed sync."""
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class SyncManifest:
+    """Persisted record of the database paths written by previous syncs.
+
+    The manifest lives at the root of the databases output folder and maps each
+    database folder (e.g. `type=duckdb/database=mydb`) to the schemas and tables
+    written for it. Stale entries can then be computed as a set difference
+    against the current sync state, without walking the output tree.
+    """
+
+    base_path: Path
+    """The root output path for databases (e.g., databases/)"""
+
+    databases: dict[str, dict[str, set[str]]] = field(default_factory=dict)
+    """Dict mapping database folder keys to schema names to sets of table names"""
+
+    loaded: bool = False
+    """Whether the manifest was read from disk (False on a first run)"""
+
+    @property
+    def path(self) -> Path:
+        return self.base_path / MANIFEST_FILENAME
+
+    @classmethod
+    def load(cls, base_path: Path) -> "SyncManifest":
+        """Load the manifest from disk, or return an empty one if missing or unreadable."""
+        manifest = cls(base_path=base_path)
+        try:
+            data = json.loads(manifest.path.read_text())
+        except (OSError, ValueError):
+            return manifest
+
+        manifest.databases = {
+            db_key: {schema: set(tables) for schema, tables in schemas.items()}
+            for db_key, schemas in data.get("databases", {}).items()
+        }
+        manifest.loaded = True
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest to disk."""
+        data = {
+            "version": 1,
+            "databases": {
+                db_key: {schema: sorted(tables) for schema, tables in sorted(schemas.items())}
+                for db_key, schemas in sorted(self.databases.items())
+            },
+        }
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=2))
+
+    def key_for(self, db_path: Path) -> str:
+        """Get the manifest key for a database path."""
+        return db_path.relative_to(self.base_path).as_posix()
+
+    def get(self, db_path: Path) -> dict[str, set[str]] | None:
+        """Get the schemas and tables recorded for a database, if any."""
+        return self.databases.get(self.key_for(db_path))
+
+    def record(self, state: DatabaseSyncState) -> None:
+        """Replace the recorded schemas and tables of a database with the given sync state."""
+        tables = {schema: set(state.synced_tables.get(schema, set())) for schema in state.synced_schemas}
+        self.databases[self.key_for(state.db_path)] = tables
+
+    def merge(self, state: DatabaseSyncState) -> None:
+        """Add the given sync state to the recorded schemas and tables of a database."""
+        recorded = self.databases.setdefault(self.key_for(state.db_path), {})
+        for schema in state.synced_schemas:
+            recorded.setdefault(schema, set()).update(state.synced_tables.get(schema, set()))
+
+    def keep(self, db_path: Path, paths: list[Path]) -> None:
+        """Record schema and table directories of a database, so a later run still finds them stale."""
+        recorded = self.databases.setdefault(self.key_for(db_path), {})
+        for path in paths:
+            parts = path.relative_to(db_path).parts
+            schema = recorded.setdefault(parts[0].removeprefix("schema="), set())
+            if len(parts) > 1:
+                schema.add(parts[1].removeprefix("table="))
+
+
+@dataclass
+class NotionManifest:
+    """Persisted record of the Notion pages exported by previous syncs.
+
+    Maps each page id to its markdown file and the `last_edited_time` it was
+    exported at, so unchanged pages can be skipped and stale files found
+    without scanning the output folder.
+    """
+
+    base_path: Path
+    """The output path for Notion pages (e.g., docs/notion/)"""
+
+    pages: dict[str, dict[str, str]] = field(default_factory=dict)
+    """Dict mapping page ids to their `file`, `title` and `last_edited_time`"""
+
+    loaded: bool = False
+    """Whether the manifest was read from disk (False on a first run)"""
+
+    @property
+    def path(self) -> Path:
+        return self.base_path / MANIFEST_FILENAME
+
+    @classmethod
+    def load(cls, base_path: Path) -> "NotionManifest":
+        """Load the manifest from disk, or return an empty one if missing or unreadable."""
+        manifest = cls(base_path=base_path)
+        try:
+            data = json.loads(manifest.path.read_text())
+        except (OSError, ValueError):
+            return manifest
+
+        manifest.pages = dict(data.get("pages", {}))
+        manifest.loaded = True
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest to disk."""
+        data = {"version": 1, "pages": dict(sorted(self.pages.items()))}
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=2))
+
+    def files(self) -> set[str]:
+        """Get the markdown filenames recorded for all pages."""
+        return {entry["file"] for entry in self.pages.values()}
+
+
+def remove_stale_paths(paths: list[Path], dry_run: bool = False, verbose: bool = False) -> list[Path]:
+    """Remove a batch of stale paths in a single pass.
+
+    Paths nested under another path of the batch are skipped since removing
+    the parent already removes them. Paths that no longer exist are ignored.
 
     Args:
-        state: The sync state tracking what was synced
+        paths: Files or directories to remove
+        dry_run: Only report what would be removed
         verbose: Whether to print cleanup messages
 
     Returns:
-        Number of stale paths removed
+        The paths that were (or, in dry-run mode, would be) removed
     """
-    removed_count = 0
+    batch = sorted(set(paths), key=lambda p: len(p.parts))
+    selected: set[Path] = set()
+    removed: list[Path] = []
+
+    for path in batch:
+        if any(parent in selected for parent in path.parents):
+            continue
+        selected.add(path)
 
-    if not state.db_path.exists():
-        return 0
+        if not path.exists():
+            continue
+
+        if verbose:
+            action = "would remove" if dry_run else "removing"
+            console.print(f"  [dim red]{action} stale path:[/dim red] {path}")
+
+        if not dry_run:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        removed.append(path)
+
+    return removed
+
+
+def _find_stale_paths_on_disk(state: DatabaseSyncState) -> list[Path]:
+    """Walk the database folder to find schema and table directories that weren't synced."""
+    stale: list[Path] = []
 
     # Find all existing schema directories
     existing_schemas = {
         d.name.replace("schema=", ""): d for d in state.db_path.iterdir() if d.is_dir() and d.name.startswith("schema=")
     }
 
-    # Remove schemas that weren't synced
     for schema_name, schema_path in existing_schemas.items():
         if schema_name not in state.synced_schemas:
-            if verbose:
-                console.print(f"  [dim red]removing stale schema:[/dim red] {schema_name}")
-            shutil.rmtree(schema_path)
-            removed_count += 1
+            stale.append(schema_path)
             continue
 
         # Find existing tables in this schema
@@ -96,19 +294,92 @@ def cleanup_stale_paths(state: DatabaseSyncState, verbose: bool = False) -> int:
 
         synced_tables_for_schema = state.synced_tables.get(schema_name, set())
 
-        # Remove tables that weren't synced
         for table_name, table_path in existing_tables.items():
             if table_name not in synced_tables_for_schema:
-                if verbose:
-                    console.print(f"  [dim red]removing stale table:[/dim red] {schema_name}.{table_name}")
-                shutil.rmtree(table_path)
-                removed_count += 1
+                stale.append(table_path)
+
+    return stale
+
+
+def _find_stale_paths_from_manifest(state: DatabaseSyncState, previous: dict[str, set[str]]) -> list[Path]:
+    """Compute schema and table directories that were previously written but not synced this time."""
+    stale: list[Path] = []
+
+    for schema_name, previous_tables in previous.items():
+        schema_path = state.db_path / f"schema={schema_name}"
+        if schema_name not in state.synced_schemas:
+            stale.append(schema_path)
+            continue
+
+        synced_tables_for_schema = state.synced_tables.get(schema_name, set())
+        stale.extend(schema_path / f"table={table}" for table in previous_tables - synced_tables_for_schema)
+
+    return stale
+
+
+def cleanup_stale_paths(
+    state: DatabaseSyncState,
+    verbose: bool = False,
+    manifest: SyncManifest | None = None,
+    dry_run: bool = False,
+) -> int:
+    """Remove directories that exist on disk but weren't synced.
+
+    This function cleans up:
+    - Table directories that no longer exist in the source
+    - Schema directories that no longer exist or have no tables
+
+    When a manifest with a previous entry for this database is given, stale
+    paths are computed from it instead of walking the database folder. The
+    manifest is then updated with the current sync state.
+
+    Args:
+        state: The sync state tracking what was synced
+        verbose: Whether to print cleanup messages
+        manifest: The sync manifest recording previously written paths
+        dry_run: Only report what would be removed
+
+    Returns:
+        Number of stale paths removed
+    """
+    previous = manifest.get(state.db_path) if manifest is not None else None
+
+    if previous is not None:
+        stale = _find_stale_paths_from_manifest(state, previous)
+    elif state.db_path.exists():
+        stale = _find_stale_paths_on_disk(state)
+    else:
+        stale = []
+
+    removed = remove_stale_paths(stale, dry_run=dry_run, verbose=verbose)
+
+    if manifest is not None:
+        # In dry-run mode stale paths are still on disk, so keep them recorded
+        # (including those found by walking the disk, absent from the manifest)
+        if dry_run:
+            manifest.merge(state)
+            manifest.keep(state.db_path, stale)
+        else:
+            manifest.record(state)
+
+    return len(removed)
+
 
-    return removed_count
+def cleanup_stale_databases(
+    active_databases: List,
+    base_path: Path,
+    verbose: bool = False,
+    manifest: SyncManifest | None = None,
+    dry_run: bool = False,
+) -> int:
+    """Remove databases that are not present in the config file.
 
+    When a manifest read from disk is given, stale database folders are
+    computed from its recorded entries instead of walking the output folder.
 
-def cleanup_stale_databases(active_databases: List, base_path: Path, verbose: bool = False):
-    """Remove databases that are not present in the config file."""
+    Returns:
+        Number of stale paths removed
+    """
 
     valid_db_folders_by_type: Dict[str, set] = defaultdict(set)
 
@@ -119,38 +390,58 @@ def cleanup_stale_databases(active_databases: List, base_path: Path, verbose: bo
 
         valid_db_folders_by_type[type_folder].add(db_folder)
 
-    for type_dir in base_path.iterdir():
-        if not type_dir.is_dir():
-            continue
+    stale: list[Path] = []
+
+    if manifest is not None and manifest.loaded:
+        for db_key in list(manifest.databases):
+            type_folder, _, db_folder = db_key.partition("/")
+            if db_folder in valid_db_folders_by_type.get(type_folder, set()):
+                continue
+            # Remove entire type directory if it doesn't exist in nao_config
+            if type_folder not in valid_db_folders_by_type:
+                stale.append(base_path / type_folder)
+            else:
+                stale.append(base_path / db_key)
+            if not dry_run:
+                del manifest.databases[db_key]
+
+    elif base_path.exists():
+        for type_dir in base_path.iterdir():
+            if not type_dir.is_dir():
+                continue
 
-        type_folder_name = type_dir.name
+            # Remove entire type directory if it doesn't exist in nao_config
+            if type_dir.name not in valid_db_folders_by_type:
+                stale.append(type_dir)
+                continue
 
-        # Remove entire type directory if it doesn't exist in nao_config
-        if type_folder_name not in valid_db_folders_by_type:
-            shutil.rmtree(type_dir)
-            if verbose:
-                console.print(f"\n[yellow] Removed unused database type:[/yellow] {type_dir}")
-            continue
+            valid_db_folders = valid_db_folders_by_type[type_dir.name]
 
-        valid_db_folders = valid_db_folders_by_type[type_folder_name]
+            # Remove unused database folders if it doesn't exist in nao_config
+            stale.extend(
+                db_dir for db_dir in type_dir.iterdir() if db_dir.is_dir() and db_dir.name not in valid_db_folders
+            )
 
-        # Remove unused database folders if it doesn't exist in nao_config
-        for db_dir in type_dir.iterdir():
-            if not db_dir.is_dir():
-                continue
+    removed = remove_stale_paths(stale, dry_run=dry_run)
+
+    if verbose:
+        action = "Would remove" if dry_run else "Removed"
+        for path in removed:
+            label = "database type" if path.name.startswith("type=") else "database"
+            console.print(f"\n[yellow] {action} unused {label}:[/yellow] {path.relative_to(base_path)}")
 
-            if db_dir.name not in valid_db_folders:
-                shutil.rmtree(db_dir)
-                if verbose:
-                    console.print(f"\n[yellow] Removed unused database:[/yellow] {type_folder_name}/{db_dir.name}")
+    return len(removed)
 
 
-def cleanup_stale_repos(config_repos: list, base_path: Path, verbose: bool = False) -> None:
+def cleanup_stale_repos(config_repos: list, base_path: Path, verbose: bool = False, dry_run: bool = False) -> None:
     """Remove repositories that are not present in the config file."""
+    if not base_path.exists():
+        return
 
     repo_names = {repo.name for repo in config_repos}
-    for repo_dir in base_path.iterdir():
-        if repo_dir.is_dir() and repo_dir.name not in repo_names:
-            shutil.rmtree(repo_dir)
-            if verbose:
-                console.print(f"\n[yellow] Removed unused repo:[/yellow] {repo_dir.name}")
+    stale = [repo_dir for repo_dir in base_path.iterdir() if repo_dir.is_dir() and repo_dir.name not in repo_names]
+
+    for repo_dir in remove_stale_paths(stale, dry_run=dry_run):
+        if verbose:
+            action = "Would remove" if dry_run else "Removed"
+            console.print(f"\n[yellow] {action} unused repo:[/yellow] {repo_dir.name}")
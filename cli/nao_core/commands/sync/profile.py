@@ -0,0 +1,191 @@
+"""Sync-wide profiling report (`nao sync --profile`)."""
+
+import html
+import json
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+PROFILES_DIR = Path(".nao") / "profiles"
+
+
+@dataclass
+class PhaseTiming:
+    """Wall time of a sync phase such as connect, get_schemas or list_tables."""
+
+    database: str
+    phase: str
+    seconds: float
+    schema: str | None = None
+
+
+@dataclass
+class AccessorTiming:
+    """Time spent producing one accessor file of one table.
+
+    Warehouse time is spent in DatabaseContext calls (queries), Jinja time is
+    the remaining render time, and write time is spent writing the file.
+    """
+
+    database: str
+    schema: str
+    table: str
+    accessor: str
+    warehouse: float
+    jinja: float
+    write: float
+
+    @property
+    def total(self) -> float:
+        return self.warehouse + self.jinja + self.write
+
+
+@dataclass
+class SyncProfiler:
+    """Collects phase and per-table timings during a sync."""
+
+    phases: list[PhaseTiming] = field(default_factory=list)
+    accessors: list[AccessorTiming] = field(default_factory=list)
+    started_at: datetime = field(default_factory=datetime.now)
+
+    def record_phase(self, database: str, phase: str, seconds: float, schema: str | None = None) -> None:
+        self.phases.append(PhaseTiming(database, phase, seconds, schema))
+
+    def record_accessor(
+        self,
+        database: str,
+        schema: str,
+        table: str,
+        accessor: str,
+        warehouse: float,
+        jinja: float,
+        write: float,
+    ) -> None:
+        self.accessors.append(AccessorTiming(database, schema, table, accessor, warehouse, jinja, write))
+
+    def database_totals(self) -> dict[str, dict[str, float]]:
+        """Total seconds per phase and per accessor time kind, for each database."""
+        totals: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for p in self.phases:
+            totals[p.database][p.phase] += p.seconds
+        for a in self.accessors:
+            totals[a.database]["warehouse"] += a.warehouse
+            totals[a.database]["jinja"] += a.jinja
+            totals[a.database]["write"] += a.write
+        return {db: dict(phases) for db, phases in totals.items()}
+
+    def top_tables(self, n: int = 20) -> list[dict]:
+        """The N slowest tables, with their time split by accessor."""
+        tables: dict[tuple[str, str, str], dict] = {}
+        for a in self.accessors:
+            key = (a.database, a.schema, a.table)
+            entry = tables.setdefault(
+                key,
+                {"database": a.database, "schema": a.schema, "table": a.table, "total": 0.0, "accessors": {}},
+            )
+            entry["total"] += a.total
+            entry["accessors"][a.accessor] = round(a.total, 4)
+        return sorted(tables.values(), key=lambda t: t["total"], reverse=True)[:n]
+
+    def top_accessors(self, n: int = 20) -> list[dict]:
+        """The N slowest individual accessor renders."""
+        slowest = sorted(self.accessors, key=lambda a: a.total, reverse=True)[:n]
+        return [{**asdict(a), "total": a.total} for a in slowest]
+
+    def accessor_totals(self) -> dict[str, dict[str, float]]:
+        """Total warehouse/jinja/write seconds per accessor, across all tables."""
+        totals: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for a in self.accessors:
+            totals[a.accessor]["warehouse"] += a.warehouse
+            totals[a.accessor]["jinja"] += a.jinja
+            totals[a.accessor]["write"] += a.write
+            totals[a.accessor]["count"] += 1
+        return {name: dict(t) for name, t in totals.items()}
+
+    def to_dict(self, top_n: int = 20) -> dict:
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "databases": self.database_totals(),
+            "accessors": self.accessor_totals(),
+            "top_tables": self.top_tables(top_n),
+            "top_accessors": self.top_accessors(top_n),
+            "phases": [asdict(p) for p in self.phases],
+        }
+
+    def write_report(self, project_path: Path, top_n: int = 20) -> tuple[Path, Path]:
+        """Write the JSON and HTML reports under `.nao/profiles/`.
+
+        Returns:
+            Paths to the JSON and HTML reports
+        """
+        output_dir = project_path / PROFILES_DIR
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"sync-{self.started_at:%Y%m%d-%H%M%S}"
+        data = self.to_dict(top_n)
+
+        json_path = output_dir / f"{stem}.json"
+        json_path.write_text(json.dumps(data, indent=2))
+        html_path = output_dir / f"{stem}.html"
+        html_path.write_text(_render_html(data))
+        return json_path, html_path
+
+
+def _table(headers: list[str], rows: list[list]) -> str:
+    def cell(value) -> str:
+        if isinstance(value, float):
+            return f"<td>{value:.3f}</td>"
+        return f"<td>{html.escape(str(value))}</td>"
+
+    head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(cell(v) for v in row) + "</tr>" for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _render_html(data: dict) -> str:
+    kinds = ["connect", "get_schemas", "list_tables", "warehouse", "jinja", "write", "catalog"]
+    sections = [
+        "<h2>Databases (seconds)</h2>",
+        _table(["database", *kinds], [[db, *(t.get(k, 0.0) for k in kinds)] for db, t in data["databases"].items()]),
+        "<h2>Accessors (seconds)</h2>",
+        _table(
+            ["accessor", "tables", "warehouse", "jinja", "write"],
+            [[name, int(t["count"]), t["warehouse"], t["jinja"], t["write"]] for name, t in data["accessors"].items()],
+        ),
+        "<h2>Slowest tables</h2>",
+        _table(
+            ["database", "schema", "table", "total (s)", "accessors (s)"],
+            [
+                [
+                    t["database"],
+                    t["schema"],
+                    t["table"],
+                    t["total"],
+                    ", ".join(f"{k}={v}" for k, v in t["accessors"].items()),
+                ]
+                for t in data["top_tables"]
+            ],
+        ),
+        "<h2>Slowest accessors</h2>",
+        _table(
+            ["database", "schema", "table", "accessor", "warehouse", "jinja", "write", "total"],
+            [
+                [
+                    a["database"],
+                    a["schema"],
+                    a["table"],
+                    a["accessor"],
+                    a["warehouse"],
+                    a["jinja"],
+                    a["write"],
+                    a["total"],
+                ]
+                for a in data["top_accessors"]
+            ],
+        ),
+    ]
+    style = "body{font-family:sans-serif}table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}"
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><title>nao sync profile</title><style>{style}</style>"
+        f"</head><body><h1>nao sync profile — {html.escape(data['started_at'])}</h1>{''.join(sections)}</body></html>"
+    )
@@ -5,9 +5,27 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from nao_core.commands.sync.profile import SyncProfiler
 from nao_core.config import NaoConfig
 
 
+@dataclass
+class SyncOptions:
+    """Run-wide options forwarded from the sync command to every provider."""
+
+    dry_run: bool = False
+    """Report stale files that would be removed without deleting them"""
+
+    resume: bool = False
+    """Skip tables completed by a previous interrupted sync"""
+
+    jobs: int = 4
+    """Maximum number of items a provider may sync concurrently"""
+
+    profiler: SyncProfiler | None = None
+    """Collects per-phase and per-table timings when profiling is enabled"""
+
+
 @dataclass
 class SyncResult:
     """Result of a sync operation."""
@@ -79,13 +97,20 @@ class SyncProvider(ABC):
         ...
 
     @abstractmethod
-    def sync(self, items: list[Any], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[Any],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
         """Sync the items to the output path.
 
         Args:
                 items: List of items to sync
                 output_path: Path where synced data should be written
                 project_path: Path to the nao project root (for template resolution)
+                options: Run-wide sync options (defaults to SyncOptions())
 
         Returns:
                 SyncResult with statistics about what was synced
@@ -103,11 +128,12 @@ class SyncProvider(ABC):
         """
         return len(self.get_items(config)) > 0
 
-    def pre_sync(self, config: NaoConfig, output_path: Path) -> None:
+    def pre_sync(self, config: NaoConfig, output_path: Path, options: SyncOptions | None = None) -> None:
         """For preparation before sync.
 
         Args:
             config: The loaded nao configuration.
             output_path: Base directory where the preparation should be applied.
+            options: Run-wide sync options (defaults to SyncOptions())
         """
         pass
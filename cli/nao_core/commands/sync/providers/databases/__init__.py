@@ -1,9 +1,11 @@
 """Database syncing functionality for generating markdown documentation from database schemas."""
 
+from .catalog import CatalogIndex
 from .context import DatabaseContext
 from .provider import DatabaseSyncProvider, sync_database
 
 __all__ = [
+    "CatalogIndex",
     "DatabaseContext",
     "DatabaseSyncProvider",
     "sync_database",
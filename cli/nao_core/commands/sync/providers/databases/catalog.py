@@ -0,0 +1,229 @@
+"""Compact SQLite catalog of synced databases, emitted alongside the markdown context.
+
+The catalog indexes every synced table and column so lookups such as "which
+tables have a column named customer_id" are index reads instead of scans over
+thousands of `columns.md` files.
+
+Example:
+    sqlite3 databases/catalog.sqlite "SELECT schema, table_name FROM columns WHERE name = 'customer_id'"
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nao_core.commands.sync.cleanup import DatabaseSyncState
+
+CATALOG_FILENAME = "catalog.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tables (
+    db_type TEXT NOT NULL,
+    database TEXT NOT NULL,
+    schema TEXT NOT NULL,
+    name TEXT NOT NULL COLLATE NOCASE,
+    description TEXT,
+    row_count INTEGER,
+    column_count INTEGER,
+    partition_columns TEXT,
+    path TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (db_type, database, schema, name)
+);
+CREATE TABLE IF NOT EXISTS columns (
+    db_type TEXT NOT NULL,
+    database TEXT NOT NULL,
+    schema TEXT NOT NULL,
+    table_name TEXT NOT NULL COLLATE NOCASE,
+    name TEXT NOT NULL COLLATE NOCASE,
+    position INTEGER NOT NULL,
+    type TEXT,
+    nullable INTEGER,
+    description TEXT,
+    is_partition INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (db_type, database, schema, table_name, name)
+);
+CREATE INDEX IF NOT EXISTS tables_by_name ON tables (name);
+CREATE INDEX IF NOT EXISTS columns_by_name ON columns (name);
+"""
+
+
+class MemoizedContext:
+    """Wraps a DatabaseContext so each accessor call hits the warehouse at most once per table.
+
+    Templates and the catalog share the same wrapper, so the catalog reuses the
+    values fetched while rendering (e.g. `row_count()` from description.md).
+    Time spent in uncached calls is accumulated in `warehouse_time`.
+    """
+
+    def __init__(self, ctx: Any):
+        self._ctx = ctx
+        self._results: dict[tuple, Any] = {}
+        self.warehouse_time = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._ctx, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            if key not in self._results:
+                start = time.monotonic()
+                try:
+                    self._results[key] = attr(*args, **kwargs)
+                finally:
+                    self.warehouse_time += time.monotonic() - start
+            return self._results[key]
+
+        return call
+
+    def cached(self, name: str) -> Any | None:
+        """Return the result of a no-argument accessor if it was already fetched, else None."""
+        return self._results.get((name, (), ()))
+
+
+class CatalogIndex:
+    """SQLite index of the tables and columns written by database sync."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        # Tables are committed one by one as they sync; WAL keeps those commits cheap
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> CatalogIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def upsert_table(
+        self,
+        db_type: str,
+        database: str,
+        schema: str,
+        table: str,
+        ctx: MemoizedContext,
+        path: Path | None = None,
+    ) -> None:
+        """Record a synced table and its columns.
+
+        Columns are always fetched. Description, partition columns and row count
+        are only recorded when the rendered accessors already fetched them, so
+        building the catalog never adds expensive warehouse queries.
+        """
+        key = (db_type, database, schema, table)
+        columns = ctx.columns()
+        partitions = ctx.cached("partition_columns") or []
+        row_count = ctx.cached("row_count")
+
+        self._conn.execute(
+            "DELETE FROM columns WHERE db_type = ? AND database = ? AND schema = ? AND table_name = ?", key
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO tables VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                *key,
+                ctx.cached("description"),
+                int(row_count) if row_count is not None else None,
+                len(columns),
+                json.dumps(list(partitions)),
+                str(path) if path else "",
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            ),
+        )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO columns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    *key,
+                    col["name"],
+                    position,
+                    col.get("type"),
+                    int(bool(col.get("nullable", True))),
+                    col.get("description"),
+                    int(col["name"] in partitions),
+                )
+                for position, col in enumerate(columns)
+            ],
+        )
+
+    def prune(self, db_type: str, database: str, state: DatabaseSyncState) -> int:
+        """Remove tables of a database that were not part of the given sync state.
+
+        Returns:
+            Number of tables removed from the catalog
+        """
+        rows = self._conn.execute(
+            "SELECT schema, name FROM tables WHERE db_type = ? AND database = ?", (db_type, database)
+        ).fetchall()
+        stale = [
+            (db_type, database, schema, table)
+            for schema, table in rows
+            if table not in state.synced_tables.get(schema, set())
+        ]
+        self._delete_tables(stale)
+        return len(stale)
+
+    def prune_databases(self, active: set[tuple[str, str]]) -> int:
+        """Remove every database that is not in the given set of (db_type, database) pairs.
+
+        Returns:
+            Number of tables removed from the catalog
+        """
+        rows = self._conn.execute("SELECT db_type, database, schema, name FROM tables").fetchall()
+        stale = [row for row in rows if (row[0], row[1]) not in active]
+        self._delete_tables(stale)
+        return len(stale)
+
+    def _delete_tables(self, keys: list[tuple[str, str, str, str]]) -> None:
+        self._conn.executemany(
+            "DELETE FROM tables WHERE db_type = ? AND database = ? AND schema = ? AND name = ?", keys
+        )
+        self._conn.executemany(
+            "DELETE FROM columns WHERE db_type = ? AND database = ? AND schema = ? AND table_name = ?", keys
+        )
+        self._conn.commit()
+
+    def find_columns(self, name: str) -> list[dict[str, Any]]:
+        """Find every column with the given name (case-insensitive)."""
+        cursor = self._conn.execute(
+            "SELECT db_type, database, schema, table_name, name, type, nullable, description "
+            "FROM columns WHERE name = ? ORDER BY db_type, database, schema, table_name",
+            (name,),
+        )
+        return _rows_as_dicts(cursor)
+
+    def find_tables(self, name: str) -> list[dict[str, Any]]:
+        """Find every table with the given name (case-insensitive)."""
+        cursor = self._conn.execute(
+            "SELECT db_type, database, schema, name, description, row_count, column_count, partition_columns, path "
+            "FROM tables WHERE name = ? ORDER BY db_type, database, schema",
+            (name,),
+        )
+        tables = _rows_as_dicts(cursor)
+        for table in tables:
+            table["partition_columns"] = json.loads(table["partition_columns"] or "[]")
+        return tables
+
+
+def _rows_as_dicts(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
+    names = [desc[0] for desc in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
@@ -15,12 +15,19 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from nao_core.commands.sync.cleanup import DatabaseSyncState, cleanup_stale_databases, cleanup_stale_paths
+from nao_core.commands.sync.cleanup import (
+    DatabaseSyncState,
+    SyncCheckpoint,
+    SyncManifest,
+    cleanup_stale_databases,
+    cleanup_stale_paths,
+)
 from nao_core.config import AnyDatabaseConfig, NaoConfig
 from nao_core.config.databases.base import DatabaseConfig
 from nao_core.templates.engine import get_template_engine
 
-from ..base import SyncProvider, SyncResult
+from ..base import SyncOptions, SyncProvider, SyncResult
+from .catalog import CATALOG_FILENAME, CatalogIndex, MemoizedContext
 
 console = Console()
 
@@ -49,28 +56,66 @@ def sync_database(
     base_path: Path,
     progress: Progress,
     project_path: Path | None = None,
+    catalog: CatalogIndex | None = None,
+    options: SyncOptions | None = None,
 ) -> DatabaseSyncState:
-    """Sync a single database by rendering all database templates for each table."""
+    """Sync a single database by rendering all database templates for each table.
+
+    When a catalog is given, each synced table is also recorded in it, reusing
+    the values already fetched by the templates.
+
+    Completed tables are checkpointed as they finish. With `options.resume`,
+    tables completed by a previous interrupted run are kept as-is instead of
+    being rendered again.
+    """
+    options = options or SyncOptions()
+    profiler = options.profiler
     engine = get_template_engine(project_path)
     templates = _filter_templates_by_accessor(engine.list_templates(TEMPLATE_PREFIX), db_config)
 
     t_connect = time.monotonic()
     conn = db_config.connect()
-    console.print(
-        f"  [dim]Connected to[/dim] [bold]{db_config.name}[/bold] "
-        f"[dim]({_fmt_duration(time.monotonic() - t_connect)})[/dim]"
-    )
+    connect_dur = time.monotonic() - t_connect
+    console.print(f"  [dim]Connected to[/dim] [bold]{db_config.name}[/bold] [dim]({_fmt_duration(connect_dur)})[/dim]")
+    if profiler:
+        profiler.record_phase(db_config.name, "connect", connect_dur)
 
     db_name = db_config.get_database_name()
     db_path = base_path / f"type={db_config.type}" / f"database={db_name}"
     state = DatabaseSyncState(db_path=db_path)
 
+    checkpoint = SyncCheckpoint(db_path=db_path)
+    completed = checkpoint.load() if options.resume else {}
+    if completed:
+        resumed_count = sum(len(tables) for tables in completed.values())
+        console.print(f"  [dim]Resuming:[/dim] [bold]{resumed_count}[/bold] [dim]tables already synced[/dim]")
+    else:
+        checkpoint.reset()
+
     t_schemas = time.monotonic()
-    schemas = db_config.get_schemas(conn)
-    console.print(
-        f"  [dim]Found[/dim] [bold]{len(schemas)}[/bold] "
-        f"[dim]schemas ({_fmt_duration(time.monotonic() - t_schemas)})[/dim]"
-    )
+    # Skip schemas that no include pattern can match before listing their tables
+    schemas = [s for s in db_config.get_schemas(conn) if db_config.schema_matches(s)]
+    schemas_dur = time.monotonic() - t_schemas
+    console.print(f"  [dim]Found[/dim] [bold]{len(schemas)}[/bold] [dim]schemas ({_fmt_duration(schemas_dur)})[/dim]")
+    if profiler:
+        profiler.record_phase(db_config.name, "get_schemas", schemas_dur)
+
+    # List every schema's tables in one round trip when the backend supports it
+    tables_by_schema: dict[str, list[str]] | None = None
+    if schemas:
+        t_list_all = time.monotonic()
+        try:
+            tables_by_schema = db_config.list_all_tables(conn, schemas)
+        except Exception as e:
+            console.print(f"  [dim]Bulk table listing failed, listing schema by schema: {e}[/dim]")
+        if tables_by_schema is not None:
+            list_all_dur = time.monotonic() - t_list_all
+            table_count = sum(len(tables) for tables in tables_by_schema.values())
+            console.print(
+                f"  [dim]Listed[/dim] [bold]{table_count}[/bold] [dim]tables ({_fmt_duration(list_all_dur)})[/dim]"
+            )
+            if profiler:
+                profiler.record_phase(db_config.name, "list_tables", list_all_dur)
 
     schema_task = progress.add_task(
         f"[dim]{db_config.name}[/dim]",
@@ -82,19 +127,29 @@ def sync_database(
     for schema in schemas:
         try:
             t_list = time.monotonic()
-            all_tables = conn.list_tables(database=schema)
+            if tables_by_schema is not None:
+                all_tables = tables_by_schema.get(schema, [])
+            else:
+                all_tables = conn.list_tables(database=schema)
         except Exception as e:
             console.print(f"  [yellow]⚠[/yellow] [dim]Skipping schema[/dim] {schema}: {e}")
+            # Keep tables completed before the interruption so cleanup does not remove them
+            for table in completed.get(schema, ()):
+                state.add_table(schema, table)
             progress.update(schema_task, advance=1)
             continue
 
+        list_seconds = time.monotonic() - t_list
+        if profiler and tables_by_schema is None:
+            profiler.record_phase(db_config.name, "list_tables", list_seconds, schema=schema)
+
         tables = [t for t in all_tables if db_config.matches_pattern(schema, t)]
 
         if not tables:
             progress.update(schema_task, advance=1)
             continue
 
-        list_dur = _fmt_duration(time.monotonic() - t_list)
+        list_dur = _fmt_duration(list_seconds)
         console.print(
             f"  [cyan]▸ {schema}[/cyan] [dim]— {len(tables)} tables "
             f"(of {len(all_tables)} total, listed in {list_dur})[/dim]"
@@ -112,8 +167,16 @@ def sync_database(
         schema_errors = 0
         schema_start = time.monotonic()
 
+        done_tables = completed.get(schema, set())
+
         for table in tables:
             table_path = schema_path / f"table={table}"
+
+            if table in done_tables and table_path.is_dir():
+                state.add_table(schema, table)
+                progress.update(table_task, advance=1)
+                continue
+
             table_path.mkdir(parents=True, exist_ok=True)
 
             progress.update(
@@ -121,12 +184,13 @@ def sync_database(
                 description=f"    [cyan]{schema}[/cyan] [dim]→ {table}[/dim]",
             )
 
-            ctx = db_config.create_context(conn, schema, table)
+            ctx = MemoizedContext(db_config.create_context(conn, schema, table))
 
             for template_name in templates:
                 output_filename = Path(template_name).stem
                 accessor_name = output_filename.replace(".md", "")
 
+                warehouse_before = ctx.warehouse_time
                 t_render = time.monotonic()
                 try:
                     content = engine.render(template_name, db=ctx, table_name=table, dataset=schema)
@@ -147,10 +211,35 @@ def sync_database(
                     )
                     content = f"# {table}\n\nError generating content: {e}"
 
+                t_write = time.monotonic()
                 output_file = table_path / output_filename
                 output_file.write_text(content)
 
+                if profiler:
+                    warehouse_dur = ctx.warehouse_time - warehouse_before
+                    profiler.record_accessor(
+                        db_config.name,
+                        schema,
+                        table,
+                        accessor_name,
+                        warehouse=warehouse_dur,
+                        jinja=max(render_dur - warehouse_dur, 0.0),
+                        write=time.monotonic() - t_write,
+                    )
+
+            if catalog is not None:
+                t_catalog = time.monotonic()
+                try:
+                    catalog.upsert_table(
+                        db_config.type, db_name, schema, table, ctx, path=table_path.relative_to(base_path)
+                    )
+                except Exception as e:
+                    console.print(f"    [yellow]⚠[/yellow] [dim]{schema}.{table} not added to catalog:[/dim] {e}")
+                catalog.commit()
+                if profiler:
+                    profiler.record_phase(db_config.name, "catalog", time.monotonic() - t_catalog, schema=schema)
             state.add_table(schema, table)
+            checkpoint.record(schema, table)
             progress.update(table_task, advance=1)
 
         progress.update(
@@ -168,6 +257,10 @@ def sync_database(
     if total_errors:
         console.print(f"  [yellow]⚠ {total_errors} total errors during sync[/yellow]")
 
+    if catalog is not None and not options.dry_run:
+        catalog.prune(db_config.type, db_name, state)
+
+    checkpoint.clear()
     return state
 
 
@@ -186,17 +279,34 @@ class DatabaseSyncProvider(SyncProvider):
     def default_output_dir(self) -> str:
         return "databases"
 
-    def pre_sync(self, config: NaoConfig, output_path: Path) -> None:
-        cleanup_stale_databases(config.databases, output_path, verbose=True)
+    def pre_sync(self, config: NaoConfig, output_path: Path, options: SyncOptions | None = None) -> None:
+        options = options or SyncOptions()
+        manifest = SyncManifest.load(output_path)
+        cleanup_stale_databases(config.databases, output_path, verbose=True, manifest=manifest, dry_run=options.dry_run)
+        if manifest.loaded and not options.dry_run:
+            manifest.save()
+
+        catalog_path = output_path / CATALOG_FILENAME
+        if catalog_path.exists() and not options.dry_run:
+            with CatalogIndex(catalog_path) as catalog:
+                catalog.prune_databases({(db.type, db.get_database_name()) for db in config.databases})
 
     def get_items(self, config: NaoConfig) -> list[AnyDatabaseConfig]:
         return config.databases
 
-    def sync(self, items: list[Any], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[Any],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
         if not items:
             console.print("\n[dim]No databases configured[/dim]")
             return SyncResult(provider_name=self.name, items_synced=0)
 
+        options = options or SyncOptions()
+
         total_datasets = 0
         total_tables = 0
         total_removed = 0
@@ -212,33 +322,39 @@ class DatabaseSyncProvider(SyncProvider):
 
         sync_start = time.monotonic()
 
-        with Progress(
-            SpinnerColumn(style="dim"),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=30, style="dim", complete_style="cyan", finished_style="green"),
-            MofNCompleteColumn(),
-            TaskProgressColumn(),
-            TimeElapsedColumn(),
-            console=console,
-            transient=False,
-        ) as progress:
+        with (
+            Progress(
+                SpinnerColumn(style="dim"),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(bar_width=30, style="dim", complete_style="cyan", finished_style="green"),
+                MofNCompleteColumn(),
+                TaskProgressColumn(),
+                TimeElapsedColumn(),
+                console=console,
+                transient=False,
+            ) as progress,
+            CatalogIndex(output_path / CATALOG_FILENAME) as catalog,
+        ):
             for db in items:
                 try:
-                    state = sync_database(db, output_path, progress, project_path)
+                    state = sync_database(db, output_path, progress, project_path, catalog=catalog, options=options)
                     sync_states.append(state)
                     total_datasets += state.schemas_synced
                     total_tables += state.tables_synced
                 except Exception as e:
                     console.print(f"[bold red]✗[/bold red] Failed to sync {db.name}: {e}")
 
+        manifest = SyncManifest.load(output_path)
         for state in sync_states:
-            removed = cleanup_stale_paths(state, verbose=True)
+            removed = cleanup_stale_paths(state, verbose=True, manifest=manifest, dry_run=options.dry_run)
             total_removed += removed
+        if sync_states:
+            manifest.save()
 
         total_dur = _fmt_duration(time.monotonic() - sync_start)
         summary = f"{total_tables} tables across {total_datasets} datasets in {total_dur}"
         if total_removed > 0:
-            summary += f", {total_removed} stale removed"
+            summary += f", {total_removed} stale {'to remove' if options.dry_run else 'removed'}"
 
         return SyncResult(
             provider_name=self.name,
@@ -247,6 +363,7 @@ class DatabaseSyncProvider(SyncProvider):
                 "datasets": total_datasets,
                 "tables": total_tables,
                 "removed": total_removed,
+                "catalog": str(output_path / CATALOG_FILENAME),
             },
             summary=summary,
         )
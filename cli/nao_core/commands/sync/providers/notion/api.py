@@ -0,0 +1,206 @@
+"""Rate-limited access to the Notion API and concurrent page export."""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+from notion2md.config import Config
+from notion2md.convertor.block import BlockConvertor
+from notion_client import APIResponseError, Client
+
+# Notion allows an average of 3 requests per second per integration
+NOTION_REQUESTS_PER_SECOND = 3.0
+MAX_RETRIES = 5
+MAX_RETRY_DELAY = 30.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the average request rate.
+
+    Up to `capacity` requests may be sent back to back, after which callers
+    block until a token is refilled at `rate` tokens per second.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting for it to be refilled if the bucket is empty."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        # The token is reserved under the lock, so waiting outside keeps the order fair
+        if wait > 0:
+            self._sleep(wait)
+
+
+def _retry_after(error: APIResponseError) -> float | None:
+    headers = getattr(error, "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class NotionAPI:
+    """A Notion client shared by every page export of a sync.
+
+    All requests go through a token bucket and are retried with backoff when
+    Notion answers 429 (rate limited), honoring its Retry-After header.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        rate: float = NOTION_REQUESTS_PER_SECOND,
+        max_retries: int = MAX_RETRIES,
+        client: Any = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.client = client if client is not None else Client(auth=api_key)
+        self.limiter = TokenBucket(rate, sleep=sleep)
+        self.max_retries = max_retries
+        self._sleep = sleep
+
+    def call(self, fn: Callable[..., Any], **kwargs: Any) -> dict[str, Any]:
+        """Call a notion_client endpoint under the rate limit, retrying rate-limited requests."""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                return cast(dict[str, Any], fn(**kwargs))
+            except APIResponseError as e:
+                if getattr(e, "status", None) != 429 or attempt == self.max_retries:
+                    raise
+                delay = _retry_after(e)
+                self._sleep(min(delay if delay is not None else 2**attempt, MAX_RETRY_DELAY))
+        raise AssertionError("unreachable")
+
+    def retrieve_page(self, page_id: str) -> dict[str, Any]:
+        return self.call(self.client.pages.retrieve, page_id=page_id)
+
+    def get_children(self, parent_id: str) -> list[dict[str, Any]]:
+        """List all child blocks of a block or page, following pagination."""
+        return self._paginate(self.client.blocks.children.list, block_id=parent_id)
+
+    def query_database(self, database_id: str) -> list[dict[str, Any]]:
+        """List the pages (rows) of a database, following pagination."""
+        data_sources = getattr(self.client, "data_sources", None)
+        if data_sources is None:
+            # notion-client < 3 queries databases directly (Notion API before 2025-09-03)
+            return self._paginate(self.client.databases.query, database_id=database_id)
+
+        database = self.call(self.client.databases.retrieve, database_id=database_id)
+        rows: list[dict[str, Any]] = []
+        for source in database.get("data_sources", []):
+            rows.extend(self._paginate(data_sources.query, data_source_id=source["id"]))
+        return rows
+
+    def _paginate(self, fn: Callable[..., Any], **kwargs: Any) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        start_cursor = None
+        while True:
+            page_kwargs: dict[str, Any] = {**kwargs, "page_size": 100}
+            if start_cursor:
+                page_kwargs["start_cursor"] = start_cursor
+            resp = self.call(fn, **page_kwargs)
+            results.extend(resp["results"])
+            if not resp.get("has_more"):
+                return results
+            start_cursor = resp["next_cursor"]
+
+
+class _BlockTree:
+    """Prefetched block children, served to notion2md in place of its own client."""
+
+    def __init__(self, children: dict[str, list[dict[str, Any]]]):
+        self._children = children
+
+    def get_children(self, parent_id: str) -> list[dict[str, Any]]:
+        return self._children.get(parent_id, [])
+
+
+class NotionPageExporter:
+    """Exports Notion pages to markdown, fetching block children in parallel.
+
+    Blocks are fetched level by level: the children of every block of a level
+    are requested concurrently, then the prefetched tree is converted with
+    notion2md. The exporter is thread-safe and meant to be shared by all the
+    pages of a sync.
+    """
+
+    def __init__(self, api: NotionAPI, fetch_workers: int = 8):
+        self.api = api
+        self._executor = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="notion-fetch")
+
+    def __enter__(self) -> "NotionPageExporter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def fetch_blocks(self, page_id: str) -> dict[str, list[dict[str, Any]]]:
+        """Fetch the whole block tree of a page, keyed by parent block id."""
+        children: dict[str, list[dict[str, Any]]] = {}
+        level = [page_id]
+        while level:
+            for parent_id, blocks in zip(level, self._executor.map(self.api.get_children, level)):
+                children[parent_id] = blocks
+            # Child pages and databases are synced on their own, notion2md does not inline them
+            level = [b["id"] for parent_id in level for b in children[parent_id] if _has_inline_children(b)]
+        return children
+
+    def export(self, page_id: str) -> str:
+        """Convert a page to markdown."""
+        return self.convert(page_id, self.fetch_blocks(page_id))
+
+    def convert(self, page_id: str, tree: dict[str, list[dict[str, Any]]]) -> str:
+        """Convert a block tree fetched with `fetch_blocks` to markdown."""
+        convertor = BlockConvertor(Config(block_id=page_id), _BlockTree(tree))  # type: ignore[arg-type]
+        return convertor.to_string(tree[page_id])  # type: ignore[arg-type]
+
+
+def _has_inline_children(block: dict[str, Any]) -> bool:
+    return bool(block.get("has_children")) and block.get("type") not in ("child_page", "child_database")
+
+
+def child_links(tree: dict[str, list[dict[str, Any]]]) -> tuple[list[str], list[str]]:
+    """Find the child pages and child databases anywhere in a block tree.
+
+    Returns:
+        Tuple of (child page ids, child database ids)
+    """
+    pages: list[str] = []
+    databases: list[str] = []
+    for blocks in tree.values():
+        for block in blocks:
+            if block.get("type") == "child_page":
+                pages.append(normalize_id(block["id"]))
+            elif block.get("type") == "child_database":
+                databases.append(normalize_id(block["id"]))
+    return pages, databases
+
+
+def normalize_id(notion_id: str) -> str:
+    """Strip the dashes of a Notion UUID so ids compare equal to those parsed from URLs."""
+    return notion_id.replace("-", "").lower()
@@ -0,0 +1,124 @@
+"""On-disk cache of exported Notion pages, shared across runs.
+
+Both `nao sync` and template rendering (`nao.notion.page(...)`) go through the
+cache. An entry is served without any request while younger than the TTL;
+past that, it is still reused when the page's `last_edited_time` (one cheap
+metadata request) matches the cached one.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+NOTION_CACHE_DIR = Path(".nao") / "cache" / "notion"
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_SIZE_MB = 64
+
+
+@dataclass
+class CachedPage:
+    """An exported page: title, markdown body (without frontmatter) and child links."""
+
+    page_id: str
+    title: str
+    content: str
+    last_edited_time: str | None
+    children: list[str] = field(default_factory=list)
+    databases: list[str] = field(default_factory=list)
+    fetched_at: float = field(default_factory=time.time)
+
+
+class NotionPageCache:
+    """Thread-safe cache of exported pages, one JSON file per page.
+
+    The least recently used entries are evicted once the cache grows past
+    `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: dict[str, int] | None = None
+
+    @classmethod
+    def for_project(
+        cls, project_path: Path, ttl: float = DEFAULT_TTL_SECONDS, max_size_mb: int = DEFAULT_MAX_SIZE_MB
+    ) -> "NotionPageCache":
+        return cls(project_path / NOTION_CACHE_DIR, ttl=ttl, max_bytes=max_size_mb * 1024 * 1024)
+
+    def _path(self, page_id: str) -> Path:
+        return self.cache_dir / f"{page_id}.json"
+
+    def get(self, page_id: str, last_edited_time: str | None = None) -> CachedPage | None:
+        """Get a cached page.
+
+        Args:
+            page_id: Notion page ID.
+            last_edited_time: The page's current `last_edited_time`. When given,
+                the entry is returned if it was exported at that version,
+                whatever its age; otherwise only if it is younger than the TTL.
+        """
+        path = self._path(page_id)
+        try:
+            page = CachedPage(**json.loads(path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if last_edited_time is not None:
+            if page.last_edited_time != last_edited_time:
+                return None
+        elif time.time() - page.fetched_at > self.ttl:
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return page
+
+    def put(self, page: CachedPage) -> None:
+        """Store a page, evicting the least recently used entries if over the size limit."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(asdict(page))
+        path = self._path(page.page_id)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            sizes = self._load_sizes()
+            sizes[path.name] = len(data.encode())
+            if sum(sizes.values()) > self.max_bytes:
+                self._evict(sizes, keep=path.name)
+
+    def _load_sizes(self) -> dict[str, int]:
+        if self._sizes is None:
+            self._sizes = {p.name: p.stat().st_size for p in self.cache_dir.glob("*.json")}
+        return self._sizes
+
+    def _evict(self, sizes: dict[str, int], keep: str) -> None:
+        def last_used(name: str) -> float:
+            try:
+                return (self.cache_dir / name).stat().st_mtime
+            except OSError:
+                return 0.0
+
+        total = sum(sizes.values())
+        for name in sorted(sizes, key=last_used):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            (self.cache_dir / name).unlink(missing_ok=True)
+            total -= sizes.pop(name)
@@ -0,0 +1,129 @@
+"""Breadth-first crawl of Notion pages, child pages and database rows."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+from rich.console import Console
+
+from .api import NotionAPI, normalize_id
+
+console = Console()
+
+
+@dataclass
+class CrawlTarget:
+    """A page to visit, at a given depth below the configured roots."""
+
+    page_id: str
+    depth: int
+    page: dict[str, Any] | None = None
+    """Page object already returned by a database query, saving a retrieve call"""
+
+
+@dataclass
+class PageLinks:
+    """Child pages and databases found while visiting a page."""
+
+    pages: list[str] = field(default_factory=list)
+    databases: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CrawlStats:
+    visited: int = 0
+    failed: int = 0
+    skipped: int = 0
+    """Pages left out because the max_pages budget was reached"""
+
+
+class NotionCrawler:
+    """Visits configured pages and databases, then their children, level by level.
+
+    Pages of a level are visited concurrently. Every page and database is
+    visited at most once even when linked from several parents, and the crawl
+    stops descending past `max_depth` and scheduling past `max_pages`.
+
+    Configured pages and databases are at depth 0; rows of a database are at
+    the depth of the database, and child pages or databases of a page are one
+    level deeper than the page.
+    """
+
+    def __init__(self, api: NotionAPI, max_depth: int = 0, max_pages: int | None = None, jobs: int = 4):
+        self.api = api
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.jobs = max(1, jobs)
+
+    def crawl(
+        self,
+        pages: Sequence[str],
+        databases: Sequence[str],
+        visit: Callable[[CrawlTarget], PageLinks],
+        on_discovered: Callable[[int], None] | None = None,
+    ) -> CrawlStats:
+        """Crawl from the given page and database ids.
+
+        Args:
+            pages: Root page ids.
+            databases: Root database ids.
+            visit: Syncs one page and returns its links. Exceptions are counted
+                as failures and the page's children are not crawled.
+            on_discovered: Called with the number of newly scheduled pages.
+        """
+        stats = CrawlStats()
+        seen_pages: set[str] = set()
+        seen_databases: set[str] = set()
+        level = [CrawlTarget(normalize_id(p), 0) for p in pages]
+        level_databases = [(normalize_id(d), 0) for d in databases]
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            while level or level_databases:
+                level += self._expand_databases(executor, level_databases, seen_databases)
+
+                batch: list[CrawlTarget] = []
+                for target in level:
+                    if target.page_id in seen_pages:
+                        continue
+                    if self.max_pages is not None and len(seen_pages) >= self.max_pages:
+                        stats.skipped += 1
+                        continue
+                    seen_pages.add(target.page_id)
+                    batch.append(target)
+                if on_discovered and batch:
+                    on_discovered(len(batch))
+
+                level, level_databases = [], []
+                futures = {executor.submit(visit, target): target for target in batch}
+                for future in as_completed(futures):
+                    target = futures[future]
+                    try:
+                        links = future.result()
+                    except Exception:
+                        stats.failed += 1
+                        continue
+                    stats.visited += 1
+                    if target.depth < self.max_depth:
+                        level += [CrawlTarget(child, target.depth + 1) for child in links.pages]
+                        level_databases += [(db, target.depth + 1) for db in links.databases]
+
+        return stats
+
+    def _expand_databases(
+        self, executor: ThreadPoolExecutor, databases: list[tuple[str, int]], seen: set[str]
+    ) -> list[CrawlTarget]:
+        new = [(db, depth) for db, depth in dict(databases).items() if db not in seen]
+        seen.update(db for db, _ in new)
+        futures = {executor.submit(self.api.query_database, db): (db, depth) for db, depth in new}
+
+        targets: list[CrawlTarget] = []
+        for future in as_completed(futures):
+            db, depth = futures[future]
+            try:
+                rows = future.result()
+            except Exception as e:
+                console.print(f"[bold red]✗[/bold red] Failed to query Notion database {db}: {e}")
+                continue
+            targets += [CrawlTarget(normalize_id(row["id"]), depth, page=row) for row in rows]
+        return targets
@@ -1,16 +1,21 @@
 import re
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
-from notion2md.exporter.block import StringExporter
-from notion_client import Client
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 from nao_core.config.base import NaoConfig
 from nao_core.config.notion import NotionConfig
 
-from ..base import SyncProvider, SyncResult
+from ...cleanup import NotionManifest
+from ..base import SyncOptions, SyncProvider, SyncResult
+from .api import NotionAPI, NotionPageExporter, child_links
+from .cache import CachedPage, NotionPageCache
+from .crawler import CrawlTarget, NotionCrawler, PageLinks
 
 console = Console()
 
@@ -18,13 +23,22 @@ console = Console()
 NOTION_PAGE_ID_PATTERN = re.compile(r"[a-f0-9]{32}")
 
 
-def cleanup_stale_pages(synced_files: set[str], output_path: Path, verbose: bool = False) -> int:
+def cleanup_stale_pages(
+    synced_files: set[str],
+    output_path: Path,
+    verbose: bool = False,
+    dry_run: bool = False,
+    previous_files: set[str] | None = None,
+) -> int:
     """Remove markdown files that were not synced.
 
     Args:
         synced_files: Set of filenames that were synced in this run.
         output_path: Path where synced markdown files are stored.
         verbose: Whether to print cleanup messages.
+        dry_run: Only report the files that would be removed.
+        previous_files: Filenames recorded in the manifest by the previous sync.
+            When None (no manifest yet), the output folder is scanned instead.
 
     Returns:
         Number of stale files removed.
@@ -32,14 +46,20 @@ def cleanup_stale_pages(synced_files: set[str], output_path: Path, verbose: bool
     if not output_path.exists():
         return 0
 
+    if previous_files is None:
+        candidates = [p for p in output_path.iterdir() if p.is_file() and p.suffix == ".md"]
+    else:
+        candidates = [output_path / name for name in sorted(previous_files)]
+
     removed_count = 0
-    for file_path in output_path.iterdir():
-        if file_path.is_file() and file_path.suffix == ".md":
-            if file_path.name not in synced_files:
+    for file_path in candidates:
+        if file_path.name not in synced_files and file_path.exists():
+            if not dry_run:
                 file_path.unlink()
-                removed_count += 1
-                if verbose:
-                    console.print(f"  [dim red]removing stale page:[/dim red] {file_path.name}")
+            removed_count += 1
+            if verbose:
+                action = "would remove" if dry_run else "removing"
+                console.print(f"  [dim red]{action} stale page:[/dim red] {file_path.name}")
 
     return removed_count
 
@@ -67,9 +87,8 @@ def extract_page_id(page_url: str) -> str:
     raise ValueError(f"Could not extract Notion page ID from: {page_url}")
 
 
-def get_page_title(client: Client, page_id: str) -> str:
-    """Get the title of a Notion page."""
-    page = cast(dict[str, Any], client.pages.retrieve(page_id=page_id))
+def page_title(page: dict[str, Any], page_id: str) -> str:
+    """Get the title of a retrieved Notion page object."""
     properties = page.get("properties", {})
 
     # Try common title property names
@@ -81,30 +100,46 @@ def get_page_title(client: Client, page_id: str) -> str:
                 if title_array:
                     return "".join(t.get("plain_text", "") for t in title_array)
 
+    # Database rows can name their title property anything
+    for title_prop in properties.values():
+        if isinstance(title_prop, dict) and title_prop.get("type") == "title" and title_prop.get("title"):
+            return "".join(t.get("plain_text", "") for t in title_prop["title"])
+
     # Fallback to page ID if no title found
     return page_id
 
 
-def get_page_as_markdown(page_url: str, api_key: str) -> tuple[str, str]:
+def get_page_as_markdown(page_url: str, api_key: str, exporter: NotionPageExporter | None = None) -> tuple[str, str]:
     """Fetch a Notion page and convert it to markdown.
 
+    Args:
+        page_url: Notion page URL or ID.
+        api_key: Notion integration token.
+        exporter: Shared exporter to reuse its client and rate limit; a
+            dedicated one is created when omitted.
+
     Returns:
         Tuple of (title, markdown_content)
     """
+    if exporter is None:
+        with NotionPageExporter(NotionAPI(api_key)) as dedicated:
+            return get_page_as_markdown(page_url, api_key, dedicated)
+
     page_id = extract_page_id(page_url)
 
     # Get page title for the filename
-    client = Client(auth=api_key)
-    title = get_page_title(client, page_id)
+    title = page_title(exporter.api.retrieve_page(page_id), page_id)
 
-    # Export to markdown string using notion2md
-    md_exporter = StringExporter(block_id=page_id, token=api_key)
-    markdown = md_exporter.export()
+    # Export to markdown string, fetching nested blocks in parallel
+    return title, render_page(page_id, title, exporter.export(page_id))
 
+
+def render_page(page_id: str, title: str, markdown: str) -> str:
+    """Add the frontmatter to an exported page."""
     # Strip images since we can't read them
     markdown = strip_images(markdown)
 
-    content = f"""---
+    return f"""---
 title: {title}
 id: {page_id}
 ---
@@ -112,7 +147,173 @@ id: {page_id}
 {markdown}
 """
 
-    return title, content
+
+def page_filename(title: str) -> str:
+    """Get the markdown filename for a page title."""
+    safe_title = re.sub(r"[^\w\s-]", "", title).strip().replace(" ", "-").lower()
+    return f"{safe_title}.md"
+
+
+def export_page(
+    page_id: str,
+    exporter: NotionPageExporter,
+    cache: NotionPageCache | None = None,
+    page: dict[str, Any] | None = None,
+) -> CachedPage:
+    """Export a page to markdown, reusing the cached export of its current version.
+
+    Args:
+        page_id: Notion page ID.
+        exporter: Page exporter.
+        cache: Cross-run page cache.
+        page: Page object, when already fetched.
+    """
+    if page is None:
+        page = exporter.api.retrieve_page(page_id)
+    last_edited_time = page.get("last_edited_time")
+
+    if cache is not None and last_edited_time:
+        cached = cache.get(page_id, last_edited_time)
+        if cached is not None:
+            # Still current: restart its TTL
+            cached.fetched_at = time.time()
+            cache.put(cached)
+            return cached
+
+    tree = exporter.fetch_blocks(page_id)
+    children, databases = child_links(tree)
+    exported = CachedPage(
+        page_id=page_id,
+        title=page_title(page, page_id),
+        content=strip_images(exporter.convert(page_id, tree)),
+        last_edited_time=last_edited_time,
+        children=children,
+        databases=databases,
+    )
+    if cache is not None:
+        cache.put(exported)
+    return exported
+
+
+class FilenameRegistry:
+    """Assigns each synced page a distinct markdown filename.
+
+    Pages are named after their title. When several pages share a title, the
+    filename goes to the page that had it in the previous sync, otherwise to
+    the smallest page id, and the other pages get their id appended. Pages
+    are synced concurrently, so a filename claimed by a page out of that
+    order is provisional until `settle` moves it to its owner.
+    """
+
+    def __init__(self, previous: dict[str, dict[str, Any]] | None = None):
+        # Filenames from the previous sync, kept by their page whenever it claims them again
+        self._reserved = {entry["file"]: page_id for page_id, entry in (previous or {}).items() if entry.get("file")}
+        self._owners: dict[str, str] = {}
+        self._claimants: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, title: str, page_id: str) -> str:
+        filename = page_filename(title)
+        with self._lock:
+            self._claimants.setdefault(filename, set()).add(page_id)
+            if self._owners.setdefault(filename, self._reserved.get(filename, page_id)) != page_id:
+                filename = _suffixed(filename, page_id)
+        return filename
+
+    def settle(self, page_ids: set[str]) -> dict[str, tuple[str, str]]:
+        """Find the pages holding a filename that isn't theirs once every page has claimed one.
+
+        Args:
+            page_ids: Pages in the manifest of this sync, the only ones competing for filenames.
+
+        Returns:
+            The claimed and the final filename of each page to rename.
+        """
+        moves: dict[str, tuple[str, str]] = {}
+        for filename, claimants in self._claimants.items():
+            claimants = claimants & page_ids
+            reserved = self._reserved.get(filename)
+            owner = reserved if reserved in claimants else min(claimants, default=None)
+            for page_id in claimants:
+                claimed = filename if self._owners[filename] == page_id else _suffixed(filename, page_id)
+                final = filename if page_id == owner else _suffixed(filename, page_id)
+                if claimed != final:
+                    moves[page_id] = (claimed, final)
+        return moves
+
+
+def _suffixed(filename: str, page_id: str) -> str:
+    return f"{filename.removesuffix('.md')}-{page_id[:8]}.md"
+
+
+@dataclass
+class PageSyncResult:
+    """Outcome of syncing one Notion page."""
+
+    page_id: str
+    title: str
+    file: str
+    last_edited_time: str | None
+    changed: bool
+    links: PageLinks = field(default_factory=PageLinks)
+
+    def manifest_entry(self) -> dict[str, Any]:
+        return {
+            "file": self.file,
+            "title": self.title,
+            "last_edited_time": self.last_edited_time or "",
+            "children": self.links.pages,
+            "databases": self.links.databases,
+        }
+
+
+def sync_page(
+    page_id: str,
+    output_path: Path,
+    exporter: NotionPageExporter,
+    previous: dict[str, Any] | None = None,
+    page: dict[str, Any] | None = None,
+    filenames: FilenameRegistry | None = None,
+    cache: NotionPageCache | None = None,
+) -> PageSyncResult:
+    """Export a page unless it is unchanged since the previous sync.
+
+    The page metadata is retrieved (one request, unless already known from a
+    database query); the block export is skipped when its `last_edited_time`
+    matches the manifest entry and the file is still on disk. The child pages
+    and databases of an unchanged page are taken from the manifest.
+
+    Args:
+        page_id: Notion page ID.
+        output_path: Path where synced markdown files are stored.
+        exporter: Shared page exporter.
+        previous: Manifest entry of the page from the previous sync.
+        page: Page object, when already fetched.
+        filenames: Registry keeping filenames distinct across the sync.
+        cache: Cross-run page cache, reused when the page was exported at its
+            current `last_edited_time` (e.g. by template rendering).
+    """
+    if page is None:
+        page = exporter.api.retrieve_page(page_id)
+    title = page_title(page, page_id)
+    filename = filenames.claim(title, page_id) if filenames else page_filename(title)
+    last_edited_time = page.get("last_edited_time")
+
+    unchanged = (
+        previous is not None
+        and last_edited_time is not None
+        and previous.get("last_edited_time") == last_edited_time
+        and previous.get("file") == filename
+        and (output_path / filename).exists()
+    )
+    if unchanged:
+        links = PageLinks(list(previous.get("children", [])), list(previous.get("databases", [])))  # type: ignore[union-attr]
+    else:
+        exported = export_page(page_id, exporter, cache, page)
+        links = PageLinks(exported.children, exported.databases)
+        (output_path / filename).write_text(render_page(page_id, title, exported.content))
+
+    return PageSyncResult(page_id, title, filename, last_edited_time, changed=not unchanged, links=links)
 
 
 class NotionSyncProvider(SyncProvider):
@@ -133,13 +334,20 @@ class NotionSyncProvider(SyncProvider):
     def get_items(self, config: NaoConfig) -> list[NotionConfig]:
         return [config.notion] if config.notion else []
 
-    def sync(self, items: list[NotionConfig], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[NotionConfig],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
         """Sync Notion pages to local filesystem as markdown files.
 
         Args:
             items: Notion configuration with pages to sync.
             output_path: Path where synced markdown files should be written.
             project_path: Path to the nao project root.
+            options: Run-wide sync options.
 
         Returns:
             SyncResult with statistics about what was synced.
@@ -148,58 +356,144 @@ class NotionSyncProvider(SyncProvider):
             console.print("\n[dim]No Notion pages configured[/dim]")
             return SyncResult(provider_name=self.name, items_synced=0, summary="No Notion configurations configured")
 
+        options = options or SyncOptions()
         notion_config = items[0]
         output_path.mkdir(parents=True, exist_ok=True)
-        pages_synced = 0
-        synced_pages: list[str] = []
+        manifest = NotionManifest.load(output_path)
+        previous_files = manifest.files() if manifest.loaded else None
+        results: list[PageSyncResult] = []
+        failed = 0
+        pages: dict[str, dict[str, Any]] = {}
         synced_files: set[str] = set()
+        filenames = FilenameRegistry(manifest.pages)
+        lock = threading.Lock()
+        cache = (
+            NotionPageCache.for_project(project_path, notion_config.cache_ttl, notion_config.cache_max_size_mb)
+            if project_path is not None
+            else None
+        )
 
         console.print(f"\n[bold cyan]{self.emoji}  Syncing {self.name}[/bold cyan]")
         console.print(f"[dim]Location:[/dim] {output_path.absolute()}\n")
 
         api_key = notion_config.api_key
-        total_pages = len(notion_config.pages)
-
-        with Progress(
-            SpinnerColumn(style="dim"),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=30, style="dim", complete_style="cyan", finished_style="green"),
-            TaskProgressColumn(),
-            console=console,
-            transient=False,
-        ) as progress:
-            task = progress.add_task("Syncing pages", total=total_pages)
-
-            for page_url in notion_config.pages:
+        root_pages = _parse_ids(notion_config.pages, "page")
+        root_databases = _parse_ids(notion_config.databases, "database")
+
+        with (
+            Progress(
+                SpinnerColumn(style="dim"),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(bar_width=30, style="dim", complete_style="cyan", finished_style="green"),
+                TaskProgressColumn(),
+                console=console,
+                transient=False,
+            ) as progress,
+            NotionPageExporter(NotionAPI(api_key)) as exporter,
+        ):
+            task = progress.add_task("Syncing pages", total=0)
+            total_pages = 0
+
+            def discovered(count: int) -> None:
+                nonlocal total_pages
+                total_pages += count
+                progress.update(task, total=total_pages)
+
+            def visit(target: CrawlTarget) -> PageLinks:
+                nonlocal failed
+                previous = manifest.pages.get(target.page_id)
                 try:
-                    title, markdown = get_page_as_markdown(page_url, api_key)
-
-                    # Sanitize title for filename
-                    safe_title = re.sub(r"[^\w\s-]", "", title).strip().replace(" ", "-").lower()
-                    filename = f"{safe_title}.md"
-
-                    with open(output_path / filename, "w") as f:
-                        f.write(markdown)
-
-                    pages_synced += 1
-                    synced_pages.append(title)
-                    synced_files.add(filename)
-                    progress.update(task, advance=1, description=f"Synced: {title}")
+                    result = sync_page(target.page_id, output_path, exporter, previous, target.page, filenames, cache)
                 except Exception as e:
-                    console.print(f"[bold red]✗[/bold red] Failed to sync page {page_url}: {e}")
+                    console.print(f"[bold red]✗[/bold red] Failed to sync page {target.page_id}: {e}")
                     progress.update(task, advance=1)
+                    with lock:
+                        failed += 1
+                        # Keep the previous export of a page that failed this time
+                        if previous is not None:
+                            pages[target.page_id] = previous
+                            synced_files.add(previous["file"])
+                    raise
+
+                with lock:
+                    results.append(result)
+                    pages[result.page_id] = result.manifest_entry()
+                    synced_files.add(result.file)
+                status = "Synced" if result.changed else "Unchanged"
+                progress.update(task, advance=1, description=f"{status}: {result.title}")
+                return result.links
+
+            # Pages are exported concurrently; the shared exporter keeps requests under Notion's rate limit
+            crawler = NotionCrawler(
+                exporter.api, max_depth=notion_config.max_depth, max_pages=notion_config.max_pages, jobs=options.jobs
+            )
+            stats = crawler.crawl(root_pages, root_databases, visit, on_discovered=discovered)
+
+        # Pages claimed their filenames in completion order: give contested ones to their owner
+        moves = filenames.settle(set(pages))
+        moved = [r for r in results if r.page_id in moves]
+        _rename_files(output_path, [moves[r.page_id] for r in moved])
+        for result in moved:
+            result.file = moves[result.page_id][1]
+            pages[result.page_id] = result.manifest_entry()
+        synced_files = {entry["file"] for entry in pages.values()}
 
         # Clean up stale pages
-        removed_count = cleanup_stale_pages(synced_files, output_path, verbose=True)
+        removed_count = cleanup_stale_pages(
+            synced_files, output_path, verbose=True, dry_run=options.dry_run, previous_files=previous_files
+        )
+
+        if options.dry_run:
+            # Stale files are still on disk: keep their entries so a later real run removes them,
+            # and without a manifest yet, let that run scan the output folder as this one did
+            for page_id, entry in manifest.pages.items():
+                pages.setdefault(page_id, entry)
+        if manifest.loaded or not options.dry_run:
+            manifest.pages = pages
+            manifest.save()
 
         # Build summary
+        pages_synced = len(results)
+        pages_unchanged = sum(not r.changed for r in results)
         summary = f"{pages_synced} pages synced as markdown"
+        if pages_unchanged > 0:
+            summary += f" ({pages_unchanged} unchanged)"
+        if stats.skipped > 0:
+            summary += f", {stats.skipped} over the max_pages budget"
         if removed_count > 0:
             summary += f", {removed_count} stale removed"
 
         return SyncResult(
             provider_name=self.name,
             items_synced=pages_synced,
-            details={"pages": synced_pages, "removed": removed_count},
+            details={
+                "pages": [r.title for r in results],
+                "unchanged": pages_unchanged,
+                "failed": failed,
+                "skipped": stats.skipped,
+                "removed": removed_count,
+            },
             summary=summary,
         )
+
+
+def _rename_files(output_path: Path, renames: list[tuple[str, str]]) -> None:
+    # Through temporary names, as two pages may swap filenames
+    staged = []
+    for source, target in renames:
+        if (output_path / source).exists():
+            staging = output_path / f".{source}.tmp"
+            (output_path / source).replace(staging)
+            staged.append((staging, output_path / target))
+    for staging, target in staged:
+        staging.replace(target)
+
+
+def _parse_ids(urls: list[str], kind: str) -> list[str]:
+    ids = []
+    for url in urls:
+        try:
+            ids.append(extract_page_id(url))
+        except ValueError as e:
+            console.print(f"[bold red]✗[/bold red] Skipping Notion {kind}: {e}")
+    return ids
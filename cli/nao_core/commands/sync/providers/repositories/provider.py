@@ -1,6 +1,11 @@
 """Repository sync provider implementation."""
 
+import json
 import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
@@ -10,75 +15,212 @@ from nao_core.commands.sync.cleanup import cleanup_stale_repos
 from nao_core.config import NaoConfig
 from nao_core.config.repos import RepoConfig
 
-from ..base import SyncProvider, SyncResult
+from ..base import SyncOptions, SyncProvider, SyncResult
 
 console = Console()
 
+STATUSES = ("cloned", "updated", "unchanged", "failed")
+# Checkout options a clone was last synced with, kept inside its .git directory
+CHECKOUT_CONFIG_FILENAME = "nao-checkout.json"
 
-def clone_or_pull_repo(repo: RepoConfig, base_path: Path) -> bool:
-    """Clone a repository if it doesn't exist, or pull latest changes if it does.
+
+@dataclass
+class RepoSyncResult:
+    """Outcome of syncing one repository."""
+
+    name: str
+    status: str
+    """One of STATUSES"""
+    seconds: float
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.status != "failed"
+
+
+def _clone_command(repo: RepoConfig, repo_path: Path) -> list[str]:
+    """Build the `git clone` command, honoring shallow, partial and sparse options."""
+    cmd = ["git", "clone"]
+    if repo.depth:
+        cmd.extend(["--depth", str(repo.depth)])
+    if repo.filter:
+        cmd.extend(["--filter", repo.filter])
+    if repo.sparse_paths:
+        cmd.append("--sparse")
+    if repo.branch:
+        cmd.extend(["-b", repo.branch])
+    cmd.extend([repo.url, str(repo_path)])
+    return cmd
+
+
+def _apply_sparse_checkout(repo: RepoConfig, repo_path: Path) -> bool:
+    """Restrict the working tree to the configured sparse paths."""
+    result = subprocess.run(
+        ["git", "sparse-checkout", "set", "--no-cone", *repo.sparse_paths],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        console.print(f"  [yellow]⚠[/yellow] Failed to set sparse paths for {repo.name}: {result.stderr.strip()}")
+        return False
+    return True
+
+
+def _git(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=False)
+
+
+def _remote_sha(repo: RepoConfig, repo_path: Path) -> str | None:
+    """Get the commit the remote branch (or remote HEAD) points to, without fetching."""
+    ref = f"refs/heads/{repo.branch}" if repo.branch else "HEAD"
+    result = _git(["ls-remote", "origin", ref], repo_path)
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.split()[0]
+
+
+def _local_sha(repo_path: Path) -> str | None:
+    result = _git(["rev-parse", "HEAD"], repo_path)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _checkout_config(repo: RepoConfig) -> dict[str, Any]:
+    """Options shaping the working tree, compared across syncs to detect config changes."""
+    return {"branch": repo.branch, "depth": repo.depth, "filter": repo.filter, "sparse_paths": repo.sparse_paths}
+
+
+def _read_checkout_config(repo_path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads((repo_path / ".git" / CHECKOUT_CONFIG_FILENAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_checkout_config(repo: RepoConfig, repo_path: Path) -> None:
+    git_dir = repo_path / ".git"
+    if git_dir.is_dir():
+        (git_dir / CHECKOUT_CONFIG_FILENAME).write_text(json.dumps(_checkout_config(repo)))
+
+
+def _update_repo(repo: RepoConfig, repo_path: Path, switch_branch: bool = False) -> str | None:
+    """Fetch the remote ref and fast-forward the working tree to it.
+
+    A configured branch is fetched with an explicit refspec, so single-branch
+    (e.g. shallow) clones can switch to a branch they weren't cloned with; the
+    local branch is then (re)created from it when `switch_branch` is set.
+    Shallow clones have no common history with the fetched commit, so they are
+    reset to it instead of merged.
+
+    Returns:
+            None on success, the git error message otherwise
+    """
+    fetch = ["fetch", "origin"]
+    if repo.depth:
+        fetch.extend(["--depth", str(repo.depth)])
+    if repo.branch:
+        fetch.append(f"+refs/heads/{repo.branch}:refs/remotes/origin/{repo.branch}")
+    result = _git(fetch, repo_path)
+    if result.returncode != 0:
+        return result.stderr.strip()
+
+    if repo.branch:
+        if switch_branch:
+            # The clone may not have that branch yet, or a stale one from an earlier switch
+            checkout = ["checkout", "-B", repo.branch, f"refs/remotes/origin/{repo.branch}"]
+        else:
+            checkout = ["checkout", repo.branch]
+        result = _git(checkout, repo_path)
+        if result.returncode != 0:
+            return result.stderr.strip()
+
+    update = ["reset", "--hard", "FETCH_HEAD"] if repo.depth else ["merge", "--ff-only", "FETCH_HEAD"]
+    result = _git(update, repo_path)
+    if result.returncode != 0:
+        return result.stderr.strip()
+    return None
+
+
+def clone_or_pull_repo(repo: RepoConfig, base_path: Path) -> RepoSyncResult:
+    """Clone a repository if it doesn't exist, or bring it up to date with its remote.
+
+    Existing repositories are compared against the remote with `git ls-remote`
+    first and left untouched when the local HEAD already matches and the
+    checkout options (branch, depth, filter, sparse paths) didn't change since
+    the last sync. A clone without recorded options is assumed to match,
+    unless sparse paths are configured.
 
     Args:
             repo: Repository configuration
             base_path: Base path where repositories are stored
 
     Returns:
-            True if successful, False otherwise
+            RepoSyncResult with the outcome and duration
     """
     repo_path = base_path / repo.name
+    start = time.monotonic()
+
+    def done(status: str, error: str | None = None) -> RepoSyncResult:
+        return RepoSyncResult(repo.name, status, time.monotonic() - start, error)
 
     try:
         if repo_path.exists():
-            # Repository exists - pull latest changes
-            console.print(f"  [dim]Pulling latest changes for[/dim] {repo.name}")
-
-            result = subprocess.run(
-                ["git", "pull"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-            if result.returncode != 0:
-                console.print(f"  [yellow]⚠[/yellow] Failed to pull {repo.name}: {result.stderr.strip()}")
-                return False
-
-            # If branch is specified, checkout that branch
-            if repo.branch:
-                subprocess.run(
-                    ["git", "checkout", repo.branch],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-
-        else:
-            # Repository doesn't exist - clone it
-            console.print(f"  [dim]Cloning[/dim] {repo.name}")
-
-            cmd = ["git", "clone"]
-            if repo.branch:
-                cmd.extend(["-b", repo.branch])
-            cmd.extend([repo.url, str(repo_path)])
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-            if result.returncode != 0:
-                console.print(f"  [yellow]⚠[/yellow] Failed to clone {repo.name}: {result.stderr.strip()}")
-                return False
-
-        return True
+            previous = _read_checkout_config(repo_path)
+            config_changed = previous != _checkout_config(repo) if previous is not None else bool(repo.sparse_paths)
+            remote_sha = _remote_sha(repo, repo_path)
+            up_to_date = remote_sha is not None and remote_sha == _local_sha(repo_path)
+            if up_to_date and not config_changed:
+                return done("unchanged")
+
+            # A new branch or depth needs a fetch even when HEAD matches the remote
+            branch_changed = previous is not None and previous["branch"] != repo.branch
+            ref_changed = branch_changed or (previous is not None and previous["depth"] != repo.depth)
+            if not up_to_date or ref_changed:
+                console.print(f"  [dim]Fetching latest changes for[/dim] {repo.name}")
+
+                error = _update_repo(repo, repo_path, switch_branch=branch_changed)
+                if error is not None:
+                    console.print(f"  [yellow]⚠[/yellow] Failed to update {repo.name}: {error}")
+                    return done("failed", error)
+
+            if repo.sparse_paths:
+                if not _apply_sparse_checkout(repo, repo_path):
+                    return done("failed", "sparse-checkout failed")
+            elif previous is not None and previous["sparse_paths"]:
+                result = _git(["sparse-checkout", "disable"], repo_path)
+                if result.returncode != 0:
+                    return done("failed", result.stderr.strip())
+
+            _write_checkout_config(repo, repo_path)
+            return done("updated")
+
+        # Repository doesn't exist - clone it
+        console.print(f"  [dim]Cloning[/dim] {repo.name}")
+
+        result = subprocess.run(
+            _clone_command(repo, repo_path),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        if result.returncode != 0:
+            console.print(f"  [yellow]⚠[/yellow] Failed to clone {repo.name}: {result.stderr.strip()}")
+            return done("failed", result.stderr.strip())
+
+        if repo.sparse_paths and not _apply_sparse_checkout(repo, repo_path):
+            return done("failed", "sparse-checkout failed")
+
+        _write_checkout_config(repo, repo_path)
+        return done("cloned")
 
     except Exception as e:
         console.print(f"  [yellow]⚠[/yellow] Error syncing {repo.name}: {e}")
-        return False
+        return done("failed", str(e))
 
 
 class RepositorySyncProvider(SyncProvider):
@@ -96,23 +238,30 @@ class RepositorySyncProvider(SyncProvider):
     def default_output_dir(self) -> str:
         return "repos"
 
-    def pre_sync(self, config: NaoConfig, output_path: Path) -> None:
+    def pre_sync(self, config: NaoConfig, output_path: Path, options: SyncOptions | None = None) -> None:
         """
         Always run before syncing.
         """
-
-        cleanup_stale_repos(config.repos, output_path, verbose=True)
+        options = options or SyncOptions()
+        cleanup_stale_repos(config.repos, output_path, verbose=True, dry_run=options.dry_run)
 
     def get_items(self, config: NaoConfig) -> list[RepoConfig]:
         return config.repos
 
-    def sync(self, items: list[Any], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[Any],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
         """Sync all configured repositories.
 
         Args:
                 items: List of repository configurations
                 output_path: Base path where repositories are stored
                 project_path: Path to the nao project root (unused for repos)
+                options: Run-wide sync options (`jobs` bounds concurrent clones/pulls)
 
         Returns:
                 SyncResult with number of successfully synced repositories
@@ -120,15 +269,30 @@ class RepositorySyncProvider(SyncProvider):
         if not items:
             return SyncResult(provider_name=self.name, items_synced=0)
 
+        options = options or SyncOptions()
         output_path.mkdir(parents=True, exist_ok=True)
-        success_count = 0
+        results: list[RepoSyncResult] = []
 
         console.print(f"\n[bold cyan]{self.emoji} Syncing {self.name}[/bold cyan]")
         console.print(f"[dim]Location:[/dim] {output_path.absolute()}\n")
 
-        for repo in items:
-            if clone_or_pull_repo(repo, output_path):
-                success_count += 1
-                console.print(f"  [green]✓[/green] {repo.name}")
-
-        return SyncResult(provider_name=self.name, items_synced=success_count)
+        with ThreadPoolExecutor(max_workers=max(1, min(options.jobs, len(items)))) as executor:
+            futures = [executor.submit(clone_or_pull_repo, repo, output_path) for repo in items]
+            for future in as_completed(futures):
+                repo_result = future.result()
+                results.append(repo_result)
+                if repo_result.success:
+                    console.print(
+                        f"  [green]✓[/green] {repo_result.name} [dim]{repo_result.status} "
+                        f"in {repo_result.seconds:.1f}s[/dim]"
+                    )
+
+        counts = Counter(r.status for r in results)
+        summary = ", ".join(f"{counts[status]} {status}" for status in STATUSES if counts[status])
+
+        return SyncResult(
+            provider_name=self.name,
+            items_synced=sum(r.success for r in results),
+            details={"repos": [asdict(r) for r in sorted(results, key=lambda r: r.name)]},
+            summary=summary,
+        )
@@ -2,10 +2,9 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import yaml
-from ibis import BaseBackend
 from pydantic import BaseModel, Field, ValidationError, model_validator
 from rich.console import Console
 
@@ -19,6 +18,9 @@ from .repos import RepoConfig
 from .skills import SkillsConfig
 from .slack import SlackConfig
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 
 class NaoConfigError(Exception):
     """Raised when nao config loading fails."""
@@ -225,14 +227,14 @@ class NaoConfig(BaseModel):
         data = yaml.safe_load(content)
         return cls.model_validate(data)
 
-    def get_connection(self, name: str) -> BaseBackend:
+    def get_connection(self, name: str) -> "BaseBackend":
         """Get an Ibis connection by database name."""
         for db in self.databases:
             if db.name == name:
                 return db.connect()
         raise ValueError(f"Database '{name}' not found in configuration")
 
-    def get_all_connections(self) -> dict[str, BaseBackend]:
+    def get_all_connections(self) -> dict[str, "BaseBackend"]:
         """Get all Ibis connections as a dict keyed by name."""
         return {db.name: db.connect() for db in self.databases}
 
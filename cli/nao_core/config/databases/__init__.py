@@ -3,7 +3,7 @@ from typing import Annotated, Union
 from pydantic import Discriminator, Tag
 
 from .athena import AthenaConfig
-from .base import DatabaseAccessor, DatabaseConfig, DatabaseType
+from .base import ConnectionDiagnostics, DatabaseAccessor, DatabaseConfig, DatabaseType
 from .bigquery import BigQueryConfig
 from .databricks import DatabricksConfig
 from .duckdb import DuckDBConfig
@@ -71,6 +71,7 @@ __all__ = [
     "AnyDatabaseConfig",
     "AthenaConfig",
     "BigQueryConfig",
+    "ConnectionDiagnostics",
     "DATABASE_CONFIG_CLASSES",
     "DatabaseAccessor",
     "DatabaseConfig",
@@ -1,13 +1,16 @@
-from typing import Literal
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
 
-import ibis
-from ibis import BaseBackend
 from pydantic import Field
 
 from nao_core.ui import ask_select, ask_text
 
 from .base import DatabaseConfig
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 
 class AthenaConfig(DatabaseConfig):
     """Athena-specific configuration."""
@@ -62,6 +65,8 @@ class AthenaConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis Athena connection."""
+        import ibis
+
         kwargs = {
             "s3_staging_dir": self.s3_staging_dir,
             "region_name": self.region_name,
@@ -91,7 +96,7 @@ class AthenaConfig(DatabaseConfig):
 
         list_databases = getattr(conn, "list_databases", None)
         if list_databases:
-            return list_databases()
+            return [s for s in list_databases() if self.schema_matches(s)]
         return []
 
     def check_connection(self) -> tuple[bool, str]:
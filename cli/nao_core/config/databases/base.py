@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-import fnmatch
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING, ClassVar
 
-import pandas as pd
-import questionary
-from ibis import BaseBackend
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .patterns import LIKE_ESCAPE, PatternMatcher
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import questionary
+    from ibis import BaseBackend
 
 
 class DatabaseType(str, Enum):
@@ -25,9 +31,23 @@ class DatabaseType(str, Enum):
     @classmethod
     def choices(cls) -> list[questionary.Choice]:
         """Get questionary choices for all database types."""
+        import questionary
+
         return [questionary.Choice(db.value.capitalize(), value=db.value) for db in cls]
 
 
+@dataclass
+class ConnectionDiagnostics:
+    """Outcome of a connection diagnostic, with latencies in seconds."""
+
+    success: bool
+    message: str
+    connect_seconds: float | None = None
+    query_seconds: float | None = None
+    """Round-trip of a trivial query on the open connection"""
+    server_version: str | None = None
+
+
 class DatabaseAccessor(str, Enum):
     """Available default template accessors for database sync."""
 
@@ -55,6 +75,14 @@ class DatabaseConfig(BaseModel, ABC):
         description="Which default templates to render per table (e.g., ['columns', 'description']). Defaults to all.",
     )
 
+    PING_QUERY: ClassVar[str] = "SELECT 1"
+    """Trivial query timed by diagnostics, overridden by backends that can't run `SELECT 1`"""
+
+    case_sensitive_patterns: ClassVar[bool] = True
+    """Whether include/exclude patterns match identifiers case-sensitively"""
+
+    _pattern_matcher: PatternMatcher | None = PrivateAttr(default=None)
+
     @classmethod
     @abstractmethod
     def promptConfig(cls) -> DatabaseConfig:
@@ -66,9 +94,14 @@ class DatabaseConfig(BaseModel, ABC):
         """Create an Ibis connection for this database."""
         ...
 
-    def execute_sql(self, sql: str) -> pd.DataFrame:
-        """Execute arbitrary SQL and return results as a DataFrame."""
-        conn = self.connect()
+    def execute_sql(self, sql: str, conn: BaseBackend | None = None) -> pd.DataFrame:
+        """Execute arbitrary SQL and return results as a DataFrame.
+
+        Args:
+            sql: The SQL to run.
+            conn: An open connection to reuse; a new one is created if omitted.
+        """
+        conn = conn or self.connect()
         cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
 
         if hasattr(cursor, "fetchdf"):
@@ -76,6 +109,8 @@ class DatabaseConfig(BaseModel, ABC):
         if hasattr(cursor, "to_dataframe"):
             return cursor.to_dataframe()
 
+        import pandas as pd
+
         columns: list[str] = [desc[0] for desc in cursor.description]
         return pd.DataFrame(cursor.fetchall(), columns=columns)  # type: ignore[arg-type]
 
@@ -89,21 +124,40 @@ class DatabaseConfig(BaseModel, ABC):
         Returns:
             True if the table should be included, False if excluded
         """
-        full_name = f"{schema}.{table}"
+        return self.pattern_matcher().matches(schema, table)
+
+    def schema_matches(self, schema: str) -> bool:
+        """Check if a schema could contain any table matching the include/exclude patterns.
 
-        # If include patterns exist, table must match at least one
-        if self.include:
-            included = any(fnmatch.fnmatch(full_name, pattern) for pattern in self.include)
-            if not included:
-                return False
+        Used to skip listing tables of schemas that no include pattern can match.
+        """
+        return self.pattern_matcher().schema_matches(schema)
 
-        # If exclude patterns exist, table must not match any
-        if self.exclude:
-            excluded = any(fnmatch.fnmatch(full_name, pattern) for pattern in self.exclude)
-            if excluded:
-                return False
+    def schema_filter_sql(self, column: str, operator: str = "LIKE") -> str:
+        """Build an SQL predicate restricting `column` to schemas the include patterns can match.
 
-        return True
+        Backends append it to their schema listing query so unmatched schemas are
+        filtered by the warehouse. The predicate may match a superset of the
+        schemas; `schema_matches` remains the source of truth.
+
+        Returns:
+            A predicate such as "(nspname LIKE 'analytics%' ESCAPE '!')", or "" if
+            nothing can be pushed down.
+        """
+        likes = self.pattern_matcher().schema_like_patterns()
+        if not likes:
+            return ""
+        quoted = [like.replace("'", "''") for like in likes]
+        clauses = [f"{column} {operator} '{like}' ESCAPE '{LIKE_ESCAPE}'" for like in quoted]
+        return f"({' OR '.join(clauses)})"
+
+    def pattern_matcher(self) -> PatternMatcher:
+        """Get the compiled include/exclude matcher, recompiling it if the patterns changed."""
+        matcher = self._pattern_matcher
+        if matcher is None or not matcher.is_for(self.include, self.exclude, self.case_sensitive_patterns):
+            matcher = PatternMatcher(self.include, self.exclude, case_sensitive=self.case_sensitive_patterns)
+            self._pattern_matcher = matcher
+        return matcher
 
     @abstractmethod
     def get_database_name(self) -> str:
@@ -114,15 +168,79 @@ class DatabaseConfig(BaseModel, ABC):
         """Return the list of schemas to sync. Override in subclasses for custom behavior."""
         list_databases = getattr(conn, "list_databases", None)
         if list_databases:
-            return list_databases()
+            return [s for s in list_databases() if self.schema_matches(s)]
         return []
 
+    def list_all_tables(self, conn: BaseBackend, schemas: list[str]) -> dict[str, list[str]] | None:
+        """List the tables of all given schemas in a single round trip.
+
+        Override in subclasses whose warehouse can enumerate every (schema, table)
+        pair with one catalog query. Returns None when unsupported, in which case
+        tables are listed schema by schema.
+        """
+        return None
+
+    def _list_tables_from_information_schema(
+        self, conn: BaseBackend, schemas: list[str], information_schema: str = "information_schema", where: str = ""
+    ) -> dict[str, list[str]]:
+        """List tables of the given schemas with one `information_schema.tables` query."""
+        if not schemas:
+            return {}
+        schema_list = ", ".join("'" + s.replace("'", "''") + "'" for s in schemas)
+        query = f"""
+            SELECT table_schema, table_name
+            FROM {information_schema}.tables
+            WHERE table_schema IN ({schema_list}) {f"AND {where}" if where else ""}
+        """
+        tables: dict[str, list[str]] = {schema: [] for schema in schemas}
+        for schema, table in conn.raw_sql(query).fetchall():  # type: ignore[union-attr]
+            tables.setdefault(schema, []).append(table)
+        return tables
+
     def create_context(self, conn: BaseBackend, schema: str, table_name: str):
         """Create a DatabaseContext for this table. Override in subclasses for custom metadata."""
         from nao_core.config.databases.context import DatabaseContext
 
         return DatabaseContext(conn, schema, table_name)
 
+    def diagnose(self) -> ConnectionDiagnostics:
+        """Measure connect latency, a trivial query's round-trip and the server version.
+
+        Unlike `check_connection`, nothing is listed from the catalog, so the
+        cost doesn't grow with the number of schemas or tables.
+        """
+        conn = None
+        diagnostics = ConnectionDiagnostics(success=False, message="")
+        try:
+            start = time.perf_counter()
+            conn = self.connect()
+            diagnostics.connect_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            self.execute_sql(self.PING_QUERY, conn)
+            diagnostics.query_seconds = time.perf_counter() - start
+
+            diagnostics.server_version = self.server_version(conn)
+            diagnostics.success = True
+            diagnostics.message = "Connected successfully"
+        except Exception as e:
+            diagnostics.message = str(e)
+        finally:
+            if conn is not None:
+                try:
+                    conn.disconnect()
+                except Exception:
+                    pass
+        return diagnostics
+
+    def server_version(self, conn: BaseBackend) -> str | None:
+        """Get the version reported by the backend, if any."""
+        try:
+            version = conn.version
+        except Exception:
+            return None
+        return str(version) if version else None
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to the database. Override in subclasses for custom behavior."""
         try:
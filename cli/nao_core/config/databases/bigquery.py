@@ -1,10 +1,9 @@
+from __future__ import annotations
+
 import json
 import logging
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import ibis
-import pandas as pd
-from ibis import BaseBackend
 from pydantic import Field, field_validator
 
 from nao_core.ui import ask_select, ask_text
@@ -12,6 +11,10 @@ from nao_core.ui import ask_select, ask_text
 from .base import DatabaseConfig
 from .context import DatabaseContext
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from ibis import BaseBackend
+
 logger = logging.getLogger(__name__)
 
 
@@ -150,8 +153,8 @@ class BigQueryConfig(DatabaseConfig):
             sso=sso,
         )
 
-    def execute_sql(self, sql: str) -> pd.DataFrame:
-        conn = self.connect()
+    def execute_sql(self, sql: str, conn: BaseBackend | None = None) -> pd.DataFrame:
+        conn = conn or self.connect()
         cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
         # Disable BigQuery Storage Read API (gRPC) — it deadlocks when an
         # asyncio event loop is running in the same process (e.g. FastAPI).
@@ -159,6 +162,8 @@ class BigQueryConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis BigQuery connection."""
+        import ibis
+
         kwargs: dict = {"project_id": self.project_id}
 
         if self.dataset_id:
@@ -193,8 +198,9 @@ class BigQueryConfig(DatabaseConfig):
     def get_schemas(self, conn: BaseBackend) -> list[str]:
         if self.dataset_id:
             return [self.dataset_id]
+        # The datasets API cannot filter by name, so patterns are applied to the listing
         list_databases = getattr(conn, "list_databases", None)
-        return list_databases() if list_databases else []
+        return [s for s in list_databases() if self.schema_matches(s)] if list_databases else []
 
     def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> BigQueryDatabaseContext:
         return BigQueryDatabaseContext(conn, schema, table_name, project_id=self.project_id)
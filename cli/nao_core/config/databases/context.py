@@ -1,8 +1,11 @@
 """Base database context exposing methods available in templates during sync."""
 
-from typing import Any
+from __future__ import annotations
 
-from ibis import BaseBackend
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ibis import BaseBackend
 
 
 class DatabaseContext:
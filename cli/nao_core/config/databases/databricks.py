@@ -1,10 +1,10 @@
+from __future__ import annotations
+
 import logging
 import os
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import certifi
-import ibis
-from ibis import BaseBackend
 from pydantic import Field
 
 from nao_core.ui import ask_text
@@ -12,6 +12,9 @@ from nao_core.ui import ask_text
 from .base import DatabaseConfig
 from .context import DatabaseContext
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 logger = logging.getLogger(__name__)
 
 
@@ -109,6 +112,8 @@ class DatabricksConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis Databricks connection."""
+        import ibis
+
         kwargs: dict = {
             "server_hostname": self.server_hostname,
             "http_path": self.http_path,
@@ -130,8 +135,24 @@ class DatabricksConfig(DatabaseConfig):
     def get_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name]
-        list_databases = getattr(conn, "list_databases", None)
-        return list_databases() if list_databases else []
+        schemas = None
+        if (globs := self.pattern_matcher().schema_globs()) and not any(c in g for g in globs for c in "?[|'"):
+            # SHOW SCHEMAS LIKE accepts `*` wildcards and `|` alternatives
+            try:
+                rows = conn.raw_sql(f"SHOW SCHEMAS LIKE '{'|'.join(globs)}'").fetchall()  # type: ignore[union-attr]
+                schemas = [row[0] for row in rows]
+            except Exception:
+                logger.debug("Failed to list schemas with pushed-down filters, listing all schemas")
+        if schemas is None:
+            list_databases = getattr(conn, "list_databases", None)
+            schemas = list_databases() if list_databases else []
+        return [s for s in schemas if self.schema_matches(s)]
+
+    def list_all_tables(self, conn: BaseBackend, schemas: list[str]) -> dict[str, list[str]] | None:
+        # information_schema is scoped to a Unity Catalog; hive_metastore falls back to per-schema listing
+        return self._list_tables_from_information_schema(
+            conn, schemas, f"`{self.get_database_name()}`.information_schema"
+        )
 
     def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> DatabricksDatabaseContext:
         return DatabricksDatabaseContext(conn, schema, table_name)
@@ -1,14 +1,17 @@
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-import ibis
-from ibis import BaseBackend
 from pydantic import Field
 
 from nao_core.ui import ask_text
 
 from .base import DatabaseConfig
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 
 class DuckDBConfig(DatabaseConfig):
     """DuckDB-specific configuration."""
@@ -26,6 +29,8 @@ class DuckDBConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis DuckDB connection."""
+        import ibis
+
         return ibis.duckdb.connect(
             database=self.path,
             read_only=False if self.path == ":memory:" else True,
@@ -37,6 +42,9 @@ class DuckDBConfig(DatabaseConfig):
             return "memory"
         return Path(self.path).stem
 
+    def list_all_tables(self, conn: BaseBackend, schemas: list[str]) -> dict[str, list[str]] | None:
+        return self._list_tables_from_information_schema(conn, schemas, where="table_catalog = current_database()")
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to DuckDB."""
         conn = None
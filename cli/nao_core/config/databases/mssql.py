@@ -1,8 +1,8 @@
+from __future__ import annotations
+
 import platform
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-import ibis
-from ibis import BaseBackend
 from pydantic import Field
 
 from nao_core.config.exceptions import InitError
@@ -10,6 +10,9 @@ from nao_core.ui import ask_text
 
 from .base import DatabaseConfig
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 
 def _detect_odbc_driver() -> str:
     """Pick the best available ODBC driver for the current platform."""
@@ -93,6 +96,8 @@ class MssqlConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis MSSQL connection."""
+        import ibis
+
         return ibis.mssql.connect(
             host=self.host,
             port=self.port,
@@ -109,11 +114,22 @@ class MssqlConfig(DatabaseConfig):
     def get_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name]
-        list_databases = getattr(conn, "list_databases", None)
-        if list_databases:
+        schemas = None
+        if schema_filter := self.schema_filter_sql("name"):
+            try:
+                query = f"SELECT name FROM sys.schemas WHERE {schema_filter}"
+                schemas = [row[0] for row in conn.raw_sql(query).fetchall()]  # type: ignore[union-attr]
+            except Exception:
+                schemas = None
+        if schemas is None:
+            list_databases = getattr(conn, "list_databases", None)
+            if not list_databases:
+                return []
             schemas = list_databases()
-            return [s for s in schemas if s not in MSSQL_SYSTEM_SCHEMAS]
-        return []
+        return [s for s in schemas if s not in MSSQL_SYSTEM_SCHEMAS and self.schema_matches(s)]
+
+    def list_all_tables(self, conn: BaseBackend, schemas: list[str]) -> dict[str, list[str]] | None:
+        return self._list_tables_from_information_schema(conn, schemas)
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to MSSQL."""
@@ -0,0 +1,105 @@
+"""Compiled include/exclude glob matching for database sync."""
+
+import fnmatch
+import re
+from collections.abc import Sequence
+
+LIKE_ESCAPE = "!"
+
+
+def glob_to_like(pattern: str) -> str | None:
+    """Convert a glob to a SQL LIKE pattern using `!` as escape character.
+
+    Returns None for globs that LIKE cannot express (character classes).
+    """
+    if "[" in pattern:
+        return None
+    like = []
+    for char in pattern:
+        if char == "*":
+            like.append("%")
+        elif char == "?":
+            like.append("_")
+        elif char in ("%", "_", LIKE_ESCAPE):
+            like.append(LIKE_ESCAPE + char)
+        else:
+            like.append(char)
+    return "".join(like)
+
+
+def _compile(patterns: Sequence[str], flags: int) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), flags)
+
+
+class PatternMatcher:
+    """Include/exclude glob patterns compiled once into combined regexes.
+
+    Patterns use fnmatch syntax against `schema.table` (e.g. 'prod_*.*',
+    'analytics.dim_*'). Matching a table is a single regex match per pattern
+    list instead of one fnmatch call per pattern.
+
+    Schema-level matching assumes schema and table names do not contain '.':
+    an include pattern with a '.' only matches schemas matching the part
+    before it, and an exclude pattern ending in '.*' excludes the whole schema.
+    Include patterns without a '.' can match any schema.
+    """
+
+    def __init__(self, include: Sequence[str], exclude: Sequence[str], case_sensitive: bool = True):
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.case_sensitive = case_sensitive
+
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._include = _compile(self.include, flags)
+        self._exclude = _compile(self.exclude, flags)
+
+        if any("." not in p for p in self.include):
+            self._include_schema = None
+        else:
+            self._include_schema = _compile([p.split(".", 1)[0] for p in self.include], flags)
+        self._exclude_schema = _compile([p[:-2] for p in self.exclude if p.endswith(".*")], flags)
+
+    def schema_globs(self) -> list[str] | None:
+        """Schema parts of the include patterns, or None if any schema can match."""
+        if self._include_schema is None:
+            return None
+        return sorted({p.split(".", 1)[0] for p in self.include})
+
+    def schema_like_patterns(self) -> list[str] | None:
+        """SQL LIKE patterns matching a superset of the schemas that can contain included tables.
+
+        Returns None when no filter can be pushed down (no include pattern with a
+        schema part, or a glob that LIKE cannot express).
+        """
+        globs = self.schema_globs()
+        if globs is None:
+            return None
+        likes = [glob_to_like(g) for g in globs]
+        if any(like is None for like in likes):
+            return None
+        return likes  # type: ignore[return-value]
+
+    def is_for(self, include: Sequence[str], exclude: Sequence[str], case_sensitive: bool = True) -> bool:
+        """Check whether this matcher was compiled from the given patterns."""
+        return (
+            self.include == tuple(include) and self.exclude == tuple(exclude) and self.case_sensitive == case_sensitive
+        )
+
+    def matches(self, schema: str, table: str) -> bool:
+        """Check if a schema.table matches the include patterns and no exclude pattern."""
+        full_name = f"{schema}.{table}"
+        if self._include is not None and not self._include.match(full_name):
+            return False
+        if self._exclude is not None and self._exclude.match(full_name):
+            return False
+        return True
+
+    def schema_matches(self, schema: str) -> bool:
+        """Check if a schema could contain any matching table."""
+        if self._include_schema is not None and not self._include_schema.match(schema):
+            return False
+        if self._exclude_schema is not None and self._exclude_schema.match(schema):
+            return False
+        return True
@@ -1,7 +1,7 @@
-from typing import Any, Literal
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
 
-import ibis
-from ibis import BaseBackend
 from pydantic import Field
 
 from nao_core.config.exceptions import InitError
@@ -10,6 +10,9 @@ from nao_core.ui import ask_text
 from .base import DatabaseConfig
 from .context import DatabaseContext
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 
 class PostgresDatabaseContext(DatabaseContext):
     """Postgres context with pg_catalog description discovery."""
@@ -92,6 +95,7 @@ class PostgresConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis PostgreSQL connection."""
+        import ibis
 
         kwargs: dict = {
             "host": self.host,
@@ -115,12 +119,27 @@ class PostgresConfig(DatabaseConfig):
     def get_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name]
-        list_databases = getattr(conn, "list_databases", None)
-        if list_databases:
+        schemas = None
+        if schema_filter := self.schema_filter_sql("schema_name"):
+            try:
+                query = f"SELECT schema_name FROM information_schema.schemata WHERE {schema_filter}"
+                schemas = [row[0] for row in conn.raw_sql(query).fetchall()]  # type: ignore[union-attr]
+            except Exception:
+                schemas = None
+        if schemas is None:
+            list_databases = getattr(conn, "list_databases", None)
+            if not list_databases:
+                return []
             schemas = list_databases()
-            # Filter out system schemas
-            return [s for s in schemas if s not in ("pg_catalog", "information_schema") and not s.startswith("pg_")]
-        return []
+        # Filter out system schemas
+        return [
+            s
+            for s in schemas
+            if s not in ("pg_catalog", "information_schema") and not s.startswith("pg_") and self.schema_matches(s)
+        ]
+
+    def list_all_tables(self, conn: BaseBackend, schemas: list[str]) -> dict[str, list[str]] | None:
+        return self._list_tables_from_information_schema(conn, schemas)
 
     def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> PostgresDatabaseContext:
         return PostgresDatabaseContext(conn, schema, table_name)
@@ -1,10 +1,9 @@
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import ibis
-from ibis import BaseBackend
 from pydantic import BaseModel, Field
-from sshtunnel import SSHTunnelForwarder
 
 from nao_core.config.exceptions import InitError
 from nao_core.ui import ask_confirm, ask_text
@@ -12,6 +11,9 @@ from nao_core.ui import ask_confirm, ask_text
 from .base import DatabaseConfig
 from .context import DatabaseContext
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 
 class RedshiftDatabaseContext(DatabaseContext):
     """Redshift-specific context that bypasses Ibis's problematic pg_enum queries."""
@@ -231,6 +233,7 @@ class RedshiftConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis Redshift connection."""
+        import ibis
 
         # Determine connection host and port
         connect_host = self.host
@@ -238,6 +241,8 @@ class RedshiftConfig(DatabaseConfig):
 
         # Set up SSH tunnel if configured
         if self.ssh_tunnel:
+            from sshtunnel import SSHTunnelForwarder
+
             ssh_pkey_path = Path(self.ssh_tunnel.ssh_private_key_path).expanduser()
 
             tunnel = SSHTunnelForwarder(
@@ -280,21 +285,26 @@ class RedshiftConfig(DatabaseConfig):
         if self.schema_name:
             return [self.schema_name]
 
-        # Query system catalog directly to get all schemas
-        query = """
-            SELECT nspname 
+        # Query system catalog directly to get all schemas, pushing include patterns down
+        schema_filter = self.schema_filter_sql("nspname")
+        query = f"""
+            SELECT nspname
             FROM pg_catalog.pg_namespace
-            WHERE nspname NOT LIKE 'pg_%' 
+            WHERE nspname NOT LIKE 'pg_%'
               AND nspname != 'information_schema'
+              {f"AND {schema_filter}" if schema_filter else ""}
             ORDER BY nspname
         """
         try:
             result = conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
             schemas = [row[0] for row in result]
-            return schemas
         except Exception:
             list_databases = getattr(conn, "list_databases", None)
-            return list_databases() if list_databases else ["public"]
+            schemas = list_databases() if list_databases else ["public"]
+        return [s for s in schemas if self.schema_matches(s)]
+
+    def list_all_tables(self, conn: BaseBackend, schemas: list[str]) -> dict[str, list[str]] | None:
+        return self._list_tables_from_information_schema(conn, schemas)
 
     def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> RedshiftDatabaseContext:
         """Create a Redshift-specific database context that avoids pg_enum queries."""
@@ -311,12 +321,9 @@ class RedshiftConfig(DatabaseConfig):
                 return True, f"Connected successfully ({len(tables)} tables found)"
 
             if self.database:
+                # Listing the tables of every schema would scale with the catalog
                 schemas = self.get_schemas(conn)
-
-                tables = []
-                for schema in schemas:
-                    tables.extend(conn.list_tables(database=schema))
-                return True, f"Connected successfully ({len(tables)} tables found)"
+                return True, f"Connected successfully ({len(schemas)} schemas found)"
 
             return True, "Connected successfully"
         except Exception as e:
@@ -1,12 +1,10 @@
+from __future__ import annotations
+
 import logging
 import os
 import re
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
-import ibis
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from ibis import BaseBackend
 from pydantic import Field
 
 from nao_core.config.exceptions import InitError
@@ -15,6 +13,9 @@ from nao_core.ui import UI, ask_confirm, ask_text
 from .base import DatabaseConfig
 from .context import DatabaseContext
 
+if TYPE_CHECKING:
+    from ibis import BaseBackend
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,6 +87,7 @@ class SnowflakeConfig(DatabaseConfig):
     """Snowflake-specific configuration."""
 
     type: Literal["snowflake"] = "snowflake"
+    case_sensitive_patterns: ClassVar[bool] = False  # Snowflake identifiers are case-insensitive
     username: str = Field(description="Snowflake username")
     account_id: str = Field(description="Snowflake account identifier (e.g., 'xy12345.us-east-1')")
     password: str | None = Field(default=None, description="Snowflake password")
@@ -150,6 +152,8 @@ class SnowflakeConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis Snowflake connection."""
+        import ibis
+
         kwargs: dict = {"user": self.username}
         kwargs["account"] = self.account_id
 
@@ -167,6 +171,9 @@ class SnowflakeConfig(DatabaseConfig):
             UI.info(f"[yellow]Using authenticator: {self.authenticator}[/yellow]")
 
         if self.private_key_path:
+            from cryptography.hazmat.backends import default_backend
+            from cryptography.hazmat.primitives import serialization
+
             with open(self.private_key_path, "rb") as key_file:
                 private_key = serialization.load_pem_private_key(
                     key_file.read(),
@@ -188,55 +195,30 @@ class SnowflakeConfig(DatabaseConfig):
         """Get the database name for Snowflake."""
         return self.database
 
-    def matches_pattern(self, schema: str, table: str) -> bool:
-        """Check if a schema.table matches the include/exclude patterns.
-
-        Snowflake identifier matching is case-insensitive.
-        """
-        from fnmatch import fnmatch
-
-        full_name = f"{schema}.{table}"
-        full_name_lower = full_name.lower()
-
-        # If include patterns exist, table must match at least one
-        if self.include:
-            included = any(fnmatch(full_name_lower, pattern.lower()) for pattern in self.include)
-            if not included:
-                return False
-
-        # If exclude patterns exist, table must not match any
-        if self.exclude:
-            excluded = any(fnmatch(full_name_lower, pattern.lower()) for pattern in self.exclude)
-            if excluded:
-                return False
-
-        return True
-
-    def _schema_matches(self, schema: str) -> bool:
-        """Check if a schema could have any matching tables based on include/exclude patterns."""
-        from fnmatch import fnmatch
-
-        schema_lower = schema.lower()
-
-        if self.include:
-            included = any(fnmatch(schema_lower, p.split(".")[0].lower()) for p in self.include)
-            if not included:
-                return False
-
-        if self.exclude:
-            excluded = any(fnmatch(schema_lower, p.split(".")[0].lower()) for p in self.exclude if p.endswith(".*"))
-            if excluded:
-                return False
-
-        return True
-
     def get_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name.upper()]
-        list_databases = getattr(conn, "list_databases", None)
-        schemas = list_databases() if list_databases else []
+        schemas = self._query_schemas(conn)
+        if schemas is None:
+            list_databases = getattr(conn, "list_databases", None)
+            schemas = list_databases() if list_databases else []
         schemas = [s for s in schemas if s != "INFORMATION_SCHEMA"]
-        return [s for s in schemas if self._schema_matches(s)]
+        return [s for s in schemas if self.schema_matches(s)]
+
+    def _query_schemas(self, conn: BaseBackend) -> list[str] | None:
+        """List schemas matching the include patterns in the warehouse, or None if nothing can be pushed down."""
+        schema_filter = self.schema_filter_sql("SCHEMA_NAME", operator="ILIKE")
+        if not schema_filter:
+            return None
+        try:
+            query = f"SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA WHERE {schema_filter}"
+            return [row[0] for row in conn.raw_sql(query).fetchall()]  # type: ignore[union-attr]
+        except Exception:
+            logger.debug("Failed to list schemas with pushed-down filters, listing all schemas")
+            return None
+
+    def list_all_tables(self, conn: BaseBackend, schemas: list[str]) -> dict[str, list[str]] | None:
+        return self._list_tables_from_information_schema(conn, schemas)
 
     def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> SnowflakeDatabaseContext:
         return SnowflakeDatabaseContext(conn, schema, table_name)
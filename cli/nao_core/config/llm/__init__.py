@@ -1,6 +1,5 @@
 from enum import Enum
 
-import questionary
 from pydantic import BaseModel, Field
 
 from nao_core.ui import ask_select, ask_text
@@ -25,6 +24,8 @@ class LLMConfig(BaseModel):
     @classmethod
     def promptConfig(cls) -> "LLMConfig":
         """Interactively prompt the user for LLM configuration."""
+        import questionary
+
         provider_choices = [
             questionary.Choice("OpenAI (GPT-4, GPT-3.5)", value="openai"),
             questionary.Choice("Anthropic (Claude)", value="anthropic"),
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 from nao_core.ui import UI, ask_text
@@ -7,7 +9,31 @@ class NotionConfig(BaseModel):
     """Notion configuration."""
 
     api_key: str = Field(description="The API key to use")
-    pages: list[str] = Field(description="The pages to sync")
+    pages: list[str] = Field(default_factory=list, description="The pages to sync")
+    databases: list[str] = Field(
+        default_factory=list,
+        description="Databases whose rows are synced as pages",
+    )
+    max_depth: int = Field(
+        default=0,
+        ge=0,
+        description="How many levels of child pages and databases to crawl below the configured ones (0 = none)",
+    )
+    max_pages: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Stop syncing new pages once this many were synced",
+    )
+    cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds an exported page is reused without checking Notion for edits",
+    )
+    cache_max_size_mb: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum size of the exported page cache in .nao/cache/notion",
+    )
 
     @classmethod
     def promptConfig(cls) -> "NotionConfig":
@@ -11,6 +11,19 @@ class RepoConfig(BaseModel):
     name: str = Field(description="The name of the repository")
     url: str = Field(description="The URL of the repository")
     branch: Optional[str] = Field(default=None, description="The branch of the repository")
+    depth: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Shallow clone with history truncated to this many commits (e.g., 1)",
+    )
+    filter: Optional[str] = Field(
+        default=None,
+        description="Partial clone filter passed to `git clone --filter` (e.g., 'blob:none')",
+    )
+    sparse_paths: list[str] = Field(
+        default_factory=list,
+        description="Only check out files matching these gitignore-style patterns (e.g., ['models/**'])",
+    )
 
     @classmethod
     def promptConfig(cls) -> "RepoConfig":
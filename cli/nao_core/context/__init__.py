@@ -3,22 +3,30 @@
 import os
 from pathlib import Path
 
+from .archive import ArchiveContextProvider
 from .base import ContextProvider
 from .git import GitContextProvider
 from .local import LocalContextProvider
+from .revisions import DEFAULT_GC_GRACE_SECONDS
+from .search import ContextSearchIndex, SearchHit, update_search_index
 
 
 def get_context_provider() -> ContextProvider:
     """Factory function to create the appropriate context provider based on environment variables.
 
     Environment variables:
-        NAO_CONTEXT_SOURCE: 'local' (default) or 'git'
+        NAO_CONTEXT_SOURCE: 'local' (default), 'git' or 'archive'
         NAO_DEFAULT_PROJECT_PATH: Target path for context (required)
 
     For git source:
         NAO_CONTEXT_GIT_URL: Git repository URL (required)
         NAO_CONTEXT_GIT_BRANCH: Branch to clone/pull (default: 'main')
         NAO_CONTEXT_GIT_TOKEN: Auth token for private repos (optional)
+        NAO_CONTEXT_GIT_GC_GRACE_SECONDS: How long retired revisions are kept (default: 300)
+
+    For archive source:
+        NAO_CONTEXT_ARCHIVE_URL: Archive URL or local path (required)
+        NAO_CONTEXT_ARCHIVE_SHA256: Expected checksum (optional, defaults to <url>.sha256)
 
     Returns:
         ContextProvider instance based on configuration
@@ -33,22 +41,38 @@ def get_context_provider() -> ContextProvider:
 
         branch = os.environ.get("NAO_CONTEXT_GIT_BRANCH", "main")
         token = os.environ.get("NAO_CONTEXT_GIT_TOKEN")
+        gc_grace_seconds = float(os.environ.get("NAO_CONTEXT_GIT_GC_GRACE_SECONDS", DEFAULT_GC_GRACE_SECONDS))
 
         return GitContextProvider(
             repo_url=git_url,
             target_path=target_path,
             branch=branch,
             token=token,
+            gc_grace_seconds=gc_grace_seconds,
+        )
+    elif source == "archive":
+        archive_url = os.environ.get("NAO_CONTEXT_ARCHIVE_URL")
+        if not archive_url:
+            raise ValueError("NAO_CONTEXT_ARCHIVE_URL is required when NAO_CONTEXT_SOURCE=archive")
+
+        return ArchiveContextProvider(
+            source=archive_url,
+            target_path=target_path,
+            sha256=os.environ.get("NAO_CONTEXT_ARCHIVE_SHA256"),
         )
     elif source == "local":
         return LocalContextProvider(target_path=target_path)
     else:
-        raise ValueError(f"Unknown NAO_CONTEXT_SOURCE: {source}. Must be 'local' or 'git'")
+        raise ValueError(f"Unknown NAO_CONTEXT_SOURCE: {source}. Must be 'local', 'git' or 'archive'")
 
 
 __all__ = [
+    "ArchiveContextProvider",
     "ContextProvider",
+    "ContextSearchIndex",
     "GitContextProvider",
     "LocalContextProvider",
+    "SearchHit",
     "get_context_provider",
+    "update_search_index",
 ]
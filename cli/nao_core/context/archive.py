@@ -0,0 +1,306 @@
+"""Archive-based context provider.
+
+Downloads (or reads) a pre-built tarball of the context, which is much faster
+to cold start than cloning a large repository. Supported formats are
+`.tar.zst`, `.tar.gz`, `.tar.bz2`, `.tar.xz` and plain `.tar`.
+
+A `<archive>.sha256` file next to the archive (as written by `sha256sum`),
+or an explicit checksum, is used both to verify the download and to skip it
+when the current revision already has that hash. Without one, HTTP sources
+are polled with `If-None-Match` on the archive's ETag.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+from rich.console import Console
+
+from .revisions import DEFAULT_GC_GRACE_SECONDS, RevisionedContextProvider
+
+console = Console()
+
+STATE_FILENAME = "archive.json"
+CHUNK_SIZE = 1024 * 1024
+# Larger files are written while reading the stream instead of in a worker
+INLINE_WRITE_SIZE = 8 * 1024 * 1024
+
+
+class ArchiveContextProvider(RevisionedContextProvider):
+    """Context provider extracting a tarball fetched from a URL or a local path.
+
+    Each archive is extracted into a revision named after its sha256 and
+    swapped in atomically. File writes are spread over a thread pool while
+    the compressed stream is read.
+    """
+
+    RESERVED_NAMES = frozenset({STATE_FILENAME})
+
+    def __init__(
+        self,
+        source: str,
+        target_path: Path,
+        sha256: str | None = None,
+        workers: int = 8,
+        gc_grace_seconds: float = DEFAULT_GC_GRACE_SECONDS,
+    ):
+        """Initialize the archive context provider.
+
+        Args:
+            source: Archive URL (https://, http://, file://) or local path.
+            target_path: Local path where the current revision is exposed.
+            sha256: Expected checksum of the archive (optional). Defaults to the
+                content of `<source>.sha256` when it exists.
+            workers: Number of threads writing extracted files.
+            gc_grace_seconds: How long a retired revision is kept for readers
+                still using it.
+        """
+        super().__init__(target_path, gc_grace_seconds)
+        self.source = source
+        self.sha256 = sha256.lower() if sha256 else None
+        self.workers = max(1, workers)
+
+    @property
+    def _is_url(self) -> bool:
+        return self.source.startswith(("http://", "https://", "file://"))
+
+    @property
+    def _state_path(self) -> Path:
+        return self.revisions_dir / STATE_FILENAME
+
+    def init(self) -> None:
+        """Download and extract the archive, or refresh it if already extracted.
+
+        Raises:
+            ValueError: If the archive is invalid or doesn't contain nao_config.yaml.
+        """
+        if self.is_initialized():
+            console.print(f"[dim]Context already initialized at {self.target_path}[/dim]")
+        else:
+            console.print(f"[cyan]Downloading context archive from {self.source}...[/cyan]")
+        self.refresh()
+
+        if not self.validate():
+            raise ValueError(
+                "nao_config.yaml not found in context archive.\n"
+                "Ensure the archive contains a valid nao project at its root."
+            )
+
+    def refresh(self) -> bool:
+        """Swap in the archive if it changed since the current revision.
+
+        Returns:
+            True if a new archive was extracted, False if already up-to-date.
+
+        Raises:
+            ValueError: If the archive doesn't match its expected checksum.
+            OSError: If the archive cannot be downloaded or read.
+        """
+        self.last_changed_paths = None
+        current = self.current_revision()
+        expected = self.sha256 or self._read_checksum()
+        if expected is None and not self._is_url:
+            # Hashing a local file is much cheaper than extracting it
+            expected = _hash_file(Path(self.source))
+        if current is not None and expected == current:
+            console.print("[dim]Context already up-to-date[/dim]")
+            self.gc()
+            return False
+
+        state = self._load_state()
+        etag = state.get("etag") if current is not None and expected is None else None
+
+        with self._open(etag) as (stream, new_etag):
+            if stream is None:
+                console.print("[dim]Context already up-to-date (not modified)[/dim]")
+                self.gc()
+                return False
+            # Extract while downloading; the revision is only swapped in once verified
+            staging, digest = self._extract(stream)
+
+        try:
+            if expected is not None and digest != expected:
+                raise ValueError(f"Context archive checksum mismatch: expected {expected}, got {digest}")
+
+            self._save_state({"etag": new_etag, "sha256": digest})
+            if digest == current:
+                console.print("[dim]Context already up-to-date[/dim]")
+                self.gc()
+                return False
+
+            path = self.revisions_dir / digest
+            if not path.exists():
+                self._carry_over_state(staging)
+                staging.rename(path)
+            self._swap(path)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        console.print(f"[green]✓[/green] Context extracted to {self.target_path}")
+        self.gc()
+        return True
+
+    def is_initialized(self) -> bool:
+        """Check if an archive has been extracted.
+
+        Returns:
+            True if a revision is exposed at the target path.
+        """
+        return self.current_revision() is not None and self.target_path.exists()
+
+    def _read_checksum(self) -> str | None:
+        """Read the `<source>.sha256` file next to the archive, if any."""
+        try:
+            if self._is_url:
+                with urllib.request.urlopen(f"{self.source}.sha256", timeout=30) as resp:
+                    content = resp.read().decode()
+            else:
+                content = Path(f"{self.source}.sha256").read_text()
+        except (OSError, urllib.error.URLError):
+            return None
+        # sha256sum format: "<hex digest>  <file name>"
+        parts = content.split()
+        return parts[0].lower() if parts else None
+
+    @contextmanager
+    def _open(self, etag: str | None) -> Iterator[tuple[IO[bytes] | None, str | None]]:
+        """Open the archive for reading.
+
+        Yields:
+            Tuple of (stream, ETag); the stream is None if the server answered
+            that the archive matching `etag` was not modified.
+        """
+        if not self._is_url:
+            with open(self.source, "rb") as f:
+                yield f, None
+            return
+
+        request = urllib.request.Request(self.source)
+        if etag:
+            request.add_header("If-None-Match", etag)
+        try:
+            with urllib.request.urlopen(request, timeout=60) as resp:
+                yield resp, resp.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            yield None, etag
+
+    def _extract(self, stream: IO[bytes]) -> tuple[Path, str]:
+        """Extract an archive stream into a staging directory.
+
+        Returns:
+            Tuple of (staging directory, sha256 of the archive).
+        """
+        self.revisions_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.revisions_dir / f".extract-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        reader = _HashingReader(stream)
+        try:
+            extract_archive(_decompress(reader, self.source), staging, workers=self.workers)
+            # Hash the end-of-archive padding that tarfile doesn't need to read
+            while reader.read(CHUNK_SIZE):
+                pass
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return staging, reader.digest.hexdigest()
+
+    def _load_state(self) -> dict[str, Any]:
+        try:
+            return json.loads(self._state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: dict[str, Any]) -> None:
+        tmp_path = self._state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self._state_path)
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _HashingReader:
+    """File-like wrapper computing the sha256 of everything read through it."""
+
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        self.digest.update(chunk)
+        return chunk
+
+
+def _decompress(stream: Any, name: str) -> Any:
+    """Wrap a `.tar.zst` stream in a zstd decompressor; other formats are detected by tarfile."""
+    if not name.endswith((".zst", ".tzst")):
+        return stream
+    import zstandard
+
+    return zstandard.ZstdDecompressor().stream_reader(stream)
+
+
+def extract_archive(stream: IO[bytes], destination: Path, workers: int = 8) -> int:
+    """Extract the directories and regular files of a tar stream.
+
+    The stream is read sequentially while file contents are written by a pool
+    of threads. Members escaping the destination, links and special files are
+    skipped. Modification times are preserved, so the search index only
+    re-reads files whose content changed between archives.
+
+    Returns:
+        Number of files extracted.
+    """
+    root = destination.resolve()
+    count = 0
+    with tarfile.open(fileobj=stream, mode="r|*") as tar, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures: list[Future[None]] = []
+        for member in tar:
+            target = (root / member.name).resolve()
+            if target == root or not target.is_relative_to(root):
+                continue
+            if member.isdir():
+                target.mkdir(parents=True, exist_ok=True)
+            elif member.isfile():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                source = tar.extractfile(member)
+                if source is None:
+                    continue
+                if member.size > INLINE_WRITE_SIZE:
+                    with open(target, "wb") as f:
+                        shutil.copyfileobj(source, f, CHUNK_SIZE)
+                    _set_metadata(target, member)
+                else:
+                    futures.append(executor.submit(_write_file, target, source.read(), member))
+                count += 1
+        for future in futures:
+            future.result()
+    return count
+
+
+def _write_file(target: Path, content: bytes, member: tarfile.TarInfo) -> None:
+    target.write_bytes(content)
+    _set_metadata(target, member)
+
+
+def _set_metadata(target: Path, member: tarfile.TarInfo) -> None:
+    os.chmod(target, member.mode & 0o777 | 0o600)
+    os.utime(target, (member.mtime, member.mtime))
@@ -18,6 +18,8 @@ class ContextProvider(ABC):
             target_path: The local filesystem path where context should be available.
         """
         self.target_path = target_path
+        self.last_changed_paths: list[str] | None = None
+        """Paths (relative, posix) changed by the last refresh, or None if unknown"""
 
     @abstractmethod
     def init(self) -> None:
@@ -33,6 +35,10 @@ class ContextProvider(ABC):
     def refresh(self) -> bool:
         """Refresh the context from the source.
 
+        Providers that can tell which files changed set `last_changed_paths`,
+        letting callers invalidate derived state (e.g. the search index)
+        selectively.
+
         Returns:
             True if context was updated, False if no changes.
         """
@@ -1,42 +1,55 @@
 """Git-based context provider."""
 
+import shutil
 import subprocess
 from pathlib import Path
 
 from rich.console import Console
 
-from .base import ContextProvider
+from .revisions import DEFAULT_GC_GRACE_SECONDS, RevisionedContextProvider
 
 console = Console()
 
 
-class GitContextProvider(ContextProvider):
+class GitContextProvider(RevisionedContextProvider):
     """Context provider that clones/pulls from a git repository.
 
     This provider enables containerized deployments without volume mounts
     by fetching context from a git repository on startup and refresh.
+
+    Each fetched commit is checked out into its own worktree of a bare store
+    next to the target path, then swapped in atomically.
     """
 
+    RESERVED_NAMES = frozenset({"store.git"})
+
     def __init__(
         self,
         repo_url: str,
         target_path: Path,
         branch: str = "main",
         token: str | None = None,
+        gc_grace_seconds: float = DEFAULT_GC_GRACE_SECONDS,
     ):
         """Initialize the git context provider.
 
         Args:
             repo_url: Git repository URL (https:// or git@).
-            target_path: Local path where repo will be cloned.
+            target_path: Local path where the current revision is exposed.
             branch: Branch to clone/pull (default: 'main').
             token: Auth token for private repos (optional).
+            gc_grace_seconds: How long a retired revision is kept for readers
+                still using it.
         """
-        super().__init__(target_path)
+        super().__init__(target_path, gc_grace_seconds)
         self.repo_url = repo_url
         self.branch = branch
         self.token = token
 
+    @property
+    def _store(self) -> Path:
+        return self.revisions_dir / "store.git"
+
     def _get_auth_url(self) -> str:
         """Inject token into URL for private repos.
 
@@ -54,6 +67,19 @@ class GitContextProvider(ContextProvider):
         # For SSH URLs or other formats, return as-is
         return self.repo_url
 
+    def _git(self, *args: str) -> str:
+        """Run a git command against the revision store."""
+        result = subprocess.run(
+            ["git", f"--git-dir={self._store}", *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return result.stdout.strip()
+
+    def _sanitize(self, message: str) -> str:
+        return message.replace(self.token, "***") if self.token else message
+
     def init(self) -> None:
         """Clone the repository if not exists, otherwise pull.
 
@@ -74,56 +100,36 @@ class GitContextProvider(ContextProvider):
             )
 
     def _clone(self) -> None:
-        """Clone the repository.
+        """Fetch the branch head and expose it at the target path.
 
-        Uses shallow clone (--depth 1) for faster initial setup.
+        Uses a shallow fetch (--depth 1) for faster initial setup.
         """
         console.print(f"[cyan]Cloning context from {self.repo_url}...[/cyan]")
 
-        # Ensure parent directory exists
-        self.target_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Remove target if it exists but isn't a git repo
-        if self.target_path.exists() and not (self.target_path / ".git").exists():
-            import shutil
-
-            shutil.rmtree(self.target_path)
-
-        cmd = [
-            "git",
-            "clone",
-            "--branch",
-            self.branch,
-            "--depth",
-            "1",
-            "--single-branch",
-            self._get_auth_url(),
-            str(self.target_path),
-        ]
-
         try:
-            subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            revision = self._fetch()
+            self._swap(self._materialize(revision))
             console.print(f"[green]✓[/green] Context cloned to {self.target_path}")
         except subprocess.CalledProcessError as e:
             # Sanitize error message to not expose token
-            error_msg = e.stderr.replace(self.token, "***") if self.token else e.stderr
-            console.print(f"[red]✗[/red] Failed to clone repository: {error_msg}")
+            console.print(f"[red]✗[/red] Failed to clone repository: {self._sanitize(e.stderr)}")
             raise
 
     def refresh(self) -> bool:
-        """Pull latest changes from the repository.
+        """Swap in the latest revision of the branch if it changed.
+
+        The remote branch head is compared to the current revision first
+        (`git ls-remote`), so nothing is fetched when the context is up-to-date.
+        Paths that differ between the two revisions are recorded in
+        `last_changed_paths`.
 
         Returns:
             True if changes were pulled, False if already up-to-date.
 
         Raises:
-            subprocess.CalledProcessError: If git pull fails.
+            subprocess.CalledProcessError: If git fetch fails.
         """
+        self.last_changed_paths = None
         if not self.is_initialized():
             console.print("[yellow]Context not initialized, running init instead[/yellow]")
             self.init()
@@ -132,46 +138,76 @@ class GitContextProvider(ContextProvider):
         console.print(f"[cyan]Refreshing context from {self.repo_url}...[/cyan]")
 
         try:
-            # Fetch with the auth URL
-            subprocess.run(
-                ["git", "fetch", self._get_auth_url(), self.branch],
-                cwd=self.target_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            # Check if there are changes
-            diff_result = subprocess.run(
-                ["git", "diff", "HEAD..FETCH_HEAD", "--stat"],
-                cwd=self.target_path,
-                capture_output=True,
-                text=True,
-            )
+            current = self.current_revision()
+            if current is not None and self._remote_revision() == current:
+                console.print("[dim]Context already up-to-date[/dim]")
+                self.gc()
+                return False
 
-            if diff_result.stdout.strip():
-                # There are changes, do a hard reset to FETCH_HEAD
-                subprocess.run(
-                    ["git", "reset", "--hard", "FETCH_HEAD"],
-                    cwd=self.target_path,
-                    check=True,
-                    capture_output=True,
-                )
-                console.print("[green]✓[/green] Context updated")
-                return True
-            else:
+            revision = self._fetch()
+            if revision == current:
                 console.print("[dim]Context already up-to-date[/dim]")
+                self.gc()
                 return False
 
+            if current is not None:
+                self.last_changed_paths = self._changed_paths(current, revision)
+            self._swap(self._materialize(revision))
+            console.print("[green]✓[/green] Context updated")
+            self.gc()
+            return True
+
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.replace(self.token, "***") if self.token else e.stderr
-            console.print(f"[red]✗[/red] Failed to refresh context: {error_msg}")
+            console.print(f"[red]✗[/red] Failed to refresh context: {self._sanitize(e.stderr)}")
             raise
 
+    def _remote_revision(self) -> str | None:
+        """Get the commit at the head of the remote branch, without fetching it."""
+        result = subprocess.run(
+            ["git", "ls-remote", self._get_auth_url(), f"refs/heads/{self.branch}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return result.stdout.split()[0] if result.stdout.strip() else None
+
+    def _changed_paths(self, old: str, new: str) -> list[str]:
+        """List the paths added, modified or deleted between two revisions."""
+        output = self._git("diff", "--name-only", "--no-renames", "-z", old, new)
+        return [path for path in output.split("\0") if path]
+
+    def _fetch(self) -> str:
+        """Fetch the branch head into the revision store.
+
+        Returns:
+            The fetched commit sha.
+        """
+        if not self._store.exists():
+            self.revisions_dir.mkdir(parents=True, exist_ok=True)
+            self._git("init", "--bare", "--quiet")
+        self._git("fetch", "--depth", "1", self._get_auth_url(), self.branch)
+        return self._git("rev-parse", "FETCH_HEAD")
+
+    def _materialize(self, revision: str) -> Path:
+        """Check out a revision into its own worktree, if not already there."""
+        path = self.revisions_dir / revision
+        if not (path / ".git").exists():
+            if path.exists():
+                # Leftover of an interrupted checkout
+                shutil.rmtree(path)
+            self._git("worktree", "prune")
+            self._git("worktree", "add", "--detach", "--quiet", str(path), revision)
+            self._carry_over_state(path)
+        return path
+
+    def _after_gc(self) -> None:
+        if self._store.exists():
+            self._git("worktree", "prune")
+
     def is_initialized(self) -> bool:
         """Check if repository has been cloned.
 
         Returns:
-            True if .git directory exists at target path.
+            True if a revision is checked out at the target path.
         """
         return (self.target_path / ".git").exists()
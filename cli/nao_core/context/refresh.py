@@ -0,0 +1,84 @@
+"""Single-flight context refresh, run off the event loop."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass
+class RefreshStatus:
+    """Outcome of the last context refresh."""
+
+    running: bool = False
+    last_started_at: float | None = None
+    last_finished_at: float | None = None
+    last_duration_seconds: float | None = None
+    last_outcome: str | None = None
+    """'updated', 'unchanged' or 'failed'"""
+    last_error: str | None = None
+    runs: int = 0
+    coalesced: int = 0
+    """Refresh requests served by a run started for another request"""
+
+
+class RefreshCoordinator:
+    """Runs a blocking refresh function in a worker thread, one run at a time.
+
+    Callers arriving while a refresh is running do not start their own: they
+    all share a single follow-up run that starts once the current one ends, so
+    changes pushed after the current fetch began are still picked up, without
+    piling up one run per caller.
+    """
+
+    def __init__(self, refresh: Callable[[], bool]):
+        """Initialize the coordinator.
+
+        Args:
+            refresh: Blocking function returning True if the context changed.
+        """
+        self._refresh = refresh
+        self._current: asyncio.Future[bool] | None = None
+        self._next: asyncio.Future[bool] | None = None
+        self.status = RefreshStatus()
+
+    async def run(self) -> bool:
+        """Refresh the context, joining a pending run if there is one.
+
+        Returns:
+            True if the context changed.
+
+        Raises:
+            Exception: Whatever the refresh function raised.
+        """
+        if self._next is not None:
+            self.status.coalesced += 1
+        else:
+            self._next = asyncio.ensure_future(self._run_after(self._current))
+        # Shielded so that a cancelled caller (e.g. a dropped HTTP request) does not cancel the others' run
+        return await asyncio.shield(self._next)
+
+    async def _run_after(self, previous: "asyncio.Future[bool] | None") -> bool:
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        self._current, self._next = self._next, None
+        self.status.running = True
+        self.status.last_started_at = time.time()
+        start = time.perf_counter()
+        try:
+            updated = await asyncio.to_thread(self._refresh)
+        except Exception as e:
+            self.status.last_outcome = "failed"
+            self.status.last_error = str(e)
+            raise
+        else:
+            self.status.last_outcome = "updated" if updated else "unchanged"
+            self.status.last_error = None
+            return updated
+        finally:
+            self.status.running = False
+            self.status.runs += 1
+            self.status.last_finished_at = time.time()
+            self.status.last_duration_seconds = time.perf_counter() - start
+            self._current = None
@@ -0,0 +1,99 @@
+"""Base class for context providers swapping immutable revisions atomically."""
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+from .base import ContextProvider
+
+DEFAULT_GC_GRACE_SECONDS = 300.0
+
+
+class RevisionedContextProvider(ContextProvider):
+    """Context provider exposing one of several materialized revisions.
+
+    Each revision lives in its own directory next to the target path, and
+    `target_path` is a symlink to the current one. A new revision is
+    materialized completely before the symlink is atomically repointed, so
+    readers never see a partially updated tree. Retired revisions are deleted
+    once they have been out of use for `gc_grace_seconds`, leaving in-flight
+    readers time to finish.
+    """
+
+    RESERVED_NAMES: frozenset[str] = frozenset()
+    """Entries of the revisions directory that are not revisions"""
+
+    def __init__(self, target_path: Path, gc_grace_seconds: float = DEFAULT_GC_GRACE_SECONDS):
+        super().__init__(target_path)
+        self.gc_grace_seconds = gc_grace_seconds
+
+    @property
+    def revisions_dir(self) -> Path:
+        """Sibling directory holding one directory per revision."""
+        return self.target_path.parent / f".{self.target_path.name}-revisions"
+
+    def current_revision(self) -> str | None:
+        """Get the revision exposed at the target path.
+
+        Returns:
+            The revision name, or None if nothing has been swapped in yet. A
+            plain directory left at the target path (e.g. by an older version)
+            is reported as None so that the next refresh migrates it.
+        """
+        if not self.target_path.is_symlink():
+            return None
+        return Path(os.readlink(self.target_path)).name
+
+    def _carry_over_state(self, revision_path: Path) -> None:
+        """Copy untracked state (search index, caches) from the current revision."""
+        state = self.target_path / ".nao"
+        if self.target_path.exists() and state.is_dir():
+            shutil.copytree(state, revision_path / ".nao", dirs_exist_ok=True)
+
+    def _swap(self, revision_path: Path) -> None:
+        """Atomically point the target path at a materialized revision."""
+        self.target_path.parent.mkdir(parents=True, exist_ok=True)
+        previous = self.target_path.resolve() if self.target_path.is_symlink() else None
+
+        if self.target_path.exists() and not self.target_path.is_symlink():
+            # Legacy plain directory: retire it so it can be collected
+            self.revisions_dir.mkdir(parents=True, exist_ok=True)
+            previous = self.target_path.rename(self.revisions_dir / f"legacy-{time.time_ns()}")
+
+        tmp_link = self.target_path.with_name(f".{self.target_path.name}.{os.getpid()}.tmp")
+        tmp_link.unlink(missing_ok=True)
+        # Relative target so the link survives the parent directory being mounted elsewhere
+        tmp_link.symlink_to(os.path.relpath(revision_path, self.target_path.parent))
+        os.replace(tmp_link, self.target_path)
+
+        if previous is not None and previous.resolve() != revision_path.resolve():
+            # The retirement time is recorded as the directory's mtime
+            os.utime(previous)
+
+    def gc(self) -> int:
+        """Delete revisions retired for longer than the grace period.
+
+        Returns:
+            Number of revisions removed.
+        """
+        if not self.revisions_dir.exists():
+            return 0
+
+        current = self.target_path.resolve() if self.target_path.is_symlink() else None
+        now = time.time()
+        removed = 0
+        for path in self.revisions_dir.iterdir():
+            if path.name in self.RESERVED_NAMES or not path.is_dir() or path.resolve() == current:
+                continue
+            if now - path.stat().st_mtime < self.gc_grace_seconds:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+
+        if removed:
+            self._after_gc()
+        return removed
+
+    def _after_gc(self) -> None:
+        """Hook called after revisions were removed."""
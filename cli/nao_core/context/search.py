@@ -0,0 +1,224 @@
+"""Incremental full-text search index over the nao context folder.
+
+The index lives in `.nao/index/search.sqlite` and uses SQLite FTS5. Files are
+re-indexed only when their size or modification time changed, so updating the
+index after a sync only touches what the sync rewrote.
+"""
+
+import fnmatch
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+INDEX_DIR = Path(".nao") / "index"
+INDEX_FILENAME = "search.sqlite"
+
+INDEXED_SUFFIXES = frozenset({".md", ".txt", ".sql", ".yml", ".yaml", ".json", ".csv", ".py", ".rst"})
+EXCLUDED_DIRS = frozenset({".git", ".nao", ".meta", ".venv", "venv", "node_modules", "__pycache__"})
+MAX_FILE_SIZE = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(path UNINDEXED, content);
+"""
+
+
+@dataclass
+class IndexStats:
+    """Outcome of an index update."""
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> int:
+        return self.added + self.updated + self.removed
+
+    def get_summary(self) -> str:
+        total = self.added + self.updated + self.unchanged
+        if not self.changed:
+            return f"{total} files, up-to-date"
+        return f"{total} files ({self.added} added, {self.updated} updated, {self.removed} removed)"
+
+
+@dataclass
+class SearchHit:
+    """A single search result."""
+
+    path: str
+    snippet: str
+    score: float
+
+
+def load_naoignore_patterns(project_path: Path) -> list[str]:
+    """Read the `.naoignore` patterns of a project (empty lines and comments are skipped)."""
+    naoignore = project_path / ".naoignore"
+    try:
+        lines = naoignore.read_text().splitlines()
+    except OSError:
+        return []
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+
+def _is_ignored(relative_path: str, patterns: list[str]) -> bool:
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if relative_path.startswith(pattern) or f"/{pattern}" in f"/{relative_path}":
+                return True
+        elif fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(Path(relative_path).name, pattern):
+            return True
+    return False
+
+
+def _to_match_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching documents that contain every term."""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class ContextSearchIndex:
+    """Full-text index over the text files of a nao project."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        self.path = project_path / INDEX_DIR / INDEX_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ContextSearchIndex":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def is_built(self) -> bool:
+        """Check whether the index holds any file."""
+        return self._conn.execute("SELECT 1 FROM files LIMIT 1").fetchone() is not None
+
+    def iter_files(self) -> dict[str, Path]:
+        """Return the indexable files of the project keyed by their relative posix path."""
+        patterns = load_naoignore_patterns(self.project_path)
+        files: dict[str, Path] = {}
+        for path in self.project_path.rglob("*"):
+            if path.suffix.lower() not in INDEXED_SUFFIXES or not path.is_file():
+                continue
+            relative = path.relative_to(self.project_path)
+            if any(part in EXCLUDED_DIRS for part in relative.parts[:-1]):
+                continue
+            key = relative.as_posix()
+            if _is_ignored(key, patterns):
+                continue
+            files[key] = path
+        return files
+
+    def update(self, changed_paths: Iterable[str] | None = None) -> IndexStats:
+        """Bring the index in line with the files on disk, re-reading only changed files.
+
+        Args:
+            changed_paths: Relative paths known to have changed (e.g. from a git
+                refresh). When given, other files are trusted to be unchanged
+                if their size matches, even though their modification time
+                differs, and only the listed files are re-read.
+        """
+        stats = IndexStats()
+        changed = set(changed_paths) if changed_paths is not None else None
+        indexed = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in self._conn.execute("SELECT id, path, mtime_ns, size FROM files")
+        }
+
+        with self._conn:
+            for key, path in self.iter_files().items():
+                stat = path.stat()
+                previous = indexed.pop(key, None)
+                if previous and previous[1:] == (stat.st_mtime_ns, stat.st_size):
+                    stats.unchanged += 1
+                    continue
+                if previous and changed is not None and key not in changed and previous[2] == stat.st_size:
+                    self._conn.execute("UPDATE files SET mtime_ns = ? WHERE id = ?", (stat.st_mtime_ns, previous[0]))
+                    stats.unchanged += 1
+                    continue
+                if stat.st_size > MAX_FILE_SIZE:
+                    if previous:
+                        self._delete(previous[0])
+                    continue
+
+                content = path.read_text(errors="replace")
+                if previous:
+                    file_id = previous[0]
+                    self._conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (stat.st_mtime_ns, stat.st_size, file_id),
+                    )
+                    self._conn.execute("DELETE FROM documents WHERE rowid = ?", (file_id,))
+                    stats.updated += 1
+                else:
+                    cursor = self._conn.execute(
+                        "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                        (key, stat.st_mtime_ns, stat.st_size),
+                    )
+                    file_id = cursor.lastrowid
+                    stats.added += 1
+                self._conn.execute(
+                    "INSERT INTO documents (rowid, path, content) VALUES (?, ?, ?)", (file_id, key, content)
+                )
+
+            for file_id, _, _ in indexed.values():
+                self._delete(file_id)
+                stats.removed += 1
+
+        return stats
+
+    def _delete(self, file_id: int) -> None:
+        self._conn.execute("DELETE FROM documents WHERE rowid = ?", (file_id,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def search(self, query: str, limit: int = 20, path_prefix: str | None = None) -> list[SearchHit]:
+        """Search the index for documents containing every term of the query.
+
+        Args:
+            query: Free text; each whitespace-separated term must appear in the document.
+            limit: Maximum number of hits to return.
+            path_prefix: Only return documents under this relative path (e.g. "databases/").
+
+        Returns:
+            Hits ordered by relevance (best first).
+        """
+        match = _to_match_query(query)
+        if not match:
+            return []
+
+        sql = (
+            "SELECT path, snippet(documents, 1, '**', '**', '…', 16), bm25(documents) AS score "
+            "FROM documents WHERE documents MATCH ?"
+        )
+        params: list[object] = [match]
+        if path_prefix:
+            sql += " AND path LIKE ? ESCAPE '\\'"
+            escaped = path_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"{escaped}%")
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        return [
+            SearchHit(path=path, snippet=snippet, score=score)
+            for path, snippet, score in self._conn.execute(sql, params)
+        ]
+
+
+def update_search_index(project_path: Path, changed_paths: Iterable[str] | None = None) -> IndexStats:
+    """Build or incrementally update the search index of a project."""
+    with ContextSearchIndex(project_path) as index:
+        return index.update(changed_paths)
@@ -0,0 +1,92 @@
+"""Push webhooks (GitHub/GitLab style) triggering a debounced context refresh."""
+
+import asyncio
+import hashlib
+import hmac
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def verify_signature(secret: str, body: bytes, headers: Mapping[str, str]) -> bool:
+    """Check that a webhook request was sent by someone knowing the secret.
+
+    Accepts GitHub's HMAC signature (`X-Hub-Signature-256: sha256=<hex>`) or
+    GitLab's shared token (`X-Gitlab-Token`). Header lookup is case-insensitive
+    when `headers` is (like Starlette's headers).
+    """
+    signature = headers.get("x-hub-signature-256")
+    if signature:
+        expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(signature, expected)
+
+    token = headers.get("x-gitlab-token")
+    if token:
+        return hmac.compare_digest(token, secret)
+
+    return False
+
+
+@dataclass
+class PushEvent:
+    """A push to a branch and the paths its commits touched."""
+
+    branch: str
+    paths: set[str] = field(default_factory=set)
+
+
+def parse_push_event(payload: Any) -> PushEvent | None:
+    """Extract the pushed branch and touched paths from a push payload.
+
+    Returns:
+        None if the payload is not a push to a branch (e.g. a tag push or a ping).
+    """
+    if not isinstance(payload, dict):
+        return None
+    ref = payload.get("ref")
+    if not isinstance(ref, str) or not ref.startswith("refs/heads/"):
+        return None
+
+    event = PushEvent(branch=ref.removeprefix("refs/heads/"))
+    for commit in payload.get("commits") or []:
+        for key in ("added", "modified", "removed"):
+            event.paths.update(commit.get(key) or [])
+    return event
+
+
+class Debouncer:
+    """Collapses bursts of triggers into a single call of an async action.
+
+    The action runs once no trigger arrived for `delay` seconds, and at the
+    latest `max_delay` seconds after the first trigger of a burst, so a steady
+    stream of pushes cannot postpone the refresh forever.
+    """
+
+    def __init__(self, action: Callable[[], Awaitable[object]], delay: float, max_delay: float | None = None):
+        self.action = action
+        self.delay = delay
+        self.max_delay = max_delay if max_delay is not None else delay * 6
+        self._handle: asyncio.TimerHandle | None = None
+        self._first: float = 0.0
+        self._tasks: set[asyncio.Task[object]] = set()
+
+    @property
+    def pending(self) -> bool:
+        return self._handle is not None
+
+    def trigger(self) -> None:
+        """Schedule the action, postponing an already scheduled one. Must be called from the event loop."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._handle is None:
+            self._first = now
+        else:
+            self._handle.cancel()
+        self._handle = loop.call_at(min(now + self.delay, self._first + self.max_delay), self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        task = asyncio.ensure_future(self.action())
+        # Keep a reference so the task is not garbage collected while running
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -5,17 +5,20 @@ load_dotenv()
 from cyclopts import App  # noqa: E402
 
 from nao_core import __version__  # noqa: E402
-from nao_core.commands import chat, debug, init, sync, test, upgrade  # noqa: E402
 from nao_core.version import check_for_updates  # noqa: E402
 
 app = App(version=__version__)
 
-app.command(chat)
-app.command(debug)
-app.command(init)
-app.command(sync)
-app.command(test)
-app.command(upgrade)
+# Commands are registered by import path so that a command's dependencies
+# (ibis, warehouse drivers, LLM clients...) are only imported when it runs.
+# Help strings are repeated here so that `nao --help` doesn't import them all.
+app.command("nao_core.commands.bench:bench", help="Benchmark the latency and throughput of configured databases.")
+app.command("nao_core.commands.chat:chat", help="Start the nao chat UI.")
+app.command("nao_core.commands.debug:debug", help="Test connectivity to configured databases and LLMs.")
+app.command("nao_core.commands.init:init", help="Initialize a new nao project.")
+app.command("nao_core.commands.sync:sync", help="Sync resources using configured providers.")
+app.command("nao_core.commands.test:test", help="Run and explore nao tests.")
+app.command("nao_core.commands.upgrade:upgrade", help="Upgrade nao-core to the latest version.")
 
 
 def main():
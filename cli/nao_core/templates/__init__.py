@@ -15,7 +15,7 @@ Example user template (docs/report.md.j2):
     {{ nao.notion.page('https://notion.so/...').content }}
 """
 
-from .context import NaoContext, NotionPage, NotionProvider, create_nao_context
+from .context import NaoContext, NotionPage, NotionProvider, TemplateDatabase, create_nao_context
 from .engine import TemplateEngine, get_template_engine
 from .render import (
     TemplateRenderResult,
@@ -32,6 +32,7 @@ __all__ = [
     "NaoContext",
     "NotionPage",
     "NotionProvider",
+    "TemplateDatabase",
     "create_nao_context",
     # Render
     "TemplateRenderResult",
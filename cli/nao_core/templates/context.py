@@ -6,16 +6,29 @@ allowing them to access data from various providers like Notion, databases, etc.
 Example template usage:
     {{ nao.notion.page('https://notion.so/...').content }}
     {{ nao.notion.page('abc123').title }}
+    {% for row in nao.database('warehouse').query('SELECT ...', ttl=3600) %}...{% endfor %}
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import time
 from dataclasses import dataclass
 from functools import cached_property
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    import pandas as pd
+    from ibis import BaseBackend
+
+    from nao_core.commands.sync.providers.notion.cache import NotionPageCache
     from nao_core.config.base import NaoConfig
+    from nao_core.config.databases.base import DatabaseConfig
+
+QUERY_CACHE_DIR = Path(".nao") / "cache" / "queries"
 
 
 @dataclass
@@ -24,33 +37,27 @@ class NotionPage:
 
     page_url_or_id: str
     api_key: str
+    cache: NotionPageCache | None = None
     _data: dict[str, Any] | None = None
 
     def _load(self) -> dict[str, Any]:
-        """Lazily load page data from Notion API."""
+        """Lazily load page data from the page cache or the Notion API."""
         if self._data is None:
-            from notion2md.exporter.block import StringExporter
-            from notion_client import Client
-
-            from nao_core.commands.sync.providers.notion.provider import (
-                extract_page_id,
-                get_page_title,
-                strip_images,
-            )
+            from nao_core.commands.sync.providers.notion.api import NotionAPI, NotionPageExporter
+            from nao_core.commands.sync.providers.notion.provider import export_page, extract_page_id
 
             page_id = extract_page_id(self.page_url_or_id)
-            client = Client(auth=self.api_key)
-            title = get_page_title(client, page_id)
 
-            # Export to markdown
-            md_exporter = StringExporter(block_id=page_id, token=self.api_key)
-            markdown = md_exporter.export()
-            markdown = strip_images(markdown)
+            # Served without any request while the cached export is within its TTL
+            exported = self.cache.get(page_id) if self.cache is not None else None
+            if exported is None:
+                with NotionPageExporter(NotionAPI(self.api_key)) as exporter:
+                    exported = export_page(page_id, exporter, self.cache)
 
             self._data = {
                 "id": page_id,
-                "title": title,
-                "content": markdown,
+                "title": exported.title,
+                "content": exported.content,
                 "url": f"https://notion.so/{page_id}",
             }
         return self._data
@@ -83,9 +90,16 @@ class NotionPage:
 class NotionProvider:
     """Provider interface for accessing Notion data in templates."""
 
-    def __init__(self, config: NaoConfig):
+    def __init__(self, config: NaoConfig, project_path: Path | None = None):
         self._config = config
         self._page_cache: dict[str, NotionPage] = {}
+        self._disk_cache: NotionPageCache | None = None
+        if project_path is not None and config.notion is not None:
+            from nao_core.commands.sync.providers.notion.cache import NotionPageCache
+
+            self._disk_cache = NotionPageCache.for_project(
+                project_path, config.notion.cache_ttl, config.notion.cache_max_size_mb
+            )
 
     def _get_api_key_for_page(self, page_url_or_id: str) -> str:
         """Find the API key that can access a given page.
@@ -132,10 +146,117 @@ class NotionProvider:
             self._page_cache[page_url_or_id] = NotionPage(
                 page_url_or_id=page_url_or_id,
                 api_key=api_key,
+                cache=self._disk_cache,
             )
         return self._page_cache[page_url_or_id]
 
 
+def _to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to JSON-friendly rows, stringifying dates, decimals, etc."""
+    rows = []
+    for row_dict in df.to_dict(orient="records"):
+        for key, val in row_dict.items():
+            if val is not None and not isinstance(val, (str, int, float, bool, list, dict)):
+                row_dict[key] = str(val)
+        rows.append(row_dict)
+    return rows
+
+
+class TemplateDatabase:
+    """A configured database, as returned by `nao.database(name)`.
+
+    The connection is opened on first use and shared by every template of the
+    render pass. Query results and table metadata are cached for the pass;
+    queries given a `ttl` are also cached on disk across runs.
+    """
+
+    def __init__(self, db_config: DatabaseConfig, project_path: Path | None = None):
+        self._db_config = db_config
+        self._project_path = project_path
+        self._conn: BaseBackend | None = None
+        self._queries: dict[str, list[dict[str, Any]]] = {}
+        self._tables: dict[tuple[str, str], Any] = {}
+
+    @property
+    def name(self) -> str:
+        return self._db_config.name
+
+    @property
+    def connection(self) -> BaseBackend:
+        if self._conn is None:
+            self._conn = self._db_config.connect()
+        return self._conn
+
+    def query(self, sql: str, ttl: int | None = None) -> list[dict[str, Any]]:
+        """Run a SQL query and return its rows as dictionaries.
+
+        Args:
+            sql: The SQL to run.
+            ttl: When set, reuse a result cached on disk by a previous run if it
+                is younger than `ttl` seconds (requires a project path).
+
+        Example:
+            {% for row in nao.database('warehouse').query('SELECT * FROM kpis', ttl=3600) %}
+        """
+        if sql in self._queries:
+            return self._queries[sql]
+
+        cache_path = self._cache_path(sql) if ttl is not None else None
+        rows = self._read_cache(cache_path, ttl) if cache_path is not None else None
+        if rows is None:
+            rows = _to_records(self._db_config.execute_sql(sql, conn=self.connection))
+            if cache_path is not None:
+                self._write_cache(cache_path, rows)
+
+        self._queries[sql] = rows
+        return rows
+
+    def table(self, schema: str, name: str) -> Any:
+        """Get a table's metadata context, the same one database sync templates use.
+
+        Example:
+            {{ nao.database('warehouse').table('public', 'orders').row_count() }}
+        """
+        key = (schema, name)
+        if key not in self._tables:
+            from nao_core.commands.sync.providers.databases.catalog import MemoizedContext
+
+            ctx = self._db_config.create_context(self.connection, schema, name)
+            self._tables[key] = MemoizedContext(ctx)
+        return self._tables[key]
+
+    def close(self) -> None:
+        """Close the connection, if one was opened."""
+        if self._conn is not None:
+            disconnect = getattr(self._conn, "disconnect", None)
+            if disconnect is not None:
+                disconnect()
+            self._conn = None
+
+    def _cache_path(self, sql: str) -> Path | None:
+        if self._project_path is None:
+            return None
+        digest = hashlib.sha256(f"{self._db_config.type}\0{self.name}\0{sql}".encode()).hexdigest()
+        return self._project_path / QUERY_CACHE_DIR / f"{digest}.json"
+
+    @staticmethod
+    def _read_cache(path: Path, ttl: int) -> list[dict[str, Any]] | None:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - data.get("fetched_at", 0) > ttl:
+            return None
+        return data.get("rows")
+
+    @staticmethod
+    def _write_cache(path: Path, rows: list[dict[str, Any]]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"fetched_at": time.time(), "rows": rows}, default=str))
+        os.replace(tmp_path, path)
+
+
 class NaoContext:
     """The main context object exposed as `nao` in user templates.
 
@@ -145,11 +266,17 @@ class NaoContext:
 
     Example template usage:
         {{ nao.notion.page('url').content }}
+        {{ nao.database('warehouse').query('SELECT ...') }}
         {{ nao.config.project_name }}
+
+    A single context can be shared by all the templates of a render pass so
+    they share connections and cached results; call `close()` when done.
     """
 
-    def __init__(self, config: NaoConfig):
+    def __init__(self, config: NaoConfig, project_path: Path | None = None):
         self._config = config
+        self._project_path = project_path
+        self._databases: dict[str, TemplateDatabase] = {}
 
     @cached_property
     def notion(self) -> NotionProvider:
@@ -158,7 +285,26 @@ class NaoContext:
         Example:
             {{ nao.notion.page('https://notion.so/...').content }}
         """
-        return NotionProvider(self._config)
+        return NotionProvider(self._config, self._project_path)
+
+    def database(self, name: str) -> TemplateDatabase:
+        """Access a configured database by name.
+
+        Example:
+            {{ nao.database('warehouse').query('SELECT count(*) AS n FROM orders')[0].n }}
+        """
+        if name not in self._databases:
+            db_config = next((db for db in self._config.databases if db.name == name), None)
+            if db_config is None:
+                raise ValueError(f"No database named '{name}' in the nao configuration")
+            self._databases[name] = TemplateDatabase(db_config, self._project_path)
+        return self._databases[name]
+
+    def close(self) -> None:
+        """Close the database connections opened by templates."""
+        for database in self._databases.values():
+            database.close()
+        self._databases.clear()
 
     @property
     def config(self) -> NaoConfig:
@@ -171,23 +317,20 @@ class NaoContext:
 
     # Future providers can be added here:
     # @cached_property
-    # def database(self) -> DatabaseProvider:
-    #     """Access database tables and schemas."""
-    #     return DatabaseProvider(self._config)
-    #
-    # @cached_property
     # def repo(self) -> RepoProvider:
     #     """Access git repository files."""
     #     return RepoProvider(self._config)
 
 
-def create_nao_context(config: NaoConfig) -> NaoContext:
+def create_nao_context(config: NaoConfig, project_path: Path | None = None) -> NaoContext:
     """Create a NaoContext for template rendering.
 
     Args:
         config: The nao configuration.
+        project_path: Path to the nao project root, enabling the on-disk
+            Notion page and query caches shared across templates and runs.
 
     Returns:
         A NaoContext instance to be used as `nao` in templates.
     """
-    return NaoContext(config)
+    return NaoContext(config, project_path)
@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING
 
 from jinja2 import Environment, FileSystemLoader, TemplateError
 
-from .context import create_nao_context
+from .context import NaoContext, create_nao_context
 
 if TYPE_CHECKING:
     from rich.console import Console
@@ -86,6 +86,7 @@ def render_template(
     template_path: Path,
     project_path: Path,
     config: NaoConfig,
+    nao: NaoContext | None = None,
 ) -> Path:
     """Render a single template file.
 
@@ -93,6 +94,8 @@ def render_template(
         template_path: Path to the template file (relative to project_path).
         project_path: Path to the nao project root.
         config: The nao configuration.
+        nao: Context shared with other templates of the render pass; a new one
+            is created if omitted.
 
     Returns:
         Path to the rendered output file.
@@ -115,7 +118,8 @@ def render_template(
     env.filters["to_json"] = lambda v, indent=None: json.dumps(v, indent=indent, default=str)
 
     # Create the nao context
-    nao = create_nao_context(config)
+    if nao is None:
+        nao = create_nao_context(config, project_path)
 
     # Load and render the template
     template = env.get_template(str(template_path))
@@ -166,19 +170,24 @@ def render_all_templates(
     rendered_files: list[str] = []
     errors: list[str] = []
 
-    for template_path in templates:
-        try:
-            output_path = render_template(template_path, project_path, config)
-            rendered_files.append(str(output_path.relative_to(project_path)))
-            console.print(f"  [dim]→[/dim] {template_path} [dim]→[/dim] {output_path.name}")
-        except TemplateError as e:
-            error_msg = f"{template_path}: {e}"
-            errors.append(error_msg)
-            console.print(f"  [red]✗[/red] {template_path}: {e}")
-        except Exception as e:
-            error_msg = f"{template_path}: {type(e).__name__}: {e}"
-            errors.append(error_msg)
-            console.print(f"  [red]✗[/red] {template_path}: {e}")
+    # One context for the whole pass, so templates share connections and cached results
+    nao = create_nao_context(config, project_path)
+    try:
+        for template_path in templates:
+            try:
+                output_path = render_template(template_path, project_path, config, nao)
+                rendered_files.append(str(output_path.relative_to(project_path)))
+                console.print(f"  [dim]→[/dim] {template_path} [dim]→[/dim] {output_path.name}")
+            except TemplateError as e:
+                error_msg = f"{template_path}: {e}"
+                errors.append(error_msg)
+                console.print(f"  [red]✗[/red] {template_path}: {e}")
+            except Exception as e:
+                error_msg = f"{template_path}: {type(e).__name__}: {e}"
+                errors.append(error_msg)
+                console.print(f"  [red]✗[/red] {template_path}: {e}")
+    finally:
+        nao.close()
 
     return TemplateRenderResult(
         templates_rendered=len(rendered_files),
@@ -2,6 +2,8 @@
 
 This module provides analytics tracking to help improve nao.
 Tracking is enabled when POSTHOG_DISABLED is not 'true' AND both POSTHOG_KEY and POSTHOG_HOST are configured.
+It is skipped while offline (see nao_core.background), and flushing events at exit
+is bounded by FLUSH_DEADLINE seconds so it never delays the end of a command.
 """
 
 import atexit
@@ -9,19 +11,22 @@ import os
 import uuid
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, TypeVar
-
-from posthog import Posthog
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from nao_core import __version__
+from nao_core.background import is_offline, run_with_deadline
 from nao_core.mode import MODE
 
+if TYPE_CHECKING:
+    from posthog import Posthog
+
 POSTHOG_DISABLED = os.environ.get("POSTHOG_DISABLED", "false").lower() == "true"
 POSTHOG_KEY = os.environ.get("POSTHOG_KEY", "phc_TUN2TvdA5qjeDFU1XFVCmD3hoVk1dmWree4cWb0dNk4")
 POSTHOG_HOST = os.environ.get("POSTHOG_HOST", "https://eu.i.posthog.com")
+FLUSH_DEADLINE = 1.0
 
 # PostHog client instance (initialized lazily)
-_client: Posthog | None = None
+_client: "Posthog | None" = None
 
 # File to persist anonymous distinct_id across CLI invocations
 DISTINCT_ID_FILE = Path.home() / ".nao" / "distinct_id"
@@ -46,17 +51,19 @@ def get_or_create_distinct_id() -> str:
         return str(uuid.uuid4())
 
 
-def get_or_create_posthog_client() -> Posthog | None:
+def get_or_create_posthog_client() -> "Posthog | None":
     """Initialize PostHog tracking if enabled and configured."""
     global _client
 
     if _client is not None:
         return _client
 
-    if POSTHOG_DISABLED or not POSTHOG_KEY or not POSTHOG_HOST or MODE != "prod":
+    if POSTHOG_DISABLED or not POSTHOG_KEY or not POSTHOG_HOST or MODE != "prod" or is_offline():
         return None
 
     try:
+        from posthog import Posthog
+
         # Initialize PostHog client
         _client = Posthog(
             POSTHOG_KEY,
@@ -74,14 +81,11 @@ def get_or_create_posthog_client() -> Posthog | None:
 
 
 def shutdown_tracking() -> None:
-    """Flush and shutdown PostHog client."""
+    """Flush and shutdown PostHog client, giving up after FLUSH_DEADLINE seconds."""
     if _client is None:
         return
 
-    try:
-        _client.shutdown()
-    except Exception:
-        pass
+    run_with_deadline(_client.shutdown, FLUSH_DEADLINE, name="nao-telemetry-flush")
 
 
 # Type variable for decorator
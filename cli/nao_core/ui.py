@@ -1,11 +1,17 @@
 """CLI UI utilities using questionary and Rich."""
 
-import pandas as pd
-import questionary
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import questionary
+
 console = Console()
 
 
@@ -96,6 +102,15 @@ class UI:
 # =============================================================================
 
 
+def __getattr__(name: str) -> Any:
+    # questionary pulls in prompt_toolkit, which is slow to import: only load it when prompting
+    if name == "questionary":
+        import questionary
+
+        return questionary
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def ask_text(
     message: str,
     default: str = "",
@@ -103,6 +118,8 @@ def ask_text(
     required_field: bool = False,
 ) -> str | None:
     """Ask for text input. Loops until filled if required_field=True."""
+    import questionary
+
     prompt_fn = questionary.password if password else questionary.text
 
     while True:
@@ -121,6 +138,8 @@ def ask_text(
 
 def ask_confirm(message: str, default: bool = True) -> bool:
     """Ask for confirmation."""
+    import questionary
+
     result = questionary.confirm(message, default=default).ask()
     if result is None:
         raise KeyboardInterrupt
@@ -133,6 +152,8 @@ def ask_select(
     default: str | None = None,
 ) -> str:
     """Ask user to select from choices."""
+    import questionary
+
     result = questionary.select(message, choices=choices, default=default).ask()
     if result is None:
         raise KeyboardInterrupt
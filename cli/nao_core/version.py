@@ -6,6 +6,7 @@ import urllib.request
 from pathlib import Path
 
 from nao_core import __version__
+from nao_core.background import is_offline, mark_offline, mark_online, run_in_background, write_json_atomic
 from nao_core.ui import UI
 
 CACHE_FILE = Path.home() / ".nao" / "version_check.json"
@@ -27,9 +28,15 @@ def get_latest_version() -> str | None:
 
 
 def check_for_updates() -> None:
-    """Check PyPI for a newer version of nao-core, using a 24h local cache."""
+    """Warn if a newer version of nao-core is available, without ever blocking.
+
+    Only the local cache is read here. When it is older than 24h, PyPI is
+    queried in a background thread so that the next invocation can warn.
+    """
     try:
-        latest = get_latest_version()
+        latest, fresh = _read_cache_entry()
+        if not fresh and not is_offline():
+            run_in_background(_refresh_cache, name="nao-update-check")
         if latest is None:
             return
 
@@ -47,13 +54,26 @@ def clear_version_cache() -> None:
 
 def _read_cache() -> str | None:
     """Return cached latest version if cache exists and is fresh, else None."""
+    latest, fresh = _read_cache_entry()
+    return latest if fresh else None
+
+
+def _read_cache_entry() -> tuple[str | None, bool]:
+    """Return the cached latest version (even if stale) and whether it is fresh."""
     if not CACHE_FILE.exists():
-        return None
+        return None, False
     data = json.loads(CACHE_FILE.read_text())
-    # If not fresh tell check_for_updates to fetch again
-    if time.time() - data.get("checked_at", 0) < CHECK_INTERVAL:
-        return data.get("latest")
-    return None
+    return data.get("latest"), time.time() - data.get("checked_at", 0) < CHECK_INTERVAL
+
+
+def _refresh_cache() -> None:
+    """Fetch the latest version, remembering a failure as being offline."""
+    try:
+        _fetch_and_cache()
+    except OSError:
+        mark_offline()
+        raise
+    mark_online()
 
 
 def _fetch_and_cache() -> str | None:
@@ -62,6 +82,5 @@ def _fetch_and_cache() -> str | None:
         data = json.loads(resp.read())
 
     latest = data["info"]["version"]
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CACHE_FILE.write_text(json.dumps({"latest": latest, "checked_at": time.time()}))
+    write_json_atomic(CACHE_FILE, {"latest": latest, "checked_at": time.time()})
     return latest
@@ -0,0 +1,13 @@
+"""Shared fixtures for the sync benchmarks."""
+
+import pytest
+
+import nao_core.templates.engine as engine_module
+
+
+@pytest.fixture(autouse=True)
+def reset_template_engine():
+    """Reset the global template engine between tests."""
+    engine_module._engine = None
+    yield
+    engine_module._engine = None
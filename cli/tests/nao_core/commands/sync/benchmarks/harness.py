@@ -0,0 +1,119 @@
+"""Timing, memory profiling and baseline comparison for the sync benchmarks."""
+
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+TOLERANCE = float(os.environ.get("NAO_BENCH_TOLERANCE", "0.25"))
+# Absolute slack, so short stages don't fail on noise
+MIN_SECONDS_SLACK = 0.1
+# Below this baseline, a stage's time is dominated by disk and scheduler noise
+# (sub-second cleanups were seen taking 10x their baseline on unchanged runs):
+# it is reported but not compared
+NOISE_FLOOR_SECONDS = 1.0
+MIN_MB_SLACK = 2.0
+
+MB = 1024 * 1024
+
+
+@dataclass
+class StageResult:
+    """Wall time and memory of one benchmarked stage.
+
+    `peak_mb` is the peak of Python allocations traced by tracemalloc during
+    the stage. `max_rss_mb` is the process's resident set high-water mark at
+    the end of the stage, which includes native allocations (DuckDB, Arrow).
+    """
+
+    seconds: float
+    peak_mb: float
+    max_rss_mb: float | None
+
+
+def _max_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, in kilobytes elsewhere
+    return max_rss / MB if sys.platform == "darwin" else max_rss / 1024
+
+
+@contextmanager
+def profile_stage(results: dict[str, StageResult], stage: str) -> Iterator[None]:
+    """Record the wall time and memory of the enclosed block as `results[stage]`.
+
+    Tracing allocations slows Python code down, so timings are only
+    comparable with a baseline recorded the same way.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    results[stage] = StageResult(seconds=seconds, peak_mb=peak / MB, max_rss_mb=_max_rss_mb())
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {"version": 1, "shapes": {}}
+
+
+def save_baseline(shape_key: str, results: dict[str, StageResult], path: Path = BASELINE_PATH) -> None:
+    """Record the results of a shape in the baseline, keeping the other shapes."""
+    baseline = load_baseline(path)
+    baseline["shapes"][shape_key] = {
+        "machine": f"{platform.system()} {platform.machine()}, Python {platform.python_version()}",
+        "stages": {
+            stage: {"seconds": round(r.seconds, 3), "peak_mb": round(r.peak_mb, 1)} for stage, r in results.items()
+        },
+    }
+    baseline["shapes"] = dict(sorted(baseline["shapes"].items()))
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def regressions(result: StageResult, baseline: dict[str, float], tolerance: float = TOLERANCE) -> list[str]:
+    """Describe how a stage exceeds its baseline by more than the tolerance, if it does.
+
+    Times are only compared for stages whose baseline is above the noise floor.
+    """
+    problems = []
+    max_seconds = max(baseline["seconds"] * (1 + tolerance), baseline["seconds"] + MIN_SECONDS_SLACK)
+    if baseline["seconds"] >= NOISE_FLOOR_SECONDS and result.seconds > max_seconds:
+        problems.append(f"took {result.seconds:.2f}s (baseline {baseline['seconds']:.2f}s)")
+    max_mb = max(baseline["peak_mb"] * (1 + tolerance), baseline["peak_mb"] + MIN_MB_SLACK)
+    if result.peak_mb > max_mb:
+        problems.append(f"peaked at {result.peak_mb:.1f}MB (baseline {baseline['peak_mb']:.1f}MB)")
+    return problems
+
+
+def format_results(shape_key: str, results: dict[str, StageResult], baseline: dict[str, dict] | None) -> str:
+    """Render the results as a text table, next to the baseline when there is one."""
+    lines = [f"sync benchmark — {shape_key}", f"{'stage':<30} {'seconds':>10} {'peak MB':>10} {'max RSS MB':>11}"]
+    for stage, r in results.items():
+        rss = f"{r.max_rss_mb:.0f}" if r.max_rss_mb is not None else "-"
+        line = f"{stage:<30} {r.seconds:>10.2f} {r.peak_mb:>10.1f} {rss:>11}"
+        if baseline and stage in baseline:
+            line += f"   (baseline {baseline[stage]['seconds']:.2f}s, {baseline[stage]['peak_mb']:.1f}MB)"
+            if baseline[stage]["seconds"] < NOISE_FLOOR_SECONDS:
+                line += " time not checked"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def to_dict(results: dict[str, StageResult]) -> dict[str, dict]:
+    return {stage: asdict(r) for stage, r in results.items()}
@@ -0,0 +1,113 @@
+"""Synthetic large-catalog DuckDB databases for the sync benchmarks."""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+
+# Column expressions cycled through, so tables mix the common column types
+COLUMN_EXPRESSIONS = [
+    "range::INTEGER",
+    "'value_' || range",
+    "range * 1.5::DOUBLE",
+    "DATE '2024-01-01' + range::INTEGER",
+    "range % 2 = 0",
+]
+
+CACHE_DIR = Path(os.environ.get("NAO_BENCH_CACHE_DIR", Path(tempfile.gettempdir()) / "nao-bench"))
+
+
+@dataclass(frozen=True)
+class CatalogShape:
+    """Size of a synthetic catalog.
+
+    Tables are views over `range(rows)` by default, so a large catalog costs
+    little disk space while every row is still produced by the engine when
+    queried. `materialize` stores them as real tables instead.
+    """
+
+    schemas: int
+    tables: int
+    """Tables per schema"""
+    columns: int
+    rows: int = 100
+    materialize: bool = False
+
+    @property
+    def key(self) -> str:
+        """Identifier of the shape, used for the cached database and the baseline."""
+        storage = "tables" if self.materialize else "views"
+        return f"{self.schemas}x{self.tables}x{self.columns}-rows{self.rows}-{storage}"
+
+    @property
+    def table_count(self) -> int:
+        return self.schemas * self.tables
+
+
+SHAPES = {
+    "small": CatalogShape(schemas=5, tables=100, columns=20),
+    "medium": CatalogShape(schemas=20, tables=500, columns=50),
+    # Known unsupported: sync slows down and runs out of memory before finishing, see test_sync_benchmark
+    "large": CatalogShape(schemas=50, tables=1000, columns=50),
+}
+
+
+def shape_from_env() -> CatalogShape:
+    """Build the shape from NAO_BENCH_SHAPE, overridden by the individual NAO_BENCH_* sizes."""
+    base = SHAPES[os.environ.get("NAO_BENCH_SHAPE", "small")]
+    return CatalogShape(
+        schemas=int(os.environ.get("NAO_BENCH_SCHEMAS", base.schemas)),
+        tables=int(os.environ.get("NAO_BENCH_TABLES", base.tables)),
+        columns=int(os.environ.get("NAO_BENCH_COLUMNS", base.columns)),
+        rows=int(os.environ.get("NAO_BENCH_ROWS", base.rows)),
+        materialize=os.environ.get("NAO_BENCH_MATERIALIZE", str(base.materialize)).lower() in ("1", "true", "yes"),
+    )
+
+
+def schema_name(index: int) -> str:
+    return f"schema_{index:03d}"
+
+
+def table_name(index: int) -> str:
+    return f"table_{index:04d}"
+
+
+def generate_catalog(path: Path, shape: CatalogShape) -> Path:
+    """Create a DuckDB database with the given shape at `path`.
+
+    The database is written next to `path` and renamed into place, so an
+    interrupted generation never leaves a partial catalog behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    select = ", ".join(
+        f"{COLUMN_EXPRESSIONS[i % len(COLUMN_EXPRESSIONS)]} AS col_{i:03d}" for i in range(shape.columns)
+    )
+    kind = "TABLE" if shape.materialize else "VIEW"
+
+    conn = duckdb.connect(str(tmp_path))
+    try:
+        conn.execute("BEGIN")
+        for s in range(shape.schemas):
+            conn.execute(f"CREATE SCHEMA {schema_name(s)}")
+            for t in range(shape.tables):
+                conn.execute(
+                    f"CREATE {kind} {schema_name(s)}.{table_name(t)} AS SELECT {select} FROM range({shape.rows})"
+                )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+def cached_catalog(shape: CatalogShape) -> Path:
+    """Get the database of a shape, generating it on first use."""
+    path = CACHE_DIR / f"catalog-{shape.key}.duckdb"
+    if not path.exists():
+        generate_catalog(path, shape)
+    return path
@@ -0,0 +1,22 @@
+"""Unit tests for the benchmark baseline comparison."""
+
+from .harness import StageResult, regressions
+
+
+def test_regressions_beyond_tolerance_are_reported():
+    baseline = {"seconds": 10.0, "peak_mb": 50.0}
+
+    assert regressions(StageResult(seconds=12.0, peak_mb=55.0, max_rss_mb=None), baseline) == []
+    assert regressions(StageResult(seconds=13.0, peak_mb=70.0, max_rss_mb=None), baseline) == [
+        "took 13.00s (baseline 10.00s)",
+        "peaked at 70.0MB (baseline 50.0MB)",
+    ]
+
+
+def test_times_below_noise_floor_are_not_compared():
+    baseline = {"seconds": 0.01, "peak_mb": 0.1}
+
+    assert regressions(StageResult(seconds=2.4, peak_mb=0.1, max_rss_mb=None), baseline) == []
+    assert regressions(StageResult(seconds=2.4, peak_mb=5.0, max_rss_mb=None), baseline) == [
+        "peaked at 5.0MB (baseline 0.1MB)"
+    ]
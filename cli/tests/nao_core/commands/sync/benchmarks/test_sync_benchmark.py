@@ -0,0 +1,139 @@
+"""End-to-end sync benchmarks on a synthetic large-catalog DuckDB database.
+
+Times and memory-profiles `sync_database`, `render_all_templates` and
+`cleanup_stale_paths`, and compares them with the stored baseline.
+
+Configured via environment variables:
+    NAO_BENCH (required), NAO_BENCH_SHAPE (small or medium, default small; see below for large),
+    NAO_BENCH_SCHEMAS, NAO_BENCH_TABLES, NAO_BENCH_COLUMNS, NAO_BENCH_ROWS,
+    NAO_BENCH_MATERIALIZE (override the preset's sizes),
+    NAO_BENCH_TOLERANCE (allowed regression over the baseline, default 0.25;
+    stages whose baseline is under a second are only checked for memory),
+    NAO_BENCH_UPDATE_BASELINE (record the results as the new baseline),
+    NAO_BENCH_REPORT (path of a JSON report of the results),
+    NAO_BENCH_CACHE_DIR (where generated catalogs are kept between runs).
+
+Baselines are recorded for the small and medium shapes only. The large
+shape (50k tables) is known to be unsupported: sync time per table grows
+with the catalog size (about 36ms for small, 64ms for medium), and a large
+run reached 2.9GB RSS, still slowing down, before it was stopped at 39k tables.
+It is kept to reproduce that, not as a configuration expected to finish.
+
+The suite is skipped entirely when NAO_BENCH is not set. Run it with
+`NAO_BENCH=1 pytest tests/nao_core/commands/sync/benchmarks -s` to see the
+results table.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from rich.progress import Progress
+
+from nao_core.commands.sync.cleanup import DatabaseSyncState, SyncManifest, cleanup_stale_paths
+from nao_core.commands.sync.providers.databases.catalog import CATALOG_FILENAME, CatalogIndex
+from nao_core.commands.sync.providers.databases.provider import sync_database
+from nao_core.config import NaoConfig
+from nao_core.config.databases import DuckDBConfig
+from nao_core.templates.render import render_all_templates
+
+from .harness import StageResult, format_results, load_baseline, profile_stage, regressions, save_baseline, to_dict
+from .synthetic import CatalogShape, cached_catalog, schema_name, shape_from_env, table_name
+
+pytestmark = pytest.mark.skipif(not os.environ.get("NAO_BENCH"), reason="NAO_BENCH not set — skipping sync benchmarks")
+
+STAGES = ["sync_database", "render_all_templates", "cleanup_stale_paths", "cleanup_stale_paths_manifest"]
+
+# User templates rendered per schema, with the calls user templates typically make
+USER_TEMPLATE = """\
+# {schema}
+{{% set db = nao.database('bench') %}}
+{{% for row in db.query("SELECT table_name FROM information_schema.tables WHERE table_schema = '{schema}' ORDER BY 1") %}}
+- {{{{ row.table_name }}}}
+{{% endfor %}}
+{{% for table in {tables} %}}
+{{{{ table }}}}: {{{{ db.table('{schema}', table).row_count() }}}} rows, {{{{ db.table('{schema}', table).column_count() }}}} columns
+{{% endfor %}}
+"""
+
+
+def _without_tables(state: DatabaseSyncState, dropped: set[int]) -> DatabaseSyncState:
+    """Copy of a sync state, as if tables whose index modulo 10 is in `dropped` were deleted."""
+    remaining = DatabaseSyncState(db_path=state.db_path)
+    for schema, tables in state.synced_tables.items():
+        remaining.add_schema(schema)
+        for table in tables:
+            if int(table.removeprefix("table_")) % 10 not in dropped:
+                remaining.add_table(schema, table)
+    return remaining
+
+
+@pytest.fixture(scope="module")
+def shape() -> CatalogShape:
+    return shape_from_env()
+
+
+@pytest.fixture(scope="module")
+def results(shape: CatalogShape, tmp_path_factory) -> dict[str, StageResult]:
+    """Run every stage once on the synthetic catalog and return their results."""
+    catalog = cached_catalog(shape)
+    project = tmp_path_factory.mktemp("bench_project")
+    output = project / "databases"
+    db_config = DuckDBConfig(name="bench", path=str(catalog), include=["schema_*.*"])
+    config = NaoConfig(project_name="bench", databases=[db_config])
+
+    tables = [table_name(t) for t in range(min(shape.tables, 5))]
+    for s in range(shape.schemas):
+        template = project / "docs" / f"{schema_name(s)}.md.j2"
+        template.parent.mkdir(parents=True, exist_ok=True)
+        template.write_text(USER_TEMPLATE.format(schema=schema_name(s), tables=tables))
+
+    results: dict[str, StageResult] = {}
+    # Tables are recorded in the catalog as they sync, like `nao sync` does
+    with (
+        profile_stage(results, "sync_database"),
+        Progress(transient=True) as progress,
+        CatalogIndex(output / CATALOG_FILENAME) as catalog,
+    ):
+        state = sync_database(db_config, output, progress, project_path=project, catalog=catalog)
+    assert state.tables_synced == shape.table_count
+    with CatalogIndex(output / CATALOG_FILENAME) as catalog:
+        assert len(catalog.find_tables(table_name(0))) == shape.schemas
+
+    with profile_stage(results, "render_all_templates"):
+        rendered = render_all_templates(project, config, console=Console(quiet=True))
+    assert rendered.templates_failed == 0, rendered.errors
+
+    # First cleanup walks the output tree, as without a manifest
+    first = _without_tables(state, {0})
+    with profile_stage(results, "cleanup_stale_paths"):
+        removed = cleanup_stale_paths(first)
+    assert removed == shape.table_count - first.tables_synced
+
+    manifest = SyncManifest(base_path=output)
+    manifest.record(first)
+    second = _without_tables(state, {0, 1})
+    with profile_stage(results, "cleanup_stale_paths_manifest"):
+        removed = cleanup_stale_paths(second, manifest=manifest)
+    assert removed == first.tables_synced - second.tables_synced
+
+    baseline = load_baseline()["shapes"].get(shape.key, {}).get("stages")
+    print("\n" + format_results(shape.key, results, baseline))
+    if report := os.environ.get("NAO_BENCH_REPORT"):
+        Path(report).write_text(json.dumps({"shape": shape.key, "stages": to_dict(results)}, indent=2))
+    if os.environ.get("NAO_BENCH_UPDATE_BASELINE"):
+        save_baseline(shape.key, results)
+    return results
+
+
+@pytest.mark.parametrize("stage", STAGES)
+def test_stage_within_baseline(results: dict[str, StageResult], shape: CatalogShape, stage: str):
+    baseline = load_baseline()["shapes"].get(shape.key, {}).get("stages", {}).get(stage)
+    if baseline is None:
+        pytest.skip(f"No baseline for {shape.key}, record one with NAO_BENCH_UPDATE_BASELINE=1")
+
+    problems = regressions(results[stage], baseline)
+
+    assert not problems, f"{stage} regressed on {shape.key}: {'; '.join(problems)}"
@@ -0,0 +1,37 @@
+"""Unit tests for the synthetic catalog generator."""
+
+import duckdb
+
+from .synthetic import CatalogShape, generate_catalog, shape_from_env
+
+
+def test_generated_catalog_has_the_requested_shape(tmp_path):
+    shape = CatalogShape(schemas=2, tables=3, columns=7, rows=5)
+
+    path = generate_catalog(tmp_path / "catalog.duckdb", shape)
+
+    conn = duckdb.connect(str(path), read_only=True)
+    try:
+        tables = conn.execute(
+            "SELECT table_schema, count(*) FROM information_schema.tables "
+            "WHERE table_schema LIKE 'schema_%' GROUP BY 1 ORDER BY 1"
+        ).fetchall()
+        columns = conn.execute("SELECT * FROM schema_001.table_0002").description
+        rows = conn.execute("SELECT count(*) FROM schema_001.table_0002").fetchone()
+    finally:
+        conn.close()
+
+    assert tables == [("schema_000", 3), ("schema_001", 3)]
+    assert len(columns) == 7
+    assert rows == (5,)
+    assert [p.name for p in tmp_path.iterdir()] == ["catalog.duckdb"]
+
+
+def test_shape_from_env_overrides_preset(monkeypatch):
+    monkeypatch.setenv("NAO_BENCH_SHAPE", "large")
+    monkeypatch.setenv("NAO_BENCH_ROWS", "0")
+
+    shape = shape_from_env()
+
+    assert (shape.schemas, shape.tables, shape.columns, shape.rows) == (50, 1000, 50, 0)
+    assert shape.key == "50x1000x50-rows0-views"
@@ -269,6 +269,30 @@ class BaseSyncIntegrationTests:
         assert spec.primary_schema in schemas
         assert spec.another_schema in schemas
 
+    def test_get_schemas_applies_include_patterns(self, db_config, spec):
+        """Schemas no include pattern can match are filtered out by get_schemas."""
+        if spec.schema_field is None:
+            pytest.skip("Provider does not support multi-schema test")
+
+        config = db_config.model_copy(
+            update={spec.schema_field: None, "include": [f"{spec.effective_filter_schema}.*"]}
+        )
+        conn = config.connect()
+        schemas = config.get_schemas(conn)
+
+        assert [s.lower() for s in schemas] == [spec.effective_filter_schema.lower()]
+
+    def test_list_all_tables_matches_per_schema_listing(self, db_config):
+        """Bulk table listing returns the same tables as listing schema by schema."""
+        conn = db_config.connect()
+        schemas = db_config.get_schemas(conn)
+        tables_by_schema = db_config.list_all_tables(conn, schemas)
+        if tables_by_schema is None:
+            pytest.skip("Provider does not support bulk table listing")
+
+        for schema in schemas:
+            assert sorted(tables_by_schema[schema]) == sorted(conn.list_tables(database=schema))
+
     # ── multi-schema sync ────────────────────────────────────────────
 
     def test_sync_all_schemas(self, tmp_path_factory, db_config, spec):
@@ -0,0 +1,151 @@
+"""Unit tests for the database catalog index."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import duckdb
+import pytest
+
+from nao_core.commands.sync.cleanup import DatabaseSyncState
+from nao_core.commands.sync.providers.databases.catalog import CATALOG_FILENAME, CatalogIndex, MemoizedContext
+from nao_core.commands.sync.providers.databases.provider import sync_database
+from nao_core.config.databases.duckdb import DuckDBConfig
+
+
+def _make_ctx(columns=None, row_count=42, description="Orders placed", partitions=None):
+    ctx = MagicMock()
+    ctx.columns.return_value = columns or [
+        {"name": "id", "type": "int64 NOT NULL", "nullable": False, "description": None},
+        {"name": "customer_id", "type": "int64", "nullable": True, "description": "Buyer"},
+    ]
+    ctx.row_count.return_value = row_count
+    ctx.description.return_value = description
+    ctx.partition_columns.return_value = partitions or []
+    return ctx
+
+
+@pytest.fixture
+def catalog(tmp_path: Path):
+    with CatalogIndex(tmp_path / CATALOG_FILENAME) as catalog:
+        yield catalog
+
+
+class TestMemoizedContext:
+    def test_repeated_calls_hit_context_once(self):
+        inner = _make_ctx()
+        ctx = MemoizedContext(inner)
+
+        assert ctx.row_count() == 42
+        assert ctx.row_count() == 42
+        inner.row_count.assert_called_once()
+
+    def test_arguments_are_part_of_cache_key(self):
+        inner = MagicMock()
+        inner.preview.side_effect = lambda limit=10: list(range(limit))
+        ctx = MemoizedContext(inner)
+
+        assert ctx.preview(limit=2) == [0, 1]
+        assert ctx.preview(limit=3) == [0, 1, 2]
+        assert inner.preview.call_count == 2
+
+    def test_warehouse_time_counts_uncached_calls(self):
+        inner = _make_ctx()
+        ctx = MemoizedContext(inner)
+
+        with patch("nao_core.commands.sync.providers.databases.catalog.time.monotonic", side_effect=[0.0, 2.0]):
+            ctx.row_count()
+            ctx.row_count()
+
+        assert ctx.warehouse_time == 2.0
+
+    def test_cached_returns_none_when_not_fetched(self):
+        ctx = MemoizedContext(_make_ctx())
+
+        assert ctx.cached("row_count") is None
+        ctx.row_count()
+        assert ctx.cached("row_count") == 42
+
+
+class TestCatalogIndex:
+    def test_upsert_and_find_columns(self, catalog: CatalogIndex):
+        catalog.upsert_table("duckdb", "db", "main", "orders", MemoizedContext(_make_ctx()))
+        catalog.upsert_table("duckdb", "db", "main", "refunds", MemoizedContext(_make_ctx()))
+
+        matches = catalog.find_columns("CUSTOMER_ID")
+
+        assert [m["table_name"] for m in matches] == ["orders", "refunds"]
+        assert matches[0]["description"] == "Buyer"
+
+    def test_only_records_already_fetched_values(self, catalog: CatalogIndex):
+        inner = _make_ctx()
+        catalog.upsert_table("duckdb", "db", "main", "orders", MemoizedContext(inner))
+
+        table = catalog.find_tables("orders")[0]
+        assert table["row_count"] is None
+        assert table["description"] is None
+        assert table["column_count"] == 2
+        inner.row_count.assert_not_called()
+
+    def test_records_fetched_values(self, catalog: CatalogIndex):
+        ctx = MemoizedContext(_make_ctx(partitions=["id"]))
+        ctx.row_count()
+        ctx.description()
+        ctx.partition_columns()
+        catalog.upsert_table("duckdb", "db", "main", "orders", ctx)
+
+        table = catalog.find_tables("orders")[0]
+        assert table["row_count"] == 42
+        assert table["description"] == "Orders placed"
+        assert table["partition_columns"] == ["id"]
+
+    def test_upsert_replaces_dropped_columns(self, catalog: CatalogIndex):
+        catalog.upsert_table("duckdb", "db", "main", "orders", MemoizedContext(_make_ctx()))
+        only_id = [{"name": "id", "type": "int64", "nullable": True, "description": None}]
+        catalog.upsert_table("duckdb", "db", "main", "orders", MemoizedContext(_make_ctx(columns=only_id)))
+
+        assert catalog.find_columns("customer_id") == []
+
+    def test_prune_removes_tables_not_in_state(self, catalog: CatalogIndex, tmp_path: Path):
+        catalog.upsert_table("duckdb", "db", "main", "orders", MemoizedContext(_make_ctx()))
+        catalog.upsert_table("duckdb", "db", "main", "legacy", MemoizedContext(_make_ctx()))
+        catalog.upsert_table("duckdb", "other", "main", "legacy", MemoizedContext(_make_ctx()))
+        state = DatabaseSyncState(db_path=tmp_path)
+        state.add_table("main", "orders")
+
+        removed = catalog.prune("duckdb", "db", state)
+
+        assert removed == 1
+        assert [t["database"] for t in catalog.find_tables("legacy")] == ["other"]
+        assert {c["table_name"] for c in catalog.find_columns("id")} == {"orders", "legacy"}
+
+    def test_prune_databases_removes_unconfigured(self, catalog: CatalogIndex):
+        catalog.upsert_table("duckdb", "db", "main", "orders", MemoizedContext(_make_ctx()))
+        catalog.upsert_table("postgres", "gone", "public", "orders", MemoizedContext(_make_ctx()))
+
+        removed = catalog.prune_databases({("duckdb", "db")})
+
+        assert removed == 1
+        assert [t["db_type"] for t in catalog.find_tables("orders")] == ["duckdb"]
+
+
+class TestSyncDatabaseCatalog:
+    def test_sync_records_tables_in_catalog(self, tmp_path: Path):
+        db_file = tmp_path / "shop.duckdb"
+        with duckdb.connect(str(db_file)) as conn:
+            conn.execute("CREATE TABLE orders (id INTEGER NOT NULL, customer_id INTEGER)")
+            conn.execute("INSERT INTO orders VALUES (1, 10), (2, 20)")
+
+        config = DuckDBConfig(name="shop", path=str(db_file))
+        output = tmp_path / "databases"
+        progress = MagicMock()
+
+        with patch("nao_core.commands.sync.providers.databases.provider.console"):
+            with CatalogIndex(output / CATALOG_FILENAME) as catalog:
+                sync_database(config, output, progress, catalog=catalog)
+                columns = catalog.find_columns("customer_id")
+                tables = catalog.find_tables("orders")
+
+        assert len(columns) == 1
+        assert columns[0]["schema"] == "main"
+        assert tables[0]["row_count"] == 2
+        assert tables[0]["path"] == "type=duckdb/database=shop/schema=main/table=orders"
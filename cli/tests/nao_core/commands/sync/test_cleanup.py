@@ -5,10 +5,14 @@ from pathlib import Path
 from typing import List
 
 from nao_core.commands.sync.cleanup import (
+    MANIFEST_FILENAME,
     DatabaseSyncState,
+    SyncCheckpoint,
+    SyncManifest,
     cleanup_stale_databases,
     cleanup_stale_paths,
     cleanup_stale_repos,
+    remove_stale_paths,
 )
 from nao_core.config.repos import RepoConfig
 
@@ -214,6 +218,179 @@ class TestCleanupStalePaths:
         assert not table_path.exists()
 
 
+class TestSyncCheckpoint:
+    """Tests for the per-database sync checkpoint."""
+
+    def test_load_returns_empty_when_missing(self, tmp_path: Path):
+        assert SyncCheckpoint(db_path=tmp_path).load() == {}
+
+    def test_record_and_load(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint(db_path=tmp_path / "type=duckdb" / "database=test")
+        checkpoint.reset()
+        checkpoint.record("public", "users")
+        checkpoint.record("public", "orders")
+        checkpoint.record("sales", "deals")
+
+        assert checkpoint.load() == {"public": {"users", "orders"}, "sales": {"deals"}}
+
+    def test_load_ignores_truncated_line(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint(db_path=tmp_path)
+        checkpoint.reset()
+        checkpoint.record("public", "users")
+        with checkpoint.path.open("a") as f:
+            f.write('{"schema": "public", "tab')
+
+        assert checkpoint.load() == {"public": {"users"}}
+
+    def test_reset_and_clear(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint(db_path=tmp_path)
+        checkpoint.reset()
+        checkpoint.record("public", "users")
+
+        checkpoint.reset()
+        assert checkpoint.load() == {}
+
+        checkpoint.clear()
+        assert not checkpoint.path.exists()
+
+
+class TestSyncManifest:
+    """Tests for the persisted sync manifest."""
+
+    def test_load_returns_empty_manifest_when_missing(self, tmp_path: Path):
+        manifest = SyncManifest.load(tmp_path)
+
+        assert manifest.databases == {}
+        assert manifest.loaded is False
+
+    def test_save_and_load_roundtrip(self, tmp_path: Path):
+        state = DatabaseSyncState(db_path=tmp_path / "type=duckdb" / "database=test")
+        state.add_table("public", "users")
+        state.add_table("public", "orders")
+
+        manifest = SyncManifest(base_path=tmp_path)
+        manifest.record(state)
+        manifest.save()
+
+        loaded = SyncManifest.load(tmp_path)
+        assert (tmp_path / MANIFEST_FILENAME).exists()
+        assert loaded.loaded is True
+        assert loaded.databases == {"type=duckdb/database=test": {"public": {"users", "orders"}}}
+
+    def test_load_ignores_corrupt_manifest(self, tmp_path: Path):
+        (tmp_path / MANIFEST_FILENAME).write_text("{not json")
+
+        manifest = SyncManifest.load(tmp_path)
+
+        assert manifest.loaded is False
+
+
+class TestCleanupStalePathsWithManifest:
+    """Tests for manifest-driven cleanup_stale_paths."""
+
+    def _previous_manifest(self, base_path: Path, db_path: Path, tables: dict[str, set[str]]) -> SyncManifest:
+        manifest = SyncManifest(base_path=base_path, loaded=True)
+        manifest.databases[manifest.key_for(db_path)] = tables
+        return manifest
+
+    def test_removes_paths_recorded_in_manifest_but_not_synced(self, tmp_path: Path):
+        db_path = tmp_path / "type=duckdb" / "database=test"
+        (db_path / "schema=public" / "table=users").mkdir(parents=True)
+        (db_path / "schema=public" / "table=stale").mkdir(parents=True)
+        (db_path / "schema=old" / "table=events").mkdir(parents=True)
+        manifest = self._previous_manifest(tmp_path, db_path, {"public": {"users", "stale"}, "old": {"events"}})
+
+        state = DatabaseSyncState(db_path=db_path)
+        state.add_schema("public")
+        state.add_table("public", "users")
+
+        removed = cleanup_stale_paths(state, manifest=manifest)
+
+        assert removed == 2
+        assert (db_path / "schema=public" / "table=users").exists()
+        assert not (db_path / "schema=public" / "table=stale").exists()
+        assert not (db_path / "schema=old").exists()
+        assert manifest.get(db_path) == {"public": {"users"}}
+
+    def test_does_not_walk_paths_missing_from_manifest(self, tmp_path: Path):
+        """Directories never written by a sync are left alone when a manifest entry exists."""
+        db_path = tmp_path / "type=duckdb" / "database=test"
+        (db_path / "schema=public" / "table=users").mkdir(parents=True)
+        (db_path / "schema=public" / "table=manual").mkdir(parents=True)
+        manifest = self._previous_manifest(tmp_path, db_path, {"public": {"users"}})
+
+        state = DatabaseSyncState(db_path=db_path)
+        state.add_table("public", "users")
+
+        removed = cleanup_stale_paths(state, manifest=manifest)
+
+        assert removed == 0
+        assert (db_path / "schema=public" / "table=manual").exists()
+
+    def test_falls_back_to_walk_when_database_not_in_manifest(self, tmp_path: Path):
+        db_path = tmp_path / "type=duckdb" / "database=test"
+        (db_path / "schema=public" / "table=users").mkdir(parents=True)
+        (db_path / "schema=public" / "table=stale").mkdir(parents=True)
+        manifest = SyncManifest(base_path=tmp_path)
+
+        state = DatabaseSyncState(db_path=db_path)
+        state.add_table("public", "users")
+
+        removed = cleanup_stale_paths(state, manifest=manifest)
+
+        assert removed == 1
+        assert manifest.get(db_path) == {"public": {"users"}}
+
+    def test_dry_run_reports_without_removing(self, tmp_path: Path):
+        db_path = tmp_path / "type=duckdb" / "database=test"
+        (db_path / "schema=public" / "table=users").mkdir(parents=True)
+        (db_path / "schema=public" / "table=stale").mkdir(parents=True)
+        manifest = self._previous_manifest(tmp_path, db_path, {"public": {"users", "stale"}})
+
+        state = DatabaseSyncState(db_path=db_path)
+        state.add_table("public", "users")
+
+        removed = cleanup_stale_paths(state, manifest=manifest, dry_run=True)
+
+        assert removed == 1
+        assert (db_path / "schema=public" / "table=stale").exists()
+        # Stale table stays recorded so a later real run still removes it
+        assert manifest.get(db_path) == {"public": {"users", "stale"}}
+
+    def test_dry_run_without_manifest_entry_then_real_run_removes(self, tmp_path: Path):
+        db_path = tmp_path / "type=duckdb" / "database=test"
+        (db_path / "schema=public" / "table=users").mkdir(parents=True)
+        (db_path / "schema=public" / "table=stale").mkdir(parents=True)
+        (db_path / "schema=old" / "table=gone").mkdir(parents=True)
+        state = DatabaseSyncState(db_path=db_path)
+        state.add_table("public", "users")
+
+        manifest = SyncManifest.load(tmp_path)
+        assert cleanup_stale_paths(state, manifest=manifest, dry_run=True) == 2
+        manifest.save()
+
+        manifest = SyncManifest.load(tmp_path)
+        assert cleanup_stale_paths(state, manifest=manifest) == 2
+        assert not (db_path / "schema=public" / "table=stale").exists()
+        assert not (db_path / "schema=old").exists()
+        assert (db_path / "schema=public" / "table=users").exists()
+
+
+class TestRemoveStalePaths:
+    def test_skips_paths_nested_under_removed_parent(self, tmp_path: Path):
+        parent = tmp_path / "schema=old"
+        child = parent / "table=events"
+        child.mkdir(parents=True)
+
+        removed = remove_stale_paths([child, parent])
+
+        assert removed == [parent]
+        assert not parent.exists()
+
+    def test_ignores_missing_paths(self, tmp_path: Path):
+        assert remove_stale_paths([tmp_path / "missing"]) == []
+
+
 class TestCleanupStaleDatabases:
     """Tests for cleanup_stale_databases function."""
 
@@ -263,6 +440,39 @@ class TestCleanupStaleDatabases:
         assert (tmp_path / "type=duckdb" / "database=valid").exists()
         assert not (tmp_path / "type=duckdb" / "database=old").exists()
 
+    def test_removes_databases_recorded_in_manifest(self, tmp_path: Path):
+        """Stale databases are computed from the manifest when one was loaded."""
+        (tmp_path / "type=duckdb" / "database=valid").mkdir(parents=True)
+        (tmp_path / "type=duckdb" / "database=old").mkdir(parents=True)
+        (tmp_path / "type=postgres" / "database=prod").mkdir(parents=True)
+        manifest = SyncManifest(base_path=tmp_path, loaded=True)
+        manifest.databases = {
+            "type=duckdb/database=valid": {},
+            "type=duckdb/database=old": {},
+            "type=postgres/database=prod": {},
+        }
+
+        removed = cleanup_stale_databases(
+            [DBConfig(type="duckdb", path="/tmp/valid.duckdb")], tmp_path, manifest=manifest
+        )
+
+        assert removed == 2
+        assert (tmp_path / "type=duckdb" / "database=valid").exists()
+        assert not (tmp_path / "type=duckdb" / "database=old").exists()
+        assert not (tmp_path / "type=postgres").exists()
+        assert set(manifest.databases) == {"type=duckdb/database=valid"}
+
+    def test_dry_run_keeps_stale_databases(self, tmp_path: Path):
+        (tmp_path / "type=postgres" / "database=old").mkdir(parents=True)
+
+        removed = cleanup_stale_databases([DBConfig(type="duckdb", path="/tmp/test.duckdb")], tmp_path, dry_run=True)
+
+        assert removed == 1
+        assert (tmp_path / "type=postgres" / "database=old").exists()
+
+    def test_no_error_when_base_path_missing(self, tmp_path: Path):
+        assert cleanup_stale_databases([], tmp_path / "missing") == 0
+
 
 class TestCleanupStaleRespositories:
     def test_remove_unused_repos(self, tmp_path: Path):
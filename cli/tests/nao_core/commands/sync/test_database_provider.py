@@ -3,8 +3,13 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from nao_core.commands.sync.providers.databases.provider import DatabaseSyncProvider
+import pytest
+
+from nao_core.commands.sync.cleanup import CHECKPOINT_FILENAME
+from nao_core.commands.sync.providers import SyncOptions
+from nao_core.commands.sync.providers.databases.provider import DatabaseSyncProvider, sync_database
 from nao_core.config.base import NaoConfig
+from nao_core.config.databases.base import DatabaseAccessor
 
 
 class TestDatabaseSyncProvider:
@@ -58,3 +63,86 @@ class TestDatabaseSyncProvider:
         mock_config.databases = []
 
         assert provider.should_sync(mock_config) is False
+
+
+def _mock_db_config(tables):
+    db_config = MagicMock()
+    db_config.name = "test_db"
+    db_config.type = "duckdb"
+    db_config.accessors = list(DatabaseAccessor)
+    db_config.get_database_name.return_value = "test_database"
+    db_config.get_schemas.return_value = ["main"]
+    db_config.matches_pattern.return_value = True
+    db_config.list_all_tables.return_value = None
+    db_config.connect.return_value.list_tables.return_value = tables
+    return db_config
+
+
+def _run_sync(db_config, tmp_path: Path, render, options=None):
+    engine = MagicMock()
+    engine.list_templates.return_value = ["databases/columns.md.j2"]
+    engine.render.side_effect = render
+    with patch("nao_core.commands.sync.providers.databases.provider.console"):
+        with patch("nao_core.commands.sync.providers.databases.provider.get_template_engine", return_value=engine):
+            state = sync_database(db_config, tmp_path, MagicMock(), options=options)
+    return state, engine
+
+
+class TestSyncDatabaseResume:
+    def _interrupted_sync(self, db_config, tmp_path: Path):
+        def render(template_name, table_name, **kwargs):
+            if table_name == "c":
+                raise KeyboardInterrupt
+            return f"# {table_name}"
+
+        with pytest.raises(KeyboardInterrupt):
+            _run_sync(db_config, tmp_path, render)
+
+    def test_resume_skips_completed_tables(self, tmp_path: Path):
+        db_config = _mock_db_config(["a", "b", "c"])
+        self._interrupted_sync(db_config, tmp_path)
+
+        state, engine = _run_sync(db_config, tmp_path, lambda *a, **k: "# ok", SyncOptions(resume=True))
+
+        rendered = [c.kwargs["table_name"] for c in engine.render.call_args_list]
+        assert rendered == ["c"]
+        assert state.synced_tables == {"main": {"a", "b", "c"}}
+        assert not (tmp_path / "type=duckdb" / "database=test_database" / CHECKPOINT_FILENAME).exists()
+
+    def test_without_resume_renders_everything(self, tmp_path: Path):
+        db_config = _mock_db_config(["a", "b", "c"])
+        self._interrupted_sync(db_config, tmp_path)
+
+        _, engine = _run_sync(db_config, tmp_path, lambda *a, **k: "# ok")
+
+        assert engine.render.call_count == 3
+
+    def test_resume_keeps_completed_tables_of_unlisted_schema(self, tmp_path: Path):
+        db_config = _mock_db_config(["a", "b", "c"])
+        self._interrupted_sync(db_config, tmp_path)
+        db_config.connect.return_value.list_tables.side_effect = RuntimeError("network blip")
+
+        state, _ = _run_sync(db_config, tmp_path, lambda *a, **k: "# ok", SyncOptions(resume=True))
+
+        assert state.synced_tables == {"main": {"a", "b"}}
+
+
+class TestSyncDatabaseBulkListing:
+    def test_uses_bulk_listing_when_supported(self, tmp_path: Path):
+        db_config = _mock_db_config([])
+        db_config.get_schemas.return_value = ["main", "empty"]
+        db_config.list_all_tables.return_value = {"main": ["a", "b"], "empty": []}
+
+        state, engine = _run_sync(db_config, tmp_path, lambda *a, **k: "# ok")
+
+        db_config.connect.return_value.list_tables.assert_not_called()
+        assert state.synced_tables == {"main": {"a", "b"}}
+
+    def test_falls_back_to_per_schema_listing_on_error(self, tmp_path: Path):
+        db_config = _mock_db_config(["a"])
+        db_config.list_all_tables.side_effect = RuntimeError("no information_schema")
+
+        state, _ = _run_sync(db_config, tmp_path, lambda *a, **k: "# ok")
+
+        db_config.connect.return_value.list_tables.assert_called_once_with(database="main")
+        assert state.synced_tables == {"main": {"a"}}
@@ -0,0 +1,396 @@
+"""Unit tests for the rate-limited Notion API client and page exporter."""
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from notion_client import APIResponseError
+
+from nao_core.commands.sync.cleanup import NotionManifest
+from nao_core.commands.sync.providers.base import SyncOptions
+from nao_core.commands.sync.providers.notion.api import NotionAPI, NotionPageExporter, TokenBucket
+from nao_core.commands.sync.providers.notion.cache import CachedPage, NotionPageCache
+from nao_core.commands.sync.providers.notion.provider import NotionSyncProvider, get_page_as_markdown
+from nao_core.config.notion import NotionConfig
+from nao_core.templates.context import NotionPage
+
+PAGE_ID = "0123456789abcdef0123456789abcdef"
+
+
+def _api_error(status: int, retry_after: str | None = None) -> APIResponseError:
+    # The constructor signature differs across notion-client versions
+    error = APIResponseError.__new__(APIResponseError)
+    error.status = status
+    error.headers = {"retry-after": retry_after} if retry_after is not None else {}
+    return error
+
+
+def _paragraph(block_id: str, text: str, has_children: bool = False, block_type: str = "paragraph") -> dict:
+    annotations = {"bold": False, "italic": False, "strikethrough": False, "underline": False, "code": False}
+    rich_text = {
+        "type": "text",
+        "plain_text": text,
+        "text": {"content": text, "link": None},
+        "annotations": {**annotations, "color": "default"},
+        "href": None,
+    }
+    return {"id": block_id, "type": block_type, "has_children": has_children, block_type: {"rich_text": [rich_text]}}
+
+
+def _page(page_id: str, title: str, last_edited_time: str = "2026-01-01T00:00:00.000Z") -> dict:
+    return {
+        "id": page_id,
+        "last_edited_time": last_edited_time,
+        "properties": {"Task": {"type": "title", "title": [{"plain_text": title}]}},
+    }
+
+
+def _child(block_id: str, block_type: str) -> dict:
+    return {"id": block_id, "type": block_type, "has_children": True, block_type: {"title": block_id}}
+
+
+class FakeClient:
+    """Minimal notion_client.Client serving a fixed block tree."""
+
+    def __init__(self, tree: dict[str, list[dict]], page_size: int = 100, rows: dict[str, list[dict]] | None = None):
+        self.tree = tree
+        self.page_size = page_size
+        self.rows = rows or {}
+        self.titles: dict[str, str] = {}
+        self.requested: list[str] = []
+        self.retrieved: list[str] = []
+        self.blocks = MagicMock()
+        self.blocks.children.list.side_effect = self._list
+        self.last_edited_time = "2026-01-01T00:00:00.000Z"
+        self.pages = MagicMock()
+        self.pages.retrieve.side_effect = self._retrieve
+        self.databases = MagicMock()
+        self.databases.query.side_effect = lambda database_id, page_size: {
+            "results": self.rows[database_id],
+            "has_more": False,
+        }
+
+    def _retrieve(self, page_id: str) -> dict:
+        self.retrieved.append(page_id)
+        return _page(page_id, self.titles.get(page_id, "Handbook"), self.last_edited_time)
+
+    def _list(self, block_id: str, page_size: int, start_cursor: str | None = None) -> dict:
+        self.requested.append(block_id)
+        start = int(start_cursor or 0)
+        blocks = self.tree.get(block_id, [])
+        end = start + min(page_size, self.page_size)
+        has_more = end < len(blocks)
+        return {"results": blocks[start:end], "has_more": has_more, "next_cursor": str(end) if has_more else None}
+
+
+class TestTokenBucket:
+    def test_allows_burst_then_waits_for_refill(self):
+        now = [0.0]
+        sleeps: list[float] = []
+        bucket = TokenBucket(rate=2, clock=lambda: now[0], sleep=sleeps.append)
+
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        assert sleeps == [0.5]
+
+    def test_refills_over_time(self):
+        now = [0.0]
+        sleeps: list[float] = []
+        bucket = TokenBucket(rate=2, clock=lambda: now[0], sleep=sleeps.append)
+
+        bucket.acquire()
+        bucket.acquire()
+        now[0] = 1.0
+        bucket.acquire()
+
+        assert sleeps == []
+
+
+class TestNotionAPI:
+    def test_retries_rate_limited_requests_honoring_retry_after(self):
+        sleeps: list[float] = []
+        fn = MagicMock(side_effect=[_api_error(429, "2"), _api_error(429), {"ok": True}])
+        api = NotionAPI("token", rate=1000, client=MagicMock(), sleep=sleeps.append)
+
+        assert api.call(fn, page_id="abc") == {"ok": True}
+        assert sleeps == [2.0, 2.0]
+        assert fn.call_count == 3
+
+    def test_does_not_retry_other_errors(self):
+        fn = MagicMock(side_effect=_api_error(404))
+        api = NotionAPI("token", rate=1000, client=MagicMock(), sleep=lambda s: None)
+
+        with pytest.raises(APIResponseError):
+            api.call(fn)
+        fn.assert_called_once()
+
+    def test_gives_up_after_max_retries(self):
+        fn = MagicMock(side_effect=_api_error(429, "1"))
+        api = NotionAPI("token", rate=1000, max_retries=2, client=MagicMock(), sleep=lambda s: None)
+
+        with pytest.raises(APIResponseError):
+            api.call(fn)
+        assert fn.call_count == 3
+
+    def test_get_children_follows_pagination(self):
+        blocks = [_paragraph(f"b{i}", f"line {i}") for i in range(5)]
+        api = NotionAPI("token", rate=1000, client=FakeClient({"page": blocks}, page_size=2))
+
+        assert [b["id"] for b in api.get_children("page")] == ["b0", "b1", "b2", "b3", "b4"]
+
+
+class TestNotionPageExporter:
+    def test_fetches_nested_blocks_but_not_child_pages(self):
+        client = FakeClient(
+            {
+                "page": [
+                    _paragraph("a", "Intro", has_children=True),
+                    _paragraph("sub", "Sub page", has_children=True, block_type="child_page"),
+                ],
+                "a": [_paragraph("a1", "Nested", has_children=True)],
+                "a1": [_paragraph("a11", "Deep")],
+            }
+        )
+
+        with NotionPageExporter(NotionAPI("token", rate=1000, client=client)) as exporter:
+            tree = exporter.fetch_blocks("page")
+
+        assert set(tree) == {"page", "a", "a1"}
+        assert "sub" not in client.requested
+
+    def test_get_page_as_markdown_uses_shared_exporter(self):
+        client = FakeClient({PAGE_ID: [_paragraph("a", "Hello world")]})
+
+        with NotionPageExporter(NotionAPI("token", rate=1000, client=client)) as exporter:
+            title, content = get_page_as_markdown(PAGE_ID, "token", exporter)
+
+        assert title == "Handbook"
+        assert "title: Handbook" in content
+        assert "Hello world" in content
+
+
+@patch("nao_core.commands.sync.providers.notion.provider.console")
+class TestNotionSyncProviderIncremental:
+    @staticmethod
+    def _sync(client: FakeClient, output: Path):
+        config = NotionConfig(api_key="token", pages=[f"https://www.notion.so/Handbook-{PAGE_ID}"])
+        with patch("nao_core.commands.sync.providers.notion.api.Client", return_value=client):
+            return NotionSyncProvider().sync([config], output)
+
+    def test_skips_export_of_unchanged_pages(self, mock_console, tmp_path: Path):
+        client = FakeClient({PAGE_ID: [_paragraph("a", "Hello world")]})
+
+        first = self._sync(client, tmp_path)
+        second = self._sync(client, tmp_path)
+
+        assert first.details["unchanged"] == 0
+        assert second.details["unchanged"] == 1
+        assert client.requested == [PAGE_ID]
+        assert "Hello world" in (tmp_path / "handbook.md").read_text()
+        assert NotionManifest.load(tmp_path).pages[PAGE_ID]["last_edited_time"] == client.last_edited_time
+
+    def test_reexports_edited_pages(self, mock_console, tmp_path: Path):
+        client = FakeClient({PAGE_ID: [_paragraph("a", "Hello world")]})
+        self._sync(client, tmp_path)
+
+        client.tree[PAGE_ID] = [_paragraph("a", "Goodbye")]
+        client.last_edited_time = "2026-02-01T00:00:00.000Z"
+        result = self._sync(client, tmp_path)
+
+        assert result.details["unchanged"] == 0
+        assert "Goodbye" in (tmp_path / "handbook.md").read_text()
+
+    def test_cleanup_uses_manifest(self, mock_console, tmp_path: Path):
+        (tmp_path / "notes.md").write_text("kept: not written by nao")
+        NotionManifest(tmp_path, pages={"f" * 32: {"file": "old.md", "title": "Old", "last_edited_time": ""}}).save()
+        (tmp_path / "old.md").write_text("stale")
+
+        result = self._sync(FakeClient({PAGE_ID: []}), tmp_path)
+
+        assert result.details["removed"] == 1
+        assert not (tmp_path / "old.md").exists()
+        assert (tmp_path / "notes.md").exists()
+
+    @pytest.mark.parametrize("with_manifest", [True, False])
+    def test_dry_run_then_real_run_removes_stale_page(self, mock_console, tmp_path: Path, with_manifest: bool):
+        if with_manifest:
+            NotionManifest(
+                tmp_path, pages={"f" * 32: {"file": "old.md", "title": "Old", "last_edited_time": ""}}
+            ).save()
+        (tmp_path / "old.md").write_text("stale")
+        config = NotionConfig(api_key="token", pages=[f"https://www.notion.so/Handbook-{PAGE_ID}"])
+
+        with patch("nao_core.commands.sync.providers.notion.api.Client", return_value=FakeClient({PAGE_ID: []})):
+            dry = NotionSyncProvider().sync([config], tmp_path, options=SyncOptions(dry_run=True))
+            real = NotionSyncProvider().sync([config], tmp_path)
+
+        assert dry.details["removed"] == 1
+        assert real.details["removed"] == 1
+        assert not (tmp_path / "old.md").exists()
+
+
+ROOT = "a" * 32
+CHILD = "b" * 32
+DATABASE = "c" * 32
+ROW = "d" * 32
+
+
+def _workspace() -> FakeClient:
+    client = FakeClient(
+        {
+            ROOT: [_paragraph("p", "Root"), _child(CHILD, "child_page"), _child(DATABASE, "child_database")],
+            # The child links back to the root, which must not be synced twice
+            CHILD: [_paragraph("p", "Child"), _child(ROOT, "child_page")],
+            ROW: [_paragraph("p", "Row")],
+        },
+        rows={DATABASE: [_page(ROW, "Launch")]},
+    )
+    client.titles = {ROOT: "Home", CHILD: "Guides"}
+    return client
+
+
+@patch("nao_core.commands.sync.providers.notion.provider.console")
+class TestNotionSyncProviderCrawl:
+    @staticmethod
+    def _sync(client: FakeClient, output: Path, **config):
+        config = NotionConfig(api_key="token", pages=[ROOT], **config)
+        with patch("nao_core.commands.sync.providers.notion.api.Client", return_value=client):
+            return NotionSyncProvider().sync([config], output)
+
+    def test_does_not_crawl_by_default(self, mock_console, tmp_path: Path):
+        result = self._sync(_workspace(), tmp_path)
+
+        assert result.details["pages"] == ["Home"]
+
+    def test_crawls_child_pages_and_database_rows_once(self, mock_console, tmp_path: Path):
+        client = _workspace()
+
+        result = self._sync(client, tmp_path, max_depth=2)
+
+        assert sorted(result.details["pages"]) == ["Guides", "Home", "Launch"]
+        assert sorted(client.requested) == sorted([ROOT, CHILD, ROW])
+        # Rows come with their page object from the database query
+        assert ROW not in client.retrieved
+        assert "Row" in (tmp_path / "launch.md").read_text()
+
+    def test_crawls_configured_databases(self, mock_console, tmp_path: Path):
+        config = NotionConfig(api_key="token", databases=[f"https://www.notion.so/{DATABASE}?v=1"])
+        with patch("nao_core.commands.sync.providers.notion.api.Client", return_value=_workspace()):
+            result = NotionSyncProvider().sync([config], tmp_path)
+
+        assert result.details["pages"] == ["Launch"]
+
+    def test_stops_at_max_pages(self, mock_console, tmp_path: Path):
+        result = self._sync(_workspace(), tmp_path, max_depth=2, max_pages=2)
+
+        assert len(result.details["pages"]) == 2
+        assert result.details["skipped"] == 1
+
+    def test_unchanged_pages_are_crawled_from_manifest(self, mock_console, tmp_path: Path):
+        self._sync(_workspace(), tmp_path, max_depth=1)
+        client = _workspace()
+
+        result = self._sync(client, tmp_path, max_depth=1)
+
+        assert result.details["unchanged"] == 3
+        assert client.requested == []
+
+    def test_duplicate_titles_get_distinct_files(self, mock_console, tmp_path: Path):
+        client = _workspace()
+        client.titles = {ROOT: "Notes", CHILD: "Notes"}
+
+        self._sync(client, tmp_path, max_depth=1)
+
+        assert sorted(p.name for p in tmp_path.glob("*.md")) == ["launch.md", "notes-bbbbbbbb.md", "notes.md"]
+
+    def test_duplicate_titles_are_named_by_page_id_not_sync_order(self, mock_console, tmp_path: Path):
+        # The root syncs first, but its same-titled child has the smaller id
+        root = "e" * 32
+        client = FakeClient({root: [_paragraph("p", "Root"), _child(CHILD, "child_page")], CHILD: []})
+        client.titles = {root: "Notes", CHILD: "Notes"}
+        config = NotionConfig(api_key="token", pages=[root], max_depth=1)
+
+        with patch("nao_core.commands.sync.providers.notion.api.Client", return_value=client):
+            first = NotionSyncProvider().sync([config], tmp_path)
+            second = NotionSyncProvider().sync([config], tmp_path)
+
+        assert "Root" in (tmp_path / "notes-eeeeeeee.md").read_text()
+        assert CHILD in (tmp_path / "notes.md").read_text()
+        assert {page["file"] for page in NotionManifest.load(tmp_path).pages.values()} == {
+            "notes.md",
+            "notes-eeeeeeee.md",
+        }
+        assert first.details["removed"] == 0
+        assert second.details["unchanged"] == 2
+
+    def test_duplicate_titles_keep_their_previous_filename(self, mock_console, tmp_path: Path):
+        client = _workspace()
+        client.titles = {ROOT: "Notes", CHILD: "Notes"}
+        NotionManifest(tmp_path, pages={CHILD: {"file": "notes.md", "title": "Notes", "last_edited_time": ""}}).save()
+
+        self._sync(client, tmp_path, max_depth=1)
+
+        assert "Child" in (tmp_path / "notes.md").read_text()
+        assert "Root" in (tmp_path / "notes-aaaaaaaa.md").read_text()
+
+
+class TestNotionPageCache:
+    def test_serves_entries_within_ttl(self, tmp_path: Path):
+        cache = NotionPageCache(tmp_path, ttl=60)
+        cache.put(CachedPage(PAGE_ID, "Handbook", "Hello", "v1"))
+
+        assert cache.get(PAGE_ID).content == "Hello"
+
+    def test_expired_entries_need_matching_last_edited_time(self, tmp_path: Path):
+        cache = NotionPageCache(tmp_path, ttl=60)
+        cache.put(CachedPage(PAGE_ID, "Handbook", "Hello", "v1", fetched_at=0.0))
+
+        assert cache.get(PAGE_ID) is None
+        assert cache.get(PAGE_ID, "v2") is None
+        assert cache.get(PAGE_ID, "v1").content == "Hello"
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        entry_size = len(json.dumps(asdict(CachedPage("a", "a", "x" * 150, "v1"))))
+        cache = NotionPageCache(tmp_path, max_bytes=3 * entry_size + 50)
+        for page_id in ("a", "b", "c"):
+            cache.put(CachedPage(page_id, page_id, "x" * 150, "v1"))
+            # Distinct mtimes so the eviction order is deterministic
+            (tmp_path / f"{page_id}.json").touch()
+            os.utime(tmp_path / f"{page_id}.json", (ord(page_id), ord(page_id)))
+        cache.get("a")
+
+        cache.put(CachedPage("d", "d", "x" * 150, "v1"))
+
+        assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["a", "c", "d"]
+
+
+@patch("nao_core.commands.sync.providers.notion.provider.console")
+class TestNotionCacheSharing:
+    def test_template_pages_are_cached_across_contexts(self, mock_console, tmp_path: Path):
+        client = FakeClient({PAGE_ID: [_paragraph("a", "Hello world")]})
+        cache = NotionPageCache(tmp_path / "cache")
+
+        with patch("nao_core.commands.sync.providers.notion.api.Client", return_value=client):
+            first = NotionPage(PAGE_ID, "token", cache=cache).content
+            second = NotionPage(PAGE_ID, "token", cache=cache).content
+
+        assert first == second
+        assert "Hello world" in first
+        assert client.requested == [PAGE_ID]
+        assert client.retrieved == [PAGE_ID]
+
+    def test_sync_reuses_export_from_template_rendering(self, mock_console, tmp_path: Path):
+        client = FakeClient({PAGE_ID: [_paragraph("a", "Hello world")]})
+        config = NotionConfig(api_key="token", pages=[PAGE_ID])
+
+        with patch("nao_core.commands.sync.providers.notion.api.Client", return_value=client):
+            NotionPage(PAGE_ID, "token", cache=NotionPageCache.for_project(tmp_path)).content
+            NotionSyncProvider().sync([config], tmp_path / "docs", project_path=tmp_path)
+
+        assert client.requested == [PAGE_ID]
+        assert "Hello world" in (tmp_path / "docs" / "handbook.md").read_text()
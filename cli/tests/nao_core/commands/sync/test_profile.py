@@ -0,0 +1,69 @@
+"""Unit tests for the sync profiler."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import duckdb
+
+from nao_core.commands.sync.profile import PROFILES_DIR, SyncProfiler
+from nao_core.commands.sync.providers import SyncOptions
+from nao_core.commands.sync.providers.databases.provider import sync_database
+from nao_core.config.databases.duckdb import DuckDBConfig
+
+
+def _profiler() -> SyncProfiler:
+    profiler = SyncProfiler()
+    profiler.record_phase("shop", "connect", 0.5)
+    profiler.record_phase("shop", "list_tables", 0.2, schema="main")
+    profiler.record_accessor("shop", "main", "orders", "preview", warehouse=3.0, jinja=0.1, write=0.01)
+    profiler.record_accessor("shop", "main", "orders", "columns", warehouse=0.2, jinja=0.05, write=0.01)
+    profiler.record_accessor("shop", "main", "users", "preview", warehouse=1.0, jinja=0.1, write=0.01)
+    return profiler
+
+
+class TestSyncProfiler:
+    def test_top_tables_sorted_by_total(self):
+        top = _profiler().top_tables(1)
+
+        assert len(top) == 1
+        assert top[0]["table"] == "orders"
+        assert set(top[0]["accessors"]) == {"preview", "columns"}
+
+    def test_top_accessors_sorted_by_total(self):
+        top = _profiler().top_accessors(2)
+
+        assert [(a["table"], a["accessor"]) for a in top] == [("orders", "preview"), ("users", "preview")]
+
+    def test_totals(self):
+        profiler = _profiler()
+
+        db = profiler.database_totals()["shop"]
+        assert db["connect"] == 0.5
+        assert db["warehouse"] == 4.2
+        assert profiler.accessor_totals()["preview"]["count"] == 2
+
+    def test_write_report(self, tmp_path: Path):
+        json_path, html_path = _profiler().write_report(tmp_path, top_n=5)
+
+        assert json_path.parent == tmp_path / PROFILES_DIR
+        data = json.loads(json_path.read_text())
+        assert data["top_tables"][0]["table"] == "orders"
+        assert "<table>" in html_path.read_text()
+
+
+class TestSyncDatabaseProfiling:
+    def test_records_phases_and_accessors(self, tmp_path: Path):
+        db_file = tmp_path / "shop.duckdb"
+        with duckdb.connect(str(db_file)) as conn:
+            conn.execute("CREATE TABLE orders AS SELECT 1 AS id")
+
+        profiler = SyncProfiler()
+        config = DuckDBConfig(name="shop", path=str(db_file))
+
+        with patch("nao_core.commands.sync.providers.databases.provider.console"):
+            sync_database(config, tmp_path / "databases", MagicMock(), options=SyncOptions(profiler=profiler))
+
+        assert {p.phase for p in profiler.phases} >= {"connect", "get_schemas", "list_tables"}
+        assert {a.accessor for a in profiler.accessors} == {"columns", "description", "preview"}
+        assert all(a.table == "orders" and a.warehouse >= 0 for a in profiler.accessors)
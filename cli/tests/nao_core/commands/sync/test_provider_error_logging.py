@@ -36,6 +36,7 @@ def create_mock_db_config(
     mock_config.get_database_name.return_value = database_name
     mock_config.get_schemas.return_value = schemas
     mock_config.matches_pattern.return_value = True
+    mock_config.list_all_tables.return_value = None
     mock_conn.list_tables.return_value = tables
 
     return mock_config
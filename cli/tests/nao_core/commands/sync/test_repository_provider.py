@@ -1,10 +1,17 @@
 """Unit tests for the repository sync provider."""
 
+import shutil
+import subprocess
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from nao_core.commands.sync.providers import SyncOptions
 from nao_core.commands.sync.providers.repositories.provider import (
     RepositorySyncProvider,
+    RepoSyncResult,
     clone_or_pull_repo,
 )
 from nao_core.config.base import NaoConfig
@@ -58,11 +65,35 @@ class TestRepositorySyncProvider:
             RepoConfig(name="repo2", url="https://github.com/test/repo2"),
             RepoConfig(name="repo3", url="https://github.com/test/repo3"),
         ]
-        mock_clone.side_effect = [True, False, True]  # 2 successes, 1 failure
+        mock_clone.side_effect = [
+            RepoSyncResult("repo1", "unchanged", 0.1),
+            RepoSyncResult("repo2", "failed", 0.1, "boom"),
+            RepoSyncResult("repo3", "updated", 0.2),
+        ]
 
-        result = provider.sync(repos, tmp_path)
+        result = provider.sync(repos, tmp_path, options=SyncOptions(jobs=1))
 
         assert result.items_synced == 2
+        assert result.summary == "1 updated, 1 unchanged, 1 failed"
+        assert [r["status"] for r in result.details["repos"]] == ["unchanged", "failed", "updated"]
+
+    @patch("nao_core.commands.sync.providers.repositories.provider.clone_or_pull_repo")
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_sync_runs_repos_concurrently(self, mock_console, mock_clone, tmp_path: Path):
+        provider = RepositorySyncProvider()
+        repos = [RepoConfig(name=f"repo{i}", url=f"https://github.com/test/repo{i}") for i in range(3)]
+        # Every call waits for the others: this only completes if all three run at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def clone(repo, path):
+            barrier.wait()
+            return RepoSyncResult(repo.name, "cloned", 0.1)
+
+        mock_clone.side_effect = clone
+
+        result = provider.sync(repos, tmp_path, options=SyncOptions(jobs=3))
+
+        assert result.items_synced == 3
 
     def test_should_sync_returns_true_when_repos_exist(self):
         provider = RepositorySyncProvider()
@@ -81,6 +112,20 @@ class TestRepositorySyncProvider:
         assert provider.should_sync(mock_config) is False
 
 
+def _git_run(responses: dict[str, MagicMock]):
+    """Fake subprocess.run answering each git subcommand with a canned result."""
+    ok = MagicMock(returncode=0, stdout="", stderr="")
+
+    def run(cmd, **kwargs):
+        return responses.get(cmd[1], ok)
+
+    return run
+
+
+def _commands(mock_run: MagicMock) -> list[list[str]]:
+    return [c[0][0][1:] for c in mock_run.call_args_list]
+
+
 class TestCloneOrPullRepo:
     @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
     @patch("nao_core.commands.sync.providers.repositories.provider.console")
@@ -90,7 +135,7 @@ class TestCloneOrPullRepo:
 
         result = clone_or_pull_repo(repo, tmp_path)
 
-        assert result is True
+        assert result.status == "cloned"
         mock_run.assert_called_once()
         call_args = mock_run.call_args
         assert "clone" in call_args[0][0]
@@ -107,67 +152,191 @@ class TestCloneOrPullRepo:
 
         result = clone_or_pull_repo(repo, tmp_path)
 
-        assert result is True
+        assert result.success
         call_args = mock_run.call_args[0][0]
         assert "-b" in call_args
         assert "develop" in call_args
 
     @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
     @patch("nao_core.commands.sync.providers.repositories.provider.console")
-    def test_pulls_existing_repo(self, mock_console, mock_run, tmp_path: Path):
-        # Create existing repo directory
-        repo_path = tmp_path / "existing-repo"
-        repo_path.mkdir()
-
+    def test_skips_unchanged_repo(self, mock_console, mock_run, tmp_path: Path):
+        (tmp_path / "existing-repo").mkdir()
         repo = RepoConfig(name="existing-repo", url="https://github.com/test/existing-repo")
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.side_effect = _git_run(
+            {
+                "ls-remote": MagicMock(returncode=0, stdout="abc123\tHEAD\n"),
+                "rev-parse": MagicMock(returncode=0, stdout="abc123\n"),
+            }
+        )
 
         result = clone_or_pull_repo(repo, tmp_path)
 
-        assert result is True
-        call_args = mock_run.call_args[0][0]
-        assert "pull" in call_args
+        assert result.status == "unchanged"
+        assert _commands(mock_run) == [["ls-remote", "origin", "HEAD"], ["rev-parse", "HEAD"]]
 
     @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
     @patch("nao_core.commands.sync.providers.repositories.provider.console")
-    def test_pulls_and_checkouts_branch(self, mock_console, mock_run, tmp_path: Path):
-        # Create existing repo directory
-        repo_path = tmp_path / "existing-repo"
-        repo_path.mkdir()
+    def test_fetches_and_fast_forwards_changed_repo(self, mock_console, mock_run, tmp_path: Path):
+        (tmp_path / "existing-repo").mkdir()
+        repo = RepoConfig(name="existing-repo", url="https://github.com/test/existing-repo")
+        mock_run.side_effect = _git_run(
+            {
+                "ls-remote": MagicMock(returncode=0, stdout="def456\tHEAD\n"),
+                "rev-parse": MagicMock(returncode=0, stdout="abc123\n"),
+            }
+        )
+
+        result = clone_or_pull_repo(repo, tmp_path)
+
+        assert result.status == "updated"
+        assert _commands(mock_run)[2:] == [["fetch", "origin"], ["merge", "--ff-only", "FETCH_HEAD"]]
 
+    @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_updates_branch_of_shallow_repo(self, mock_console, mock_run, tmp_path: Path):
+        (tmp_path / "existing-repo").mkdir()
         repo = RepoConfig(
             name="existing-repo",
             url="https://github.com/test/existing-repo",
             branch="feature",
+            depth=1,
         )
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.side_effect = _git_run({})
 
         result = clone_or_pull_repo(repo, tmp_path)
 
-        assert result is True
-        # Should have called git pull and git checkout
-        assert mock_run.call_count == 2
+        assert result.status == "updated"
+        assert _commands(mock_run) == [
+            ["ls-remote", "origin", "refs/heads/feature"],
+            ["fetch", "origin", "--depth", "1", "+refs/heads/feature:refs/remotes/origin/feature"],
+            ["checkout", "feature"],
+            ["reset", "--hard", "FETCH_HEAD"],
+        ]
 
     @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
     @patch("nao_core.commands.sync.providers.repositories.provider.console")
-    def test_returns_false_on_clone_failure(self, mock_console, mock_run, tmp_path: Path):
+    def test_returns_failure_on_clone_failure(self, mock_console, mock_run, tmp_path: Path):
         repo = RepoConfig(name="new-repo", url="https://github.com/test/new-repo")
         mock_run.return_value = MagicMock(returncode=1, stderr="Error cloning")
 
         result = clone_or_pull_repo(repo, tmp_path)
 
-        assert result is False
+        assert result.status == "failed"
+        assert result.error == "Error cloning"
 
     @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
     @patch("nao_core.commands.sync.providers.repositories.provider.console")
-    def test_returns_false_on_pull_failure(self, mock_console, mock_run, tmp_path: Path):
-        # Create existing repo directory
-        repo_path = tmp_path / "existing-repo"
-        repo_path.mkdir()
-
+    def test_returns_failure_on_fetch_failure(self, mock_console, mock_run, tmp_path: Path):
+        (tmp_path / "existing-repo").mkdir()
         repo = RepoConfig(name="existing-repo", url="https://github.com/test/existing-repo")
-        mock_run.return_value = MagicMock(returncode=1, stderr="Error pulling")
+        mock_run.side_effect = _git_run({"fetch": MagicMock(returncode=1, stdout="", stderr="Error fetching")})
+
+        result = clone_or_pull_repo(repo, tmp_path)
+
+        assert not result.success
+        assert result.error == "Error fetching"
+
+    @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_clones_shallow_partial_repo(self, mock_console, mock_run, tmp_path: Path):
+        repo = RepoConfig(name="dbt", url="https://github.com/test/dbt", depth=1, filter="blob:none")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        result = clone_or_pull_repo(repo, tmp_path)
+
+        assert result.success
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index("--depth") + 1] == "1"
+        assert call_args[call_args.index("--filter") + 1] == "blob:none"
+
+    @patch("nao_core.commands.sync.providers.repositories.provider.subprocess.run")
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_clones_with_sparse_paths(self, mock_console, mock_run, tmp_path: Path):
+        repo = RepoConfig(name="dbt", url="https://github.com/test/dbt", sparse_paths=["models/**"])
+        mock_run.return_value = MagicMock(returncode=0)
 
         result = clone_or_pull_repo(repo, tmp_path)
 
-        assert result is False
+        assert result.success
+        clone_args, sparse_args = (c[0][0] for c in mock_run.call_args_list)
+        assert "--sparse" in clone_args
+        assert sparse_args == ["git", "sparse-checkout", "set", "--no-cone", "models/**"]
+        assert mock_run.call_args_list[1].kwargs["cwd"] == tmp_path / "dbt"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestCloneOrPullRepoWithGit:
+    @staticmethod
+    def _commit(work: Path, message: str) -> None:
+        (work / "README.md").write_text(message)
+        subprocess.run(["git", "add", "."], cwd=work, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=nao", "-c", "user.email=nao@example.com", "commit", "-qm", message],
+            cwd=work,
+            check=True,
+        )
+        subprocess.run(["git", "push", "-q", "origin", "HEAD"], cwd=work, check=True, capture_output=True)
+
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_clone_unchanged_then_updated(self, mock_console, tmp_path: Path):
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+        work = tmp_path / "work"
+        subprocess.run(["git", "clone", "-q", str(remote), str(work)], check=True, capture_output=True)
+        self._commit(work, "first")
+
+        repos = tmp_path / "repos"
+        repo = RepoConfig(name="docs", url=str(remote))
+
+        assert clone_or_pull_repo(repo, repos).status == "cloned"
+        assert clone_or_pull_repo(repo, repos).status == "unchanged"
+
+        self._commit(work, "second")
+
+        assert clone_or_pull_repo(repo, repos).status == "updated"
+        assert (repos / "docs" / "README.md").read_text() == "second"
+
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_sparse_paths_change_applies_on_unchanged_remote(self, mock_console, tmp_path: Path):
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+        work = tmp_path / "work"
+        subprocess.run(["git", "clone", "-q", str(remote), str(work)], check=True, capture_output=True)
+        (work / "models").mkdir()
+        (work / "models" / "orders.sql").write_text("select 1")
+        self._commit(work, "first")
+
+        repos = tmp_path / "repos"
+        assert clone_or_pull_repo(RepoConfig(name="dbt", url=str(remote)), repos).status == "cloned"
+
+        sparse = RepoConfig(name="dbt", url=str(remote), sparse_paths=["models/"])
+        assert clone_or_pull_repo(sparse, repos).status == "updated"
+        assert (repos / "dbt" / "models" / "orders.sql").exists()
+        assert not (repos / "dbt" / "README.md").exists()
+        assert clone_or_pull_repo(sparse, repos).status == "unchanged"
+
+        assert clone_or_pull_repo(RepoConfig(name="dbt", url=str(remote)), repos).status == "updated"
+        assert (repos / "dbt" / "README.md").exists()
+
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_shallow_clone_switches_to_new_branch(self, mock_console, tmp_path: Path):
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+        work = tmp_path / "work"
+        subprocess.run(["git", "clone", "-q", str(remote), str(work)], check=True, capture_output=True)
+        self._commit(work, "first")
+        subprocess.run(["git", "checkout", "-qb", "feature"], cwd=work, check=True)
+        self._commit(work, "on feature")
+
+        repos = tmp_path / "repos"
+        # file:// so the local clone is really shallow and single-branch
+        url = f"file://{remote}"
+        assert clone_or_pull_repo(RepoConfig(name="docs", url=url, depth=1), repos).status == "cloned"
+        assert (repos / "docs" / "README.md").read_text() == "first"
+
+        feature = RepoConfig(name="docs", url=url, depth=1, branch="feature")
+        result = clone_or_pull_repo(feature, repos)
+
+        assert result.status == "updated", result.error
+        assert (repos / "docs" / "README.md").read_text() == "on feature"
+        assert clone_or_pull_repo(feature, repos).status == "unchanged"
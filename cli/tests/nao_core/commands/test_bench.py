@@ -0,0 +1,88 @@
+import json
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from nao_core.commands.bench import bench, benchmark_database, percentile
+from nao_core.config.databases import DuckDBConfig
+
+
+@pytest.fixture
+def duckdb_path(tmp_path):
+    path = tmp_path / "shop.duckdb"
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE TABLE orders AS SELECT range AS id, range * 2 AS amount FROM range(100)")
+    conn.execute("CREATE TABLE customers AS SELECT range AS id FROM range(10)")
+    conn.close()
+    return path
+
+
+class TestPercentile:
+    def test_interpolates_between_ranks(self):
+        samples = [4.0, 1.0, 3.0, 2.0, 5.0]
+
+        assert percentile(samples, 50) == 3.0
+        assert percentile(samples, 95) == pytest.approx(4.8)
+        assert percentile([], 50) is None
+
+
+class TestBenchmarkDatabase:
+    def test_measures_every_operation(self, duckdb_path):
+        config = DuckDBConfig(name="shop", path=str(duckdb_path), accessors=["columns", "preview"])
+
+        result = benchmark_database(config, iterations=2, concurrency=[1, 2], queries=["SELECT count(*) FROM orders"])
+
+        operations = [(m.operation, m.concurrency) for m in result.measurements]
+        assert operations[:4] == [("connect", 1), ("list_tables", 1), ("accessor:columns", 1), ("accessor:preview", 1)]
+        for level in (1, 2):
+            for probe in ("ping", "preview", "custom-1"):
+                assert (f"query:{probe}", level) in operations
+        assert result.tables == ["main.customers", "main.orders"]
+        assert all(m.errors == 0 for m in result.measurements), [m.last_error for m in result.measurements]
+
+        query = next(m for m in result.measurements if m.operation == "query:ping" and m.concurrency == 2)
+        assert len(query.samples) == 4  # two workers, two iterations each
+        assert query.throughput is not None
+
+    def test_connection_failure_is_reported(self):
+        config = DuckDBConfig(name="shop", path=":memory:")
+        with patch.object(DuckDBConfig, "connect", side_effect=Exception("Connection refused")):
+            result = benchmark_database(config, iterations=2)
+
+        assert result.error == "Connection refused"
+        assert [m.operation for m in result.measurements] == ["connect"]
+
+    def test_failure_after_measured_connects_is_reported(self):
+        config = DuckDBConfig(name="shop", path=":memory:")
+        connect = DuckDBConfig.connect
+        with patch.object(
+            DuckDBConfig, "connect", autospec=True, side_effect=[connect(config), Exception("Too many connections")]
+        ):
+            result = benchmark_database(config, iterations=1)
+
+        assert result.error == "Too many connections"
+        assert [m.operation for m in result.measurements] == ["connect"]
+
+
+class TestBenchCommand:
+    def test_writes_json_report(self, create_config, duckdb_path, tmp_path):
+        create_config(f"""\
+project_name: test-project
+databases:
+  - name: shop
+    type: duckdb
+    path: {duckdb_path}
+""")
+
+        with patch("nao_core.commands.bench.console"):
+            bench(iterations=1, concurrency=[1])
+
+        [report] = (tmp_path / ".nao" / "benchmarks").glob("bench-*.json")
+        data = json.loads(report.read_text())
+        assert data["concurrency"] == [1]
+        [database] = data["databases"]
+        assert database["database"] == "shop"
+        connect = database["measurements"][0]
+        assert connect["operation"] == "connect"
+        assert connect["p50"] is not None and connect["p95"] is not None
@@ -1,9 +1,10 @@
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from nao_core.commands.debug import check_llm_connection, debug
-from nao_core.config.databases import BigQueryConfig, DuckDBConfig, PostgresConfig
+from nao_core.config.databases import BigQueryConfig, ConnectionDiagnostics, DuckDBConfig, PostgresConfig
 from nao_core.config.llm import LLMConfig, LLMProvider
 
 
@@ -191,6 +192,29 @@ class TestDatabaseConnection:
         assert "Connection refused" in message
 
 
+class TestDiagnose:
+    """Tests for the diagnose method on database configs."""
+
+    def test_duckdb_diagnose_reports_latencies_and_version(self):
+        config = DuckDBConfig(name="test", path=":memory:")
+
+        diagnostics = config.diagnose()
+
+        assert diagnostics.success is True
+        assert diagnostics.connect_seconds is not None
+        assert diagnostics.query_seconds is not None
+        assert diagnostics.server_version
+
+    def test_diagnose_failure(self):
+        config = DuckDBConfig(name="test", path=":memory:")
+        with patch.object(DuckDBConfig, "connect", side_effect=Exception("Connection refused")):
+            diagnostics = config.diagnose()
+
+        assert diagnostics.success is False
+        assert diagnostics.message == "Connection refused"
+        assert diagnostics.query_seconds is None
+
+
 @pytest.mark.usefixtures("clean_env")
 class TestDebugCommand:
     """Tests for the debug() command."""
@@ -219,8 +243,8 @@ databases:
 """)
 
         with patch(
-            "nao_core.config.databases.postgres.PostgresConfig.check_connection",
-            return_value=(True, "Connected (5 tables found)"),
+            "nao_core.config.databases.postgres.PostgresConfig.diagnose",
+            return_value=ConnectionDiagnostics(success=True, message="Connected successfully", connect_seconds=0.01),
         ):
             with patch("nao_core.commands.debug.console") as mock_console:
                 debug()
@@ -247,8 +271,8 @@ databases:
 """)
 
         with patch(
-            "nao_core.config.databases.postgres.PostgresConfig.check_connection",
-            return_value=(False, "Failed DB connection"),
+            "nao_core.config.databases.postgres.PostgresConfig.diagnose",
+            return_value=ConnectionDiagnostics(success=False, message="Failed DB connection"),
         ) as mock_check:
             with patch("nao_core.commands.debug.console") as mock_console:
                 debug()
@@ -309,3 +333,38 @@ llm:
         assert any("[bold red]✗[/bold red]" in call for call in calls)
 
         mock_check.assert_called_once()
+
+    def test_debug_checks_run_concurrently_with_timeout(self, create_config):
+        """A hanging database is reported as timed out without delaying the others."""
+        create_config("""\
+project_name: test-project
+databases:
+  - name: slow_db
+    type: postgres
+    host: localhost
+    port: 5432
+    database: testdb
+    user: testuser
+    password: pass
+llm:
+  provider: anthropic
+  api_key: sk-test-key
+""")
+
+        def slow_diagnose(self):
+            time.sleep(5)
+
+        with (
+            patch("nao_core.config.databases.postgres.PostgresConfig.diagnose", slow_diagnose),
+            patch("nao_core.commands.debug.check_llm_connection", return_value=(True, "Connected")) as mock_check,
+            patch("nao_core.commands.debug.console") as mock_console,
+        ):
+            start = time.perf_counter()
+            debug(timeout=0.2)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 2
+        mock_check.assert_called_once()
+        calls = [str(call) for call in mock_console.print.call_args_list]
+        assert any("[bold red]✗[/bold red] [cyan]slow_db[/cyan]" in call for call in calls)
+        assert any("[bold green]✓[/bold green] [cyan]anthropic[/cyan]" in call for call in calls)
@@ -0,0 +1,141 @@
+import fnmatch
+from unittest.mock import MagicMock
+
+import pytest
+
+from nao_core.config.databases.bigquery import BigQueryConfig
+from nao_core.config.databases.duckdb import DuckDBConfig
+from nao_core.config.databases.patterns import PatternMatcher, glob_to_like
+from nao_core.config.databases.postgres import PostgresConfig
+from nao_core.config.databases.snowflake import SnowflakeConfig
+
+INCLUDE = ["analytics.dim_*", "prod_*.*"]
+EXCLUDE = ["*.backup_*", "prod_tmp.*"]
+
+
+@pytest.mark.parametrize(
+    "schema,table",
+    [
+        ("analytics", "dim_users"),
+        ("analytics", "fct_orders"),
+        ("prod_sales", "orders"),
+        ("prod_sales", "backup_orders"),
+        ("prod_tmp", "orders"),
+        ("staging", "dim_users"),
+    ],
+)
+def test_matches_agrees_with_fnmatch(schema, table):
+    """Test that the compiled matcher gives the same answer as per-pattern fnmatch."""
+    full_name = f"{schema}.{table}"
+    expected = any(fnmatch.fnmatchcase(full_name, p) for p in INCLUDE) and not any(
+        fnmatch.fnmatchcase(full_name, p) for p in EXCLUDE
+    )
+
+    assert PatternMatcher(INCLUDE, EXCLUDE).matches(schema, table) is expected
+
+
+def test_no_patterns_matches_everything():
+    matcher = PatternMatcher([], [])
+    assert matcher.matches("any", "table")
+    assert matcher.schema_matches("any")
+
+
+def test_schema_matches_prunes_unreachable_schemas():
+    matcher = PatternMatcher(INCLUDE, EXCLUDE)
+
+    assert matcher.schema_matches("analytics")
+    assert matcher.schema_matches("prod_sales")
+    assert not matcher.schema_matches("staging")
+    assert not matcher.schema_matches("prod_tmp")
+
+
+def test_include_without_dot_does_not_prune_schemas():
+    matcher = PatternMatcher(["*_users"], [])
+
+    assert matcher.schema_matches("staging")
+
+
+def test_case_insensitive_matching():
+    matcher = PatternMatcher(["analytics.dim_*"], [], case_sensitive=False)
+
+    assert matcher.matches("ANALYTICS", "DIM_USERS")
+    assert matcher.schema_matches("ANALYTICS")
+    assert not PatternMatcher(["analytics.dim_*"], []).matches("ANALYTICS", "DIM_USERS")
+
+
+def test_config_recompiles_when_patterns_change():
+    """Test that a copied config with new patterns does not reuse a stale matcher."""
+    config = DuckDBConfig(name="db", include=["main.*"])
+    assert config.matches_pattern("main", "users")
+
+    copied = config.model_copy(update={"include": ["other.*"]})
+
+    assert not copied.matches_pattern("main", "users")
+    assert config.pattern_matcher() is config.pattern_matcher()
+
+
+def test_snowflake_patterns_are_case_insensitive():
+    config = SnowflakeConfig(
+        name="sf", username="u", account_id="a", database="DB", include=["public.*"], exclude=["public.tmp_*"]
+    )
+
+    assert config.matches_pattern("PUBLIC", "USERS")
+    assert not config.matches_pattern("PUBLIC", "TMP_USERS")
+    assert not config.schema_matches("STAGING")
+
+
+@pytest.mark.parametrize(
+    "glob,like",
+    [
+        ("analytics_*", "analytics!_%"),
+        ("prod?", "prod_"),
+        ("100%!", "100!%!!"),
+        ("[ab]*", None),
+    ],
+)
+def test_glob_to_like(glob, like):
+    assert glob_to_like(glob) == like
+
+
+def test_schema_like_patterns():
+    assert PatternMatcher(["analytics_*.*", "sales.orders"], []).schema_like_patterns() == ["analytics!_%", "sales"]
+    assert PatternMatcher(["analytics_*.*", "*_users"], []).schema_like_patterns() is None
+    assert PatternMatcher([], ["tmp.*"]).schema_like_patterns() is None
+
+
+def test_schema_filter_sql():
+    config = DuckDBConfig(name="db", include=["analytics_*.*", "o'brien.*"])
+
+    assert config.schema_filter_sql("nspname") == (
+        "(nspname LIKE 'analytics!_%' ESCAPE '!' OR nspname LIKE 'o''brien' ESCAPE '!')"
+    )
+    assert DuckDBConfig(name="db").schema_filter_sql("nspname") == ""
+
+
+def test_postgres_get_schemas_pushes_filter_down():
+    config = PostgresConfig(name="pg", host="h", database="d", user="u", password="p", include=["analytics_*.*"])
+    conn = MagicMock()
+    conn.raw_sql.return_value.fetchall.return_value = [("analytics_eu",), ("analytics-us",)]
+
+    schemas = config.get_schemas(conn)
+
+    assert "LIKE 'analytics!_%' ESCAPE '!'" in conn.raw_sql.call_args.args[0]
+    assert schemas == ["analytics_eu"]
+    conn.list_databases.assert_not_called()
+
+
+def test_postgres_get_schemas_falls_back_to_listing():
+    config = PostgresConfig(name="pg", host="h", database="d", user="u", password="p", include=["analytics_*.*"])
+    conn = MagicMock()
+    conn.raw_sql.side_effect = RuntimeError("permission denied")
+    conn.list_databases.return_value = ["analytics_eu", "pg_toast", "staging"]
+
+    assert config.get_schemas(conn) == ["analytics_eu"]
+
+
+def test_bigquery_get_schemas_filters_datasets():
+    config = BigQueryConfig(name="bq", project_id="p", include=["analytics_*.*"])
+    conn = MagicMock()
+    conn.list_databases.return_value = ["analytics_eu", "raw", "analytics_us"]
+
+    assert config.get_schemas(conn) == ["analytics_eu", "analytics_us"]
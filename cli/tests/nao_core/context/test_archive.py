@@ -0,0 +1,168 @@
+"""Unit tests for the archive context provider."""
+
+import gzip
+import hashlib
+import io
+import tarfile
+import threading
+from collections.abc import Iterator
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import zstandard
+
+from nao_core.context.archive import ArchiveContextProvider, extract_archive
+
+
+def _build_archive(path: Path, files: dict[str, str], mtime: int = 1_700_000_000) -> str:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(data))
+    if path.name.endswith(".zst"):
+        path.write_bytes(zstandard.ZstdCompressor().compress(buffer.getvalue()))
+    else:
+        path.write_bytes(gzip.compress(buffer.getvalue()))
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class _ETagHandler(SimpleHTTPRequestHandler):
+    """Serves files with a content-hash ETag and answers 304 when it matches."""
+
+    requests: list[str] = []
+
+    def do_GET(self) -> None:
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            self.send_error(404)
+            return
+        etag = f'"{hashlib.sha256(path.read_bytes()).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.requests.append("304")
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.requests.append("200")
+        data = path.read_bytes()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[str]:
+    served = tmp_path / "served"
+    served.mkdir()
+    _ETagHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), partial(_ETagHandler, directory=str(served)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def quiet_console():
+    with patch("nao_core.context.archive.console"):
+        yield
+
+
+class TestArchiveContextProvider:
+    def test_local_archive_extracts_and_skips_unchanged(self, tmp_path: Path):
+        archive = tmp_path / "context.tar.gz"
+        digest = _build_archive(archive, {"nao_config.yaml": "project_name: shop\n", "docs/a.md": "a"})
+        provider = ArchiveContextProvider(str(archive), tmp_path / "context", gc_grace_seconds=0)
+
+        provider.init()
+
+        assert provider.current_revision() == digest
+        assert (provider.target_path / "docs" / "a.md").read_text() == "a"
+        assert (provider.target_path / "docs" / "a.md").stat().st_mtime == 1_700_000_000
+
+        with patch.object(ArchiveContextProvider, "_extract") as extract:
+            assert provider.refresh() is False
+        extract.assert_not_called()
+
+        new_digest = _build_archive(archive, {"nao_config.yaml": "project_name: shop\n", "docs/a.md": "b"})
+        assert provider.refresh() is True
+        assert provider.current_revision() == new_digest
+        assert (provider.target_path / "docs" / "a.md").read_text() == "b"
+        assert {p.name for p in provider.revisions_dir.iterdir()} == {"archive.json", new_digest}
+
+    def test_local_zstd_archive_is_extracted(self, tmp_path: Path):
+        archive = tmp_path / "context.tar.zst"
+        digest = _build_archive(archive, {"nao_config.yaml": "project_name: shop\n", "docs/a.md": "a"})
+        provider = ArchiveContextProvider(str(archive), tmp_path / "context")
+
+        provider.init()
+
+        assert provider.current_revision() == digest
+        assert (provider.target_path / "nao_config.yaml").read_text() == "project_name: shop\n"
+        assert (provider.target_path / "docs" / "a.md").read_text() == "a"
+
+    def test_checksum_mismatch_keeps_current_revision(self, tmp_path: Path):
+        archive = tmp_path / "context.tar.gz"
+        _build_archive(archive, {"nao_config.yaml": "project_name: shop\n"})
+        provider = ArchiveContextProvider(str(archive), tmp_path / "context")
+        provider.init()
+        current = provider.current_revision()
+
+        _build_archive(archive, {"nao_config.yaml": "project_name: tampered\n"})
+        provider.sha256 = "0" * 64
+
+        with pytest.raises(ValueError, match="checksum mismatch"):
+            provider.refresh()
+        assert provider.current_revision() == current
+        assert not any(p.name.startswith(".extract-") for p in provider.revisions_dir.iterdir())
+
+    def test_http_checksum_file_avoids_download(self, tmp_path: Path, server: str):
+        served = tmp_path / "served"
+        digest = _build_archive(served / "context.tar.gz", {"nao_config.yaml": "project_name: shop\n"})
+        (served / "context.tar.gz.sha256").write_text(f"{digest}  context.tar.gz\n")
+        provider = ArchiveContextProvider(f"{server}/context.tar.gz", tmp_path / "context")
+
+        provider.init()
+        assert provider.refresh() is False
+
+        assert provider.current_revision() == digest
+        assert _ETagHandler.requests.count("200") == 3  # two checksum fetches and one archive
+
+    def test_http_etag_is_used_without_checksum_file(self, tmp_path: Path, server: str):
+        served = tmp_path / "served"
+        _build_archive(served / "context.tar.gz", {"nao_config.yaml": "project_name: shop\n"})
+        provider = ArchiveContextProvider(f"{server}/context.tar.gz", tmp_path / "context")
+
+        provider.init()
+        assert provider.refresh() is False
+        _build_archive(served / "context.tar.gz", {"nao_config.yaml": "project_name: shop\n", "a.md": "a"})
+        assert provider.refresh() is True
+
+        assert _ETagHandler.requests == ["200", "304", "200"]
+        assert (provider.target_path / "a.md").read_text() == "a"
+
+
+class TestExtractArchive:
+    def test_members_escaping_destination_are_skipped(self, tmp_path: Path):
+        archive = tmp_path / "evil.tar.gz"
+        _build_archive(archive, {"../escaped.md": "x", "/abs.md": "y", "ok.md": "z"})
+        destination = tmp_path / "out"
+        destination.mkdir()
+
+        with open(archive, "rb") as f:
+            count = extract_archive(f, destination)
+
+        assert count == 1
+        assert not (tmp_path / "escaped.md").exists()
+        assert [p.name for p in destination.iterdir()] == ["ok.md"]
@@ -0,0 +1,123 @@
+"""Unit tests for the git context provider's revision swaps."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nao_core.context.git import GitContextProvider
+
+
+def _commit(work: Path, content: str) -> None:
+    (work / "nao_config.yaml").write_text(f"project_name: {content}\n")
+    subprocess.run(["git", "add", "."], cwd=work, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=nao", "-c", "user.email=nao@example.com", "commit", "-qm", content],
+        cwd=work,
+        check=True,
+    )
+    subprocess.run(["git", "push", "-q", "origin", "HEAD:main"], cwd=work, check=True, capture_output=True)
+
+
+@pytest.fixture
+def work(tmp_path: Path) -> Path:
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    work = tmp_path / "work"
+    subprocess.run(["git", "clone", "-q", str(remote), str(work)], check=True, capture_output=True)
+    _commit(work, "first")
+    return work
+
+
+@pytest.fixture
+def provider(tmp_path: Path, work: Path):
+    with patch("nao_core.context.git.console"):
+        yield GitContextProvider(f"file://{tmp_path / 'remote.git'}", tmp_path / "context", gc_grace_seconds=0)
+
+
+class TestGitContextProvider:
+    def test_init_exposes_revision_through_symlink(self, provider: GitContextProvider):
+        provider.init()
+
+        assert provider.target_path.is_symlink()
+        assert provider.is_initialized()
+        assert (provider.target_path / "nao_config.yaml").read_text() == "project_name: first\n"
+
+    def test_refresh_swaps_to_new_revision(self, provider: GitContextProvider, work: Path):
+        provider.init()
+        first = provider.target_path.resolve()
+
+        assert provider.refresh() is False
+        assert provider.target_path.resolve() == first
+
+        _commit(work, "second")
+
+        assert provider.refresh() is True
+        assert provider.target_path.resolve() != first
+        assert (provider.target_path / "nao_config.yaml").read_text() == "project_name: second\n"
+
+    def test_refresh_skips_fetch_when_remote_unchanged(self, provider: GitContextProvider):
+        provider.init()
+
+        with patch.object(GitContextProvider, "_fetch") as fetch:
+            assert provider.refresh() is False
+
+        fetch.assert_not_called()
+
+    def test_refresh_reports_changed_paths(self, provider: GitContextProvider, work: Path):
+        (work / "docs").mkdir()
+        (work / "docs" / "old.md").write_text("old")
+        _commit(work, "first")
+        provider.init()
+        (provider.target_path / ".nao").mkdir()
+        (provider.target_path / ".nao" / "state").write_text("kept")
+
+        (work / "docs" / "old.md").unlink()
+        (work / "docs" / "new.md").write_text("new")
+        _commit(work, "second")
+
+        assert provider.refresh() is True
+        assert sorted(provider.last_changed_paths or []) == ["docs/new.md", "docs/old.md", "nao_config.yaml"]
+        assert (provider.target_path / ".nao" / "state").read_text() == "kept"
+
+    def test_reader_keeps_old_revision_during_grace_period(self, provider: GitContextProvider, work: Path):
+        provider.gc_grace_seconds = 3600
+        provider.init()
+        reader_root = provider.target_path.resolve()
+
+        _commit(work, "second")
+        provider.refresh()
+
+        assert (reader_root / "nao_config.yaml").read_text() == "project_name: first\n"
+        assert provider.gc() == 0
+
+        provider.gc_grace_seconds = 0
+        assert provider.gc() == 1
+        assert not reader_root.exists()
+        assert (provider.target_path / "nao_config.yaml").read_text() == "project_name: second\n"
+
+    def test_legacy_clone_is_replaced(self, provider: GitContextProvider):
+        subprocess.run(
+            ["git", "clone", "-q", "--branch", "main", provider.repo_url, str(provider.target_path)],
+            check=True,
+            capture_output=True,
+        )
+        assert provider.current_revision() is None
+
+        provider.init()
+
+        assert provider.target_path.is_symlink()
+        assert (provider.target_path / "nao_config.yaml").read_text() == "project_name: first\n"
+        assert not any(p.name.startswith("legacy-") for p in provider.revisions_dir.iterdir())
+
+    def test_failed_fetch_keeps_current_revision(self, provider: GitContextProvider):
+        provider.init()
+        current = os.readlink(provider.target_path)
+        provider.repo_url = "file:///nonexistent/repo.git"
+
+        with pytest.raises(subprocess.CalledProcessError):
+            provider.refresh()
+
+        assert os.readlink(provider.target_path) == current
@@ -0,0 +1,73 @@
+"""Unit tests for the single-flight context refresh coordinator."""
+
+import asyncio
+import threading
+
+import pytest
+
+from nao_core.context.refresh import RefreshCoordinator
+
+
+class TestRefreshCoordinator:
+    def test_refresh_runs_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+
+        def refresh() -> bool:
+            threads.append(threading.get_ident())
+            return True
+
+        coordinator = RefreshCoordinator(refresh)
+
+        assert asyncio.run(coordinator.run()) is True
+        assert threads and threads[0] != loop_thread
+        assert coordinator.status.last_outcome == "updated"
+        assert coordinator.status.last_duration_seconds is not None
+
+    def test_concurrent_calls_share_one_follow_up_run(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[int] = []
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def refresh() -> bool:
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+                calls.append(len(calls))
+            started.set()
+            release.wait(5)
+            with lock:
+                active -= 1
+            return False
+
+        coordinator = RefreshCoordinator(refresh)
+
+        async def scenario() -> list[bool]:
+            first = asyncio.ensure_future(coordinator.run())
+            await asyncio.to_thread(started.wait, 5)
+            others = [asyncio.ensure_future(coordinator.run()) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(first, *others)
+
+        assert asyncio.run(scenario()) == [False] * 6
+        assert len(calls) == 2
+        assert max_active == 1
+        assert coordinator.status.coalesced == 4
+        assert coordinator.status.runs == 2
+
+    def test_failure_is_reported_and_raised(self):
+        def refresh() -> bool:
+            raise RuntimeError("fetch failed")
+
+        coordinator = RefreshCoordinator(refresh)
+
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            asyncio.run(coordinator.run())
+        assert coordinator.status.last_outcome == "failed"
+        assert coordinator.status.last_error == "fetch failed"
+        assert coordinator.status.running is False
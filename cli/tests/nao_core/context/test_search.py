@@ -0,0 +1,104 @@
+"""Unit tests for the context full-text search index."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from nao_core.context.search import INDEX_DIR, ContextSearchIndex, update_search_index
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    columns = tmp_path / "databases" / "type=duckdb" / "database=shop" / "schema=main" / "table=orders"
+    columns.mkdir(parents=True)
+    (columns / "columns.md").write_text("# orders\n\n- customer_id (int64)\n- amount (float64)\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "revenue.md").write_text("Revenue is the sum of order amount, net of refunds.\n")
+    return tmp_path
+
+
+def _touch(path: Path, content: str) -> None:
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestContextSearchIndex:
+    def test_search_matches_all_terms(self, project: Path):
+        update_search_index(project)
+
+        with ContextSearchIndex(project) as index:
+            assert {h.path for h in index.search("amount")} == {
+                "databases/type=duckdb/database=shop/schema=main/table=orders/columns.md",
+                "docs/revenue.md",
+            }
+            hits = index.search("amount refunds")
+
+        assert [h.path for h in hits] == ["docs/revenue.md"]
+        assert "**refunds**" in hits[0].snippet
+
+    def test_path_prefix_filters_results(self, project: Path):
+        update_search_index(project)
+
+        with ContextSearchIndex(project) as index:
+            hits = index.search("amount", path_prefix="docs/")
+
+        assert [h.path for h in hits] == ["docs/revenue.md"]
+
+    def test_update_only_reindexes_changed_files(self, project: Path):
+        first = update_search_index(project)
+        second = update_search_index(project)
+
+        _touch(project / "docs" / "revenue.md", "Revenue excludes taxes.\n")
+        (project / "docs" / "churn.md").write_text("Churn is computed monthly.\n")
+        third = update_search_index(project)
+
+        assert (first.added, first.unchanged) == (2, 0)
+        assert (second.changed, second.unchanged) == (0, 2)
+        assert (third.added, third.updated, third.unchanged) == (1, 1, 1)
+        with ContextSearchIndex(project) as index:
+            assert index.search("refunds") == []
+            assert [h.path for h in index.search("taxes")] == ["docs/revenue.md"]
+
+    def test_update_with_changed_paths_trusts_other_files(self, project: Path):
+        update_search_index(project)
+        columns = next(project.glob("databases/**/columns.md"))
+        _touch(columns, columns.read_text())
+        _touch(project / "docs" / "revenue.md", "Revenue excludes taxes.\n")
+
+        stats = update_search_index(project, changed_paths=["docs/revenue.md"])
+        after = update_search_index(project)
+
+        assert (stats.updated, stats.unchanged) == (1, 1)
+        assert after.changed == 0
+        with ContextSearchIndex(project) as index:
+            assert [h.path for h in index.search("taxes")] == ["docs/revenue.md"]
+
+    def test_removed_files_are_dropped(self, project: Path):
+        update_search_index(project)
+        (project / "docs" / "revenue.md").unlink()
+
+        stats = update_search_index(project)
+
+        assert stats.removed == 1
+        with ContextSearchIndex(project) as index:
+            assert index.search("revenue") == []
+
+    def test_respects_naoignore_and_state_dir(self, project: Path):
+        (project / ".naoignore").write_text("# comment\ndocs/\n")
+        (project / INDEX_DIR / "notes.md").parent.mkdir(parents=True, exist_ok=True)
+        (project / INDEX_DIR / "notes.md").write_text("amount\n")
+
+        update_search_index(project)
+
+        with ContextSearchIndex(project) as index:
+            paths = [h.path for h in index.search("amount")]
+        assert paths == ["databases/type=duckdb/database=shop/schema=main/table=orders/columns.md"]
+
+    def test_query_syntax_is_escaped(self, project: Path):
+        update_search_index(project)
+
+        with ContextSearchIndex(project) as index:
+            assert index.search('customer_id" OR (') == []
+            assert index.search("   ") == []
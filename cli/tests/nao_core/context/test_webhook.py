@@ -0,0 +1,83 @@
+"""Unit tests for push webhook verification, parsing and debouncing."""
+
+import asyncio
+import hashlib
+import hmac
+
+from nao_core.context.webhook import Debouncer, parse_push_event, verify_signature
+
+BODY = b'{"ref": "refs/heads/main"}'
+
+
+class TestVerifySignature:
+    def test_github_signature(self):
+        signature = "sha256=" + hmac.new(b"s3cret", BODY, hashlib.sha256).hexdigest()
+
+        assert verify_signature("s3cret", BODY, {"x-hub-signature-256": signature})
+        assert not verify_signature("other", BODY, {"x-hub-signature-256": signature})
+        assert not verify_signature("s3cret", BODY + b" ", {"x-hub-signature-256": signature})
+
+    def test_gitlab_token(self):
+        assert verify_signature("s3cret", BODY, {"x-gitlab-token": "s3cret"})
+        assert not verify_signature("s3cret", BODY, {"x-gitlab-token": "wrong"})
+
+    def test_unsigned_request_is_rejected(self):
+        assert not verify_signature("s3cret", BODY, {})
+
+
+class TestParsePushEvent:
+    def test_branch_and_paths(self):
+        event = parse_push_event(
+            {
+                "ref": "refs/heads/main",
+                "commits": [
+                    {"added": ["docs/a.md"], "modified": ["RULES.md"], "removed": []},
+                    {"added": [], "modified": ["RULES.md"], "removed": ["docs/b.md"]},
+                ],
+            }
+        )
+
+        assert event is not None
+        assert event.branch == "main"
+        assert event.paths == {"docs/a.md", "RULES.md", "docs/b.md"}
+
+    def test_tag_push_and_ping_are_ignored(self):
+        assert parse_push_event({"ref": "refs/tags/v1"}) is None
+        assert parse_push_event({"zen": "Keep it logically awesome."}) is None
+        assert parse_push_event([]) is None
+
+
+class TestDebouncer:
+    def test_burst_runs_action_once(self):
+        calls: list[float] = []
+
+        async def action() -> None:
+            calls.append(asyncio.get_running_loop().time())
+
+        async def scenario() -> None:
+            debouncer = Debouncer(action, delay=0.05)
+            for _ in range(5):
+                debouncer.trigger()
+                await asyncio.sleep(0.01)
+            assert debouncer.pending
+            await asyncio.sleep(0.15)
+            assert not debouncer.pending
+
+        asyncio.run(scenario())
+        assert len(calls) == 1
+
+    def test_max_delay_bounds_postponing(self):
+        calls: list[float] = []
+
+        async def action() -> None:
+            calls.append(asyncio.get_running_loop().time())
+
+        async def scenario() -> None:
+            debouncer = Debouncer(action, delay=0.05, max_delay=0.1)
+            for _ in range(10):
+                debouncer.trigger()
+                await asyncio.sleep(0.03)
+            await asyncio.sleep(0.1)
+
+        asyncio.run(scenario())
+        assert len(calls) >= 2
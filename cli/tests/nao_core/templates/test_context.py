@@ -0,0 +1,85 @@
+"""Unit tests for the `nao.database(...)` template accessor."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from nao_core.config.base import NaoConfig
+from nao_core.config.databases.duckdb import DuckDBConfig
+from nao_core.templates.context import QUERY_CACHE_DIR, create_nao_context
+from nao_core.templates.render import render_all_templates
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> tuple[Path, NaoConfig]:
+    db_file = tmp_path / "shop.duckdb"
+    with duckdb.connect(str(db_file)) as conn:
+        conn.execute("CREATE TABLE orders (id INTEGER, amount DECIMAL(10, 2), placed_on DATE)")
+        conn.execute("INSERT INTO orders VALUES (1, 9.99, '2026-01-01'), (2, 20.00, '2026-01-02')")
+
+    config = NaoConfig(project_name="shop", databases=[DuckDBConfig(name="shop", path=str(db_file))])
+    return tmp_path, config
+
+
+class TestTemplateDatabase:
+    def test_query_returns_json_friendly_rows(self, project):
+        project_path, config = project
+        nao = create_nao_context(config, project_path)
+
+        rows = nao.database("shop").query("SELECT * FROM orders ORDER BY id")
+        nao.close()
+
+        assert rows[0]["id"] == 1
+        assert rows[0]["amount"] == 9.99
+        assert rows[0]["placed_on"] == "2026-01-01 00:00:00"
+
+    def test_table_exposes_sync_context(self, project):
+        project_path, config = project
+        nao = create_nao_context(config, project_path)
+
+        table = nao.database("shop").table("main", "orders")
+
+        assert table.row_count() == 2
+        assert [c["name"] for c in table.columns()] == ["id", "amount", "placed_on"]
+        nao.close()
+
+    def test_unknown_database_raises(self, project):
+        project_path, config = project
+
+        with pytest.raises(ValueError, match="No database named 'missing'"):
+            create_nao_context(config, project_path).database("missing")
+
+    def test_render_pass_shares_connection_and_results(self, project):
+        project_path, config = project
+        for name in ("a", "b"):
+            (project_path / f"{name}.md.j2").write_text(
+                "{{ nao.database('shop').query('SELECT count(*) AS n FROM orders')[0].n }}"
+            )
+
+        with patch.object(DuckDBConfig, "execute_sql", autospec=True, wraps=DuckDBConfig.execute_sql) as execute:
+            with patch.object(DuckDBConfig, "connect", autospec=True, wraps=DuckDBConfig.connect) as connect:
+                result = render_all_templates(project_path, config)
+
+        assert result.templates_rendered == 2
+        assert (project_path / "a.md").read_text() == "2"
+        assert execute.call_count == 1
+        assert connect.call_count == 1
+
+    def test_query_ttl_caches_on_disk_across_passes(self, project):
+        project_path, config = project
+        sql = "SELECT count(*) AS n FROM orders"
+
+        first = create_nao_context(config, project_path)
+        assert first.database("shop").query(sql, ttl=60) == [{"n": 2}]
+        first.close()
+
+        second = create_nao_context(config, project_path)
+        with patch.object(DuckDBConfig, "execute_sql") as execute:
+            assert second.database("shop").query(sql, ttl=60) == [{"n": 2}]
+            assert second.database("shop").query(sql, ttl=0) == [{"n": 2}]
+        second.close()
+
+        execute.assert_not_called()
+        assert len(list((project_path / QUERY_CACHE_DIR).glob("*.json"))) == 1
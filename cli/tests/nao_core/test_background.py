@@ -0,0 +1,92 @@
+"""Unit tests for the background update check and telemetry flush."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nao_core import background, tracking, version
+
+
+@pytest.fixture(autouse=True)
+def state_files(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(background, "OFFLINE_FILE", tmp_path / "offline.json")
+    monkeypatch.setattr(version, "CACHE_FILE", tmp_path / "version_check.json")
+    monkeypatch.delenv("NAO_OFFLINE", raising=False)
+
+
+def _wait_for_threads(prefix: str) -> None:
+    for thread in threading.enumerate():
+        if thread.name.startswith(prefix):
+            thread.join(5)
+
+
+class TestCheckForUpdates:
+    def test_stale_cache_is_refreshed_without_blocking(self):
+        fetched = threading.Event()
+
+        def slow_fetch() -> str:
+            time.sleep(0.5)
+            fetched.set()
+            return "99.0.0"
+
+        with patch.object(version, "_fetch_and_cache", side_effect=slow_fetch):
+            start = time.perf_counter()
+            version.check_for_updates()
+            elapsed = time.perf_counter() - start
+
+            assert elapsed < 0.2
+            assert fetched.wait(5)
+
+    def test_stale_version_still_warns(self):
+        version.CACHE_FILE.write_text(json.dumps({"latest": "99.0.0", "checked_at": 0}))
+
+        with patch.object(version, "_fetch_and_cache", return_value="99.0.0"), patch.object(version, "UI") as ui:
+            version.check_for_updates()
+            _wait_for_threads("nao-update-check")
+
+        ui.warn.assert_called_once()
+
+    def test_failed_probe_enables_offline_mode(self):
+        with patch.object(version, "_fetch_and_cache", side_effect=OSError("no route to host")) as fetch:
+            version.check_for_updates()
+            _wait_for_threads("nao-update-check")
+            assert background.is_offline()
+
+            version.check_for_updates()
+            _wait_for_threads("nao-update-check")
+
+        assert fetch.call_count == 1
+
+    def test_offline_env_skips_probe(self, monkeypatch):
+        monkeypatch.setenv("NAO_OFFLINE", "1")
+
+        with patch.object(version, "_fetch_and_cache") as fetch:
+            version.check_for_updates()
+            _wait_for_threads("nao-update-check")
+
+        fetch.assert_not_called()
+
+
+class TestTracking:
+    def test_shutdown_is_bounded_by_deadline(self, monkeypatch):
+        client = MagicMock()
+        client.shutdown.side_effect = lambda: time.sleep(5)
+        monkeypatch.setattr(tracking, "_client", client)
+        monkeypatch.setattr(tracking, "FLUSH_DEADLINE", 0.1)
+
+        start = time.perf_counter()
+        tracking.shutdown_tracking()
+
+        assert time.perf_counter() - start < 1
+        client.shutdown.assert_called_once()
+
+    def test_no_client_while_offline(self, monkeypatch):
+        monkeypatch.setattr(tracking, "_client", None)
+        monkeypatch.setattr(tracking, "MODE", "prod")
+        background.mark_offline()
+
+        assert tracking.get_or_create_posthog_client() is None
@@ -0,0 +1,83 @@
+"""Import-time budget of the `nao` CLI entry point.
+
+Measured with `python -X importtime` in a fresh interpreter. Timings depend on
+the machine, so the budget is only checked when NAO_IMPORT_BUDGET is set, e.g.
+`NAO_IMPORT_BUDGET=1 pytest tests/nao_core/test_import_time.py`. The budget can
+be adjusted with NAO_IMPORT_BUDGET_MS (default 300).
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.environ.get("NAO_IMPORT_BUDGET_MS", "300"))
+
+# Only needed once a command runs (or a database of that type is used)
+HEAVY_MODULES = [
+    "pandas",
+    "ibis",
+    "questionary",
+    "sshtunnel",
+    "cryptography",
+    "notion_client",
+    "posthog",
+    "openai",
+    "nao_core.config",
+]
+
+
+def _import_time_ms(module: str) -> float:
+    """Cumulative import time of a module in a fresh interpreter, in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    pattern = re.compile(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", re.M)
+    match = pattern.search(result.stderr)
+    assert match, result.stderr[-2000:]
+    return int(match.group(1)) / 1000
+
+
+def _loaded_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {code}; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_main_does_not_import_command_dependencies():
+    loaded = _loaded_modules("import nao_core.main")
+
+    assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+
+def test_config_does_not_import_command_dependencies():
+    loaded = _loaded_modules("import nao_core.config")
+
+    assert [m for m in HEAVY_MODULES if m in loaded and m != "nao_core.config"] == []
+
+
+def test_commands_are_imported_on_first_access():
+    loaded = _loaded_modules("from nao_core.commands import upgrade")
+
+    assert "nao_core.commands.upgrade" in loaded
+    assert "nao_core.commands.sync" not in loaded
+
+
+@pytest.mark.skipif(
+    not os.environ.get("NAO_IMPORT_BUDGET"), reason="NAO_IMPORT_BUDGET not set — skipping timing budget"
+)
+@pytest.mark.parametrize("module", ["nao_core.main", "nao_core.config"])
+def test_import_time_budget(module: str):
+    # Best of three to smooth out noise from the machine
+    elapsed = min(_import_time_ms(module) for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET_MS, f"importing {module} took {elapsed:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"